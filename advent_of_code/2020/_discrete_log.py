@@ -0,0 +1,267 @@
+"""Discrete logarithms in the multiplicative group of integers modulo N"""
+
+# Built-in
+from math import gcd, isqrt
+
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+TRIAL_DIVISION_LIMIT = 2**20
+# Miller-Rabin with these bases never fails below 3.3 * 10^24
+WITNESSES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+DETERMINISTIC_LIMIT = 3_317_044_064_679_887_385_961_981
+# Tried on top of the others above the limit, where the test is no longer exact
+EXTRA_WITNESSES = [43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97, 101, 103, 107]
+
+
+# --------------------------------------------------------------------------------
+# > Functions
+# --------------------------------------------------------------------------------
+def is_prime(n):
+    """
+    Miller-Rabin primality test, exact below 3.3 * 10^24
+    Above that, more bases are tried, but the answer is only probable: a composite
+    number could still pass them all
+    :param int n: The number to test
+    :return: Whether the number is prime
+    :rtype: bool
+    """
+    if n < 2:
+        return False
+    for witness in WITNESSES:
+        if n % witness == 0:
+            return n == witness
+    odd, shift = n - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        shift += 1
+    witnesses = WITNESSES if n < DETERMINISTIC_LIMIT else WITNESSES + EXTRA_WITNESSES
+    for witness in witnesses:
+        value = pow(witness, odd, n)
+        if value in (1, n - 1):
+            continue
+        for _ in range(shift - 1):
+            value = value * value % n
+            if value == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def factorize(n, limit=TRIAL_DIVISION_LIMIT):
+    """
+    Factorizes a number by trial division, up to a limit
+    What remains once all the divisors up to the limit are removed is either a prime
+    or the product of large primes, which we give up on. Beyond 3.3 * 10^24, telling
+    them apart relies on a probabilistic primality test
+    :param int n: The number to factorize, at least 1
+    :param int limit: The largest divisor to try
+    :return: The exponent of each prime factor, or None if the number is too large
+    :rtype: {int: int}
+    """
+    factors = {}
+    divisor = 2
+    while divisor * divisor <= n and divisor <= limit:
+        while n % divisor == 0:
+            factors[divisor] = factors.get(divisor, 0) + 1
+            n //= divisor
+        divisor += 1 if divisor == 2 else 2
+    if n > limit * limit and not is_prime(n):
+        return None
+    if n > 1:
+        factors[n] = factors.get(n, 0) + 1
+    return factors
+
+
+def euler_totient_factors(modulus):
+    """
+    :param int modulus: The modulus of the group
+    :return: The prime factors of the group size, or None if they cannot be found
+    :rtype: {int: int}
+    """
+    modulus_factors = factorize(modulus)
+    if modulus_factors is None:
+        return None
+    factors = {}
+    for prime, exponent in modulus_factors.items():
+        # phi(p^e) = p^(e-1) * (p-1)
+        if exponent > 1:
+            factors[prime] = factors.get(prime, 0) + exponent - 1
+        prime_minus_one_factors = factorize(prime - 1)
+        if prime_minus_one_factors is None:
+            return None
+        for factor, factor_exponent in prime_minus_one_factors.items():
+            factors[factor] = factors.get(factor, 0) + factor_exponent
+    return factors
+
+
+def multiplicative_order(subject, modulus, group_factors):
+    """
+    Starts from the group size, and removes the prime factors that are not needed
+    :param int subject: The number whose powers we look at
+    :param int modulus: The modulus of the group
+    :param {int: int} group_factors: The prime factors of the group size
+    :return: The prime factors of the smallest N > 0 with subject^N = 1
+    :rtype: {int: int}
+    """
+    order = 1
+    for prime, exponent in group_factors.items():
+        order *= prime**exponent
+    factors = {}
+    for prime, exponent in group_factors.items():
+        while exponent > 0 and pow(subject, order // prime, modulus) == 1:
+            order //= prime
+            exponent -= 1
+        if exponent > 0:
+            factors[prime] = exponent
+    return factors
+
+
+def get_order(subject, modulus):
+    """
+    :param int subject: The number whose powers we look at, coprime with the modulus
+    :param int modulus: The modulus of the group, at least 2
+    :return: The smallest N > 0 with subject^N = 1, or the modulus if the group size
+        cannot be factorized, which is still above all the logarithms
+    :rtype: int
+    """
+    group_factors = euler_totient_factors(modulus)
+    if group_factors is None:
+        return modulus
+    order = 1
+    for prime, exponent in multiplicative_order(
+        subject, modulus, group_factors
+    ).items():
+        order *= prime**exponent
+    return order
+
+
+def baby_step_giant_step(subject, target, modulus, order):
+    """
+    Finds X below the order with subject^X = target, in about 2*sqrt(order) steps
+    :param int subject: The number whose powers we look at
+    :param int target: The power we are looking for
+    :param int modulus: The modulus of the group
+    :param int order: Any number above the smallest solution, like the subject order
+    :return: The smallest solution, or None if there is none
+    :rtype: int
+    """
+    return BabyStepTable(subject, modulus, order).solve(target)
+
+
+def pohlig_hellman(subject, target, modulus, order_factors):
+    """
+    Solves the logarithm in each subgroup of prime power size, one base-p digit at a
+    time, then combines the results with the Chinese remainder theorem.
+    The cost is driven by the largest prime factor of the order
+    :param int subject: The number whose powers we look at
+    :param int target: The power we are looking for
+    :param int modulus: The modulus of the group
+    :param {int: int} order_factors: The prime factors of the subject order
+    :return: The smallest solution, or None if there is none
+    :rtype: int
+    """
+    order = 1
+    for prime, exponent in order_factors.items():
+        order *= prime**exponent
+    solution, solution_modulus = 0, 1
+    for prime, exponent in order_factors.items():
+        prime_power = prime**exponent
+        # Both sides are projected into the subgroup of size p^e
+        sub_subject = pow(subject, order // prime_power, modulus)
+        sub_target = pow(target, order // prime_power, modulus)
+        # Generates the subgroup of size p, where each digit is found
+        digit_subject = pow(sub_subject, prime_power // prime, modulus)
+        inverse_subject = pow(sub_subject, -1, modulus)
+        remainder = 0
+        for k in range(exponent):
+            shifted = sub_target * pow(inverse_subject, remainder, modulus) % modulus
+            shifted = pow(shifted, prime ** (exponent - 1 - k), modulus)
+            digit = baby_step_giant_step(digit_subject, shifted, modulus, prime)
+            if digit is None:
+                return None
+            remainder += digit * prime**k
+        # Chinese remainder theorem, the moduli being coprime
+        inverse = pow(solution_modulus, -1, prime_power)
+        delta = (remainder - solution) * inverse % prime_power
+        solution += delta * solution_modulus
+        solution_modulus *= prime_power
+    if pow(subject, solution, modulus) != target % modulus:
+        return None
+    return solution
+
+
+def discrete_log(subject, target, modulus):
+    """
+    Finds the smallest X >= 0 with subject^X = target (modulo the modulus)
+    Uses Pohlig-Hellman when the group size can be factorized, and falls back to a
+    baby-step giant-step over the whole group otherwise
+    :param int subject: The number whose powers we look at, coprime with the modulus
+    :param int target: The power we are looking for
+    :param int modulus: The modulus of the group, at least 2
+    :raises ValueError: If the subject is not invertible, or the target not reachable
+    :return: The discrete logarithm of the target
+    :rtype: int
+    """
+    if gcd(subject, modulus) != 1:
+        raise ValueError(f"{subject} is not invertible modulo {modulus}")
+    group_factors = euler_totient_factors(modulus)
+    if group_factors is None:
+        solution = baby_step_giant_step(subject, target, modulus, modulus)
+    else:
+        order_factors = multiplicative_order(subject, modulus, group_factors)
+        solution = pohlig_hellman(subject, target, modulus, order_factors)
+    if solution is None:
+        raise ValueError(f"{target} is not a power of {subject} modulo {modulus}")
+    return solution
+
+
+# --------------------------------------------------------------------------------
+# > Classes
+# --------------------------------------------------------------------------------
+class BabyStepTable:
+    def __init__(self, subject, modulus, order, step_count=None):
+        """
+        Precomputes the baby steps, which can then solve any number of logarithms
+        X is written i*m + j with m the number of baby steps. The table stores
+        subject^j for all j, then each giant step divides the target by subject^m
+        until it lands in the table. With K targets, about sqrt(K * order) baby
+        steps balance the cost of the table and of the giant steps
+        :param int subject: The number whose powers we look at
+        :param int modulus: The modulus of the group
+        :param int order: Any number above the smallest solutions, like the subject
+            order
+        :param int step_count: Number of baby steps. Defaults to sqrt(order)
+        """
+        if step_count is None:
+            step_count = isqrt(order - 1) + 1 if order > 1 else 1
+        self.modulus = modulus
+        self.step_count = step_count
+        self.giant_step_count = -(-order // step_count)
+        self.baby_steps = {}
+        value = 1
+        for j in range(step_count):
+            self.baby_steps.setdefault(value, j)
+            value = value * subject % modulus
+        self.giant_step = pow(subject, -step_count, modulus)
+
+    def solve(self, target, start=0, stop=None):
+        """
+        Runs the giant steps from start to stop, so that they can be split in ranges
+        :param int target: The power we are looking for
+        :param int start: Index of the first giant step
+        :param int stop: Index after the last giant step. Defaults to the last one
+        :return: The smallest solution within the range, or None if there is none
+        :rtype: int
+        """
+        if stop is None:
+            stop = self.giant_step_count
+        modulus, giant_step = self.modulus, self.giant_step
+        baby_steps, step_count = self.baby_steps, self.step_count
+        value = target * pow(giant_step, start, modulus) % modulus
+        for i in range(start, stop):
+            if value in baby_steps:
+                return i * step_count + baby_steps[value]
+            value = value * giant_step % modulus
+        return None
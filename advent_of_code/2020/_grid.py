@@ -0,0 +1,220 @@
+"""N-dimensional grids of small integers, stored in NumPy arrays"""
+
+# Built-in
+from itertools import product
+
+# Third-party
+import numpy as np
+
+
+# --------------------------------------------------------------------------------
+# > Functions
+# --------------------------------------------------------------------------------
+def parse_grid(lines, symbols):
+    """
+    Converts text lines into a 2d array in a single pass, through a byte lookup table
+    :param [str] lines: Lines from an input file, all of the same length
+    :param {str: int} symbols: The value of each character. Other characters become 0
+    :return: The 2d array, with one row per line
+    :rtype: numpy.ndarray
+    """
+    rows = [line.encode() for line in lines]
+    table = np.zeros(256, dtype=np.uint8)
+    for char, value in symbols.items():
+        table[ord(char)] = value
+    data = np.frombuffer(b"".join(rows), dtype=np.uint8)
+    return table[data].reshape(len(rows), -1)
+
+
+def neighbor_offsets(dimensions):
+    """
+    :param int dimensions: Number of dimensions of the grid
+    :return: The offsets to all the cells that touch a cell, diagonals included
+    :rtype: [(int)]
+    """
+    return [delta for delta in product([-1, 0, 1], repeat=dimensions) if any(delta)]
+
+
+# --------------------------------------------------------------------------------
+# > Classes
+# --------------------------------------------------------------------------------
+class GridND:
+    def __init__(self, cells, padding=0):
+        """
+        Grid of cells with any number of dimensions, stored as uint8
+        :param numpy.ndarray cells: The value of each cell
+        :param int padding: Number of empty cells to add around the grid
+        """
+        self.cells = np.asarray(cells, dtype=np.uint8)
+        if padding > 0:
+            self.pad(padding)
+
+    @classmethod
+    def from_lines(cls, lines, symbols, dimensions=2, padding=0):
+        """
+        Creates a grid from text lines, as a 2d slice of a grid with more dimensions
+        :param [str] lines: Lines from an input file, all of the same length
+        :param {str: int} symbols: The value of each character
+        :param int dimensions: Number of dimensions of the grid
+        :param int padding: Number of empty cells to add around the grid
+        :return: The created grid
+        :rtype: GridND
+        """
+        cells = parse_grid(lines, symbols)
+        cells = cells.reshape(cells.shape + (1,) * (dimensions - 2))
+        return cls(cells, padding)
+
+    @property
+    def dimensions(self):
+        """
+        :return: Number of dimensions of the grid
+        :rtype: int
+        """
+        return self.cells.ndim
+
+    @property
+    def shape(self):
+        """
+        :return: Number of cells along each dimension
+        :rtype: (int)
+        """
+        return self.cells.shape
+
+    def copy(self):
+        """
+        :return: An independent copy of the grid
+        :rtype: GridND
+        """
+        return self.__class__(self.cells.copy())
+
+    def count(self, value=1):
+        """
+        :param int value: The value to look for
+        :return: Number of cells with this value
+        :rtype: int
+        """
+        return int(np.count_nonzero(self.cells == value))
+
+    def pad(self, width=1):
+        """
+        Adds empty cells on every side of the grid, along every dimension
+        :param int width: Number of cells to add on each side
+        """
+        self.cells = np.pad(self.cells, width)
+
+    def trim(self):
+        """Removes the empty borders, keeping the smallest box around non-empty cells"""
+        indexes = np.nonzero(self.cells)
+        if len(indexes[0]) == 0:
+            self.cells = np.zeros((0,) * self.dimensions, dtype=np.uint8)
+            return
+        box = tuple(slice(index.min(), index.max() + 1) for index in indexes)
+        self.cells = self.cells[box]
+
+    def count_neighbors(self, value=1, offsets=None):
+        """
+        For each cell, counts the neighbors that have a given value
+        This is a convolution with a kernel of ones, done by summing shifted views of
+        a padded copy of the grid. Cells outside of the grid never match
+        :param int value: The value to look for
+        :param [(int)] offsets: Offsets to the neighbors, all within 1 of the cell.
+            Defaults to all the cells touching it, diagonals included
+        :return: Array with the number of matching neighbors of each cell
+        :rtype: numpy.ndarray
+        """
+        if offsets is None:
+            offsets = neighbor_offsets(self.dimensions)
+        padded = np.pad((self.cells == value).view(np.uint8), 1)
+        # From 6 dimensions up, cells have more than 255 neighbors
+        dtype = np.uint8 if len(offsets) < 256 else np.uint16
+        counts = np.zeros(self.shape, dtype=dtype)
+        for offset in offsets:
+            view = tuple(
+                slice(1 + delta, 1 + delta + size)
+                for delta, size in zip(offset, self.shape)
+            )
+            counts += padded[view]
+        return counts
+
+    def touches_border(self):
+        """
+        :return: Whether a non-empty cell lies on the outer layer of the grid
+        :rtype: bool
+        """
+        for axis in range(self.dimensions):
+            if self.cells.take([0, -1], axis=axis).any():
+                return True
+        return False
+
+    def step(self, born, survive, offsets=None, grow=True):
+        """
+        Runs one generation of a life-like automaton, where cells are 0 or 1
+        The grid first grows by one cell on each side, as life can spread that far
+        :param [int] born: Numbers of live neighbors that bring a dead cell to life
+        :param [int] survive: Numbers of live neighbors that keep a live cell alive
+        :param [(int)] offsets: Offsets to the neighbors. Defaults to all touching cells
+        :param bool grow: Whether to grow the grid first. If not, the caller must keep
+            empty margins around the live cells
+        """
+        if offsets is None:
+            offsets = neighbor_offsets(self.dimensions)
+        if grow:
+            self.pad(1)
+        counts = self.count_neighbors(1, offsets)
+        # Next state of each cell, indexed by its current state and its count
+        rules = np.zeros((2, len(offsets) + 1), dtype=np.uint8)
+        rules[0, born] = 1
+        rules[1, survive] = 1
+        self.cells = rules[self.cells, counts]
+
+
+class Grid2D(GridND):
+    @property
+    def height(self):
+        """
+        :return: Number of rows
+        :rtype: int
+        """
+        return self.shape[0]
+
+    @property
+    def width(self):
+        """
+        :return: Number of columns
+        :rtype: int
+        """
+        return self.shape[1]
+
+    def rotated(self, quarters=1):
+        """
+        :param int quarters: Number of counterclockwise quarter turns
+        :return: A rotated view of the grid, sharing its cells
+        :rtype: Grid2D
+        """
+        return Grid2D(np.rot90(self.cells, quarters))
+
+    def flipped(self):
+        """
+        :return: A view of the grid mirrored left to right, sharing its cells
+        :rtype: Grid2D
+        """
+        return Grid2D(np.fliplr(self.cells))
+
+    def variations(self):
+        """
+        :return: Views of the grid in all 8 orientations (rotations and flips)
+        :rtype: [Grid2D]
+        """
+        flipped = self.flipped()
+        return [grid.rotated(i) for grid in [self, flipped] for i in range(4)]
+
+    def to_lines(self, symbols):
+        """
+        :param {str: int} symbols: The value of each character
+        :return: The grid as text lines, one per row
+        :rtype: [str]
+        """
+        table = np.full(256, ord("?"), dtype=np.uint8)
+        for char, value in symbols.items():
+            table[value] = ord(char)
+        return [bytes(row).decode() for row in table[self.cells]]
@@ -1,13 +1,19 @@
 """Shared functions and utilities for all challenges"""
 
 # Built-in
+import hashlib
+import mmap
 import os
+import pickle
+import sys
+from time import perf_counter
 
 # --------------------------------------------------------------------------------
 # > Constants
-# -------------------------------------------------------------------------------- 
+# --------------------------------------------------------------------------------
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_DIR = os.path.join(CURRENT_DIR, "inputs")
+CACHE_DIR = os.path.join(CURRENT_DIR, ".cache")
 
 
 # --------------------------------------------------------------------------------
@@ -20,7 +26,215 @@ def read_input(filename):
     :return: The content of the file
     :rtype: list
     """
+    return list(iter_input(filename))
+
+
+def iter_input(filename):
+    """
+    Lazily reads the inputs file for a challenge, one line at a time
+    Only the current line is held in memory
+    :param str filename: The name of the input file
+    :return: The lines of the file, without their line break
+    :rtype: iterator
+    """
     filepath = os.path.join(INPUT_DIR, filename)
     with open(filepath, "r") as f:
-        content = [line.rstrip("\n") for line in f.readlines()]
-    return content
+        for line in f:
+            yield line.rstrip("\n")
+
+
+class InputLines:
+    def __init__(self, filename):
+        """
+        Lines of the inputs file for a challenge, that can be iterated many times
+        Each iteration reads the file again, lazily, so nothing is kept in memory
+        :param str filename: The name of the input file
+        """
+        self.filename = filename
+
+    def __iter__(self):
+        """
+        :return: The lines of the file, without their line break
+        :rtype: iterator
+        """
+        return iter_input(self.filename)
+
+
+def iter_records(filename, separator=None):
+    """
+    Lazily reads the inputs file for a challenge, one record at a time
+    :param str filename: The name of the input file
+    :param str separator: If provided, the lines of each record are joined with it
+    :return: Each record, as a list of lines or as a single string
+    :rtype: iterator
+    """
+    return group_records(iter_input(filename), separator)
+
+
+def group_records(lines, separator=None):
+    """
+    Groups the lines into records, which are separated by blank lines
+    Lines are collected in a list and joined once, to avoid repeated concatenation
+    :param [str] lines: Lines from an input file
+    :param str separator: If provided, the lines of each record are joined with it
+    :return: Each record, as a list of lines or as a single string
+    :rtype: iterator
+    """
+    record = []
+    for line in lines:
+        if line != "":
+            record.append(line)
+        elif len(record) > 0:
+            yield record if separator is None else separator.join(record)
+            record = []
+    # Adding the last one
+    if len(record) > 0:
+        yield record if separator is None else separator.join(record)
+
+
+def read_input_bytes(filename):
+    """
+    Maps the inputs file for a challenge in memory, read-only
+    Pages are loaded by the OS on access, so huge files do not fill the memory
+    :param str filename: The name of the input file
+    :return: The raw content of the file
+    :rtype: mmap.mmap or bytes
+    """
+    filepath = os.path.join(INPUT_DIR, filename)
+    with open(filepath, "rb") as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def hash_input(filename):
+    """
+    Computes the SHA-256 of the inputs file for a challenge, chunk by chunk
+    :param str filename: The name of the input file
+    :return: The hexadecimal digest of the file content
+    :rtype: str
+    """
+    filepath = os.path.join(INPUT_DIR, filename)
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(2**20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_parse(filename, parser, version):
+    """
+    Parses the inputs file for a challenge, or loads the result of a previous parse
+    Results are pickled on disk, keyed by the content of the file and the version
+    of the parser. Editing the file or bumping the version invalidates the cache
+    :param str filename: The name of the input file
+    :param function parser: The function parsing the lines of the file
+    :param int version: The version of the parser, to bump when its output changes
+    :return: The parsed input
+    """
+    name = os.path.splitext(os.path.basename(parser.__code__.co_filename))[0]
+    key = f"{name}-v{version}-{hash_input(filename)}"
+    cache_path = os.path.join(CACHE_DIR, f"{key}.pickle")
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        pass
+    parsed = parser(iter_input(filename))
+    # Write then rename, so concurrent runs never read a partial file
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+    return parsed
+
+
+# --------------------------------------------------------------------------------
+# > Progress
+# --------------------------------------------------------------------------------
+class Progress:
+    def __init__(self, callback=None, unit="items", total=None, interval=1.0):
+        """
+        Reports the progress of a long computation to a callback, at most once per
+        interval. Without callback, updates do nothing, so computations are silent
+        :param function callback: Receives a dict with the unit, the count done,
+            the total, the elapsed time, the rate per second and any extra metric
+        :param str unit: What is being counted, like "moves" or "cells"
+        :param int total: The expected final count, if known
+        :param float interval: Minimum wall-clock time between two reports, in seconds
+        """
+        self.callback = callback
+        self.unit = unit
+        self.total = total
+        self.interval = interval
+        self.start = perf_counter()
+        self.last_time = self.start
+        self.last_done = 0
+
+    def update(self, done, **metrics):
+        """
+        Reports the progress if the last report is old enough
+        Meant to be called between batches of work, not on every item
+        :param int done: Count of units done since the start
+        :param metrics: Extra values to report, like the current cycle
+        """
+        if self.callback is None:
+            return
+        now = perf_counter()
+        if now - self.last_time >= self.interval:
+            self.report(done, now, metrics)
+
+    def finish(self, done, **metrics):
+        """
+        Reports the final progress, regardless of the interval
+        :param int done: Count of units done since the start
+        :param metrics: Extra values to report
+        """
+        if self.callback is not None:
+            self.report(done, perf_counter(), metrics)
+
+    def report(self, done, now, metrics):
+        """
+        Sends the counts and the throughput since the last report to the callback
+        :param int done: Count of units done since the start
+        :param float now: The current time, from perf_counter
+        :param dict metrics: Extra values to report
+        """
+        duration = now - self.last_time
+        rate = (done - self.last_done) / duration if duration > 0 else 0.0
+        self.callback(
+            {
+                "unit": self.unit,
+                "done": done,
+                "total": self.total,
+                "elapsed": now - self.start,
+                "rate": rate,
+                **metrics,
+            }
+        )
+        self.last_time = now
+        self.last_done = done
+
+
+def print_progress(stats):
+    """
+    Progress callback that writes one line per report to stderr
+    :param dict stats: The progress sent by a Progress instance
+    """
+    done = (
+        f"{stats['done']}"
+        if stats["total"] is None
+        else f"{stats['done']}/{stats['total']}"
+    )
+    extra = "".join(
+        f" {name}={value}"
+        for name, value in stats.items()
+        if name not in {"unit", "done", "total", "elapsed", "rate"}
+    )
+    print(
+        f"[{stats['elapsed']:.1f}s] {done} {stats['unit']} "
+        f"({stats['rate']:,.0f} {stats['unit']}/s){extra}",
+        file=sys.stderr,
+    )
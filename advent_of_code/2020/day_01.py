@@ -6,19 +6,45 @@ from itertools import combinations
 # Personal
 from _shared import read_input
 
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The expense report entries
+    :rtype: [int]
+    """
+    return [int(v) for v in lines]
+
+
+def solve_part1(values):
+    """
+    :param [int] values: The expense report entries
+    :return: The product of the two entries that sum to 2020
+    :rtype: int
+    """
+    for a, b in combinations(values, 2):
+        if (a + b) == 2020:
+            return a * b
+
+
+def solve_part2(values):
+    """
+    :param [int] values: The expense report entries
+    :return: The product of the three entries that sum to 2020
+    :rtype: int
+    """
+    for a, b, c in combinations(values, 3):
+        if (a + b + c) == 2020:
+            return a * b * c
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-values = [int(v) for v in read_input("day_01.txt")]
-
-# First problem
-for a, b in combinations(values, 2):
-    if (a + b) == 2020:
-        print(a * b)
-        break
-
-# Second problem
-for a, b, c in combinations(values, 3):
-    if (a + b + c) == 2020:
-        print(a * b * c)
-        break
+if __name__ == "__main__":
+    values = parse(read_input("day_01.txt"))
+    print(solve_part1(values))
+    print(solve_part2(values))
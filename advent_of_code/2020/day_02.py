@@ -4,10 +4,10 @@
 import re
 
 # Personal
-from _shared import read_input
+from _shared import InputLines
 
 # --------------------------------------------------------------------------------
-# > Main
+# > Helpers
 # --------------------------------------------------------------------------------
 REGEX = r"^(\d+)-(\d+) ([a-z]): (.+)$"
 
@@ -28,16 +28,69 @@ def parse_line(input_line):
     )
 
 
-first_total, second_total = 0, 0
-for line in read_input("day_02.txt"):
-    min_, max_, letter, text = parse_line(line)
-    # First problem
+def is_valid_by_count(min_, max_, letter, text):
+    """
+    :param int min_: Minimum number of times the letter must appear
+    :param int max_: Maximum number of times the letter can appear
+    :param str letter: The enforced letter
+    :param str text: The password
+    :return: Whether the letter count is within the range
+    :rtype: bool
+    """
     letter_count = text.count(letter)
-    if min_ <= letter_count <= max_:
-        first_total += 1
-    # Second problem
-    first = text[min_ - 1]
-    second = text[max_ - 1]
-    if (first == letter or second == letter) and first != second:
-        second_total += 1
-print(first_total, second_total)
+    return min_ <= letter_count <= max_
+
+
+def is_valid_by_position(first_position, second_position, letter, text):
+    """
+    :param int first_position: First position to check, starting at 1
+    :param int second_position: Second position to check, starting at 1
+    :param str letter: The enforced letter
+    :param str text: The password
+    :return: Whether the letter is at exactly one of the positions
+    :rtype: bool
+    """
+    first = text[first_position - 1]
+    second = text[second_position - 1]
+    return (first == letter or second == letter) and first != second
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    Keeps the lines as they are, to be read again by each part
+    Each part streams through the file, so the memory does not grow with the input
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The same lines
+    :rtype: InputLines
+    """
+    return lines
+
+
+def solve_part1(lines):
+    """
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The number of passwords where the letter count is within the range
+    :rtype: int
+    """
+    return sum(1 for line in lines if is_valid_by_count(*parse_line(line)))
+
+
+def solve_part2(lines):
+    """
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The number of passwords with the letter at exactly one of the positions
+    :rtype: int
+    """
+    return sum(1 for line in lines if is_valid_by_position(*parse_line(line)))
+
+
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+if __name__ == "__main__":
+    lines = parse(InputLines("day_02.txt"))
+    print(solve_part1(lines))
+    print(solve_part2(lines))
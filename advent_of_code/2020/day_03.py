@@ -4,29 +4,94 @@
 # Personal
 from _shared import read_input
 
+# --------------------------------------------------------------------------------
+# > Helpers
+# --------------------------------------------------------------------------------
+SLOPES = [[1, 1], [3, 1], [5, 1], [7, 1], [1, 2]]
+TREE_BITS = str.maketrans(".#", "01")
+
+
+class TreeMap:
+    def __init__(self, rows, width):
+        """
+        Creates the map of the area, which repeats itself to the right
+        :param [int] rows: One bitmask per row, where bit X is set if there is a tree
+            at column X
+        :param int width: Number of columns before the pattern repeats
+        """
+        self.rows = rows
+        self.width = width
+
+    @classmethod
+    def from_lines(cls, lines):
+        """
+        :param [str] lines: The map of the area, with "#" for trees and "." for nothing
+        :return: The map with its rows as bitmasks
+        :rtype: TreeMap
+        """
+        lines = list(lines)
+        # Reversed so that the first column ends up as the lowest bit
+        rows = [int(line[::-1].translate(TREE_BITS), 2) for line in lines]
+        return cls(rows, len(lines[0]))
+
+    def count_trees(self, slopes):
+        """
+        Goes down all the slopes at once, reading each row a single time
+        Each slope only lands on the rows that are a multiple of its vertical step
+        :param [[int]] slopes: The steps to the right and down for each move, per slope
+        :return: The number of trees encountered on each slope
+        :rtype: [int]
+        """
+        width = self.width
+        counts = [0] * len(slopes)
+        columns = [0] * len(slopes)
+        for y in range(1, len(self.rows)):
+            row = self.rows[y]
+            for i, (x_add, y_add) in enumerate(slopes):
+                if y % y_add == 0:
+                    columns[i] = (columns[i] + x_add) % width
+                    counts[i] += (row >> columns[i]) & 1
+        return counts
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The map of the area
+    :rtype: TreeMap
+    """
+    return TreeMap.from_lines(lines)
+
+
+def solve_part1(tree_map):
+    """
+    :param TreeMap tree_map: The map of the area
+    :return: The number of trees encountered with the (3, 1) slope
+    :rtype: int
+    """
+    (count,) = tree_map.count_trees([[3, 1]])
+    return count
+
+
+def solve_part2(tree_map):
+    """
+    :param TreeMap tree_map: The map of the area
+    :return: The product of the trees encountered on each slope
+    :rtype: int
+    """
+    injury_multiplier = 1
+    for count in tree_map.count_trees(SLOPES):
+        injury_multiplier *= count
+    return injury_multiplier
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-grid = [list(line) for line in read_input("day_03.txt")]
-height = len(grid)
-width = len(grid[0])
-slopes = [[1, 1], [3, 1], [5, 1], [7, 1], [1, 2]]
-injury_multiplier = 1
-
-for x_add, y_add in slopes:
-    injuries = 0
-    x, y = 0, 0
-    for i in range(height):
-        x = x + x_add - ((x + x_add) // width) * width  # 0 <= X <= width-1
-        y += y_add
-        # We've reached the end or beyond
-        if y >= height:
-            break
-        # Did we land on a tree?
-        if grid[y][x] == "#":
-            injuries += 1
-
-    print(injuries)
-    injury_multiplier *= injuries
-
-print(injury_multiplier)
+if __name__ == "__main__":
+    tree_map = parse(read_input("day_03.txt"))
+    print(solve_part1(tree_map))
+    print(solve_part2(tree_map))
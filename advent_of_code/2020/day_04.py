@@ -4,7 +4,7 @@
 import re
 
 # Personal
-from _shared import read_input
+from _shared import InputLines, group_records
 
 
 # --------------------------------------------------------------------------------
@@ -42,15 +42,16 @@ class PassportForm:
     def find_invalid_fields(self):
         """
         Checks for missing fields
-        :return: The required fields that are missing from our form
-        :rtype: set
+        Stores the required fields that are missing, and the fields that are invalid
         """
         invalid_fields = set()
+        missing_fields = set()
         for field_name, required in self.FIELDS:
             value = getattr(self, field_name, None)
             # Check required
             if required and value is None:
                 invalid_fields.add(field_name)
+                missing_fields.add(field_name)
             # Custom validation
             if value is not None:
                 function_name = f"validate_{field_name}"
@@ -58,6 +59,15 @@ class PassportForm:
                 if not field_validation_function():
                     invalid_fields.add(field_name)
         self.invalid_fields = invalid_fields
+        self.missing_fields = missing_fields
+
+    @property
+    def has_required_fields(self):
+        """
+        :return: Whether the form has all its required fields, valid or not
+        :rtype: bool
+        """
+        return len(self.missing_fields) == 0
 
     @property
     def is_valid(self):
@@ -148,28 +158,47 @@ class PassportForm:
         return True
 
 
-def get_passport_info_from_input():
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    Keeps the lines as they are, to be read again by each part
+    Each part streams through the file and fills one form at a time, so the memory
+    does not grow with the input
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The same lines
+    :rtype: InputLines
+    """
+    return lines
+
+
+def solve_part1(lines):
+    """
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The number of forms with all their required fields
+    :rtype: int
+    """
+    return sum(
+        1
+        for line in group_records(lines, " ")
+        if PassportForm(line).has_required_fields
+    )
+
+
+def solve_part2(lines):
     """
-    Fetches the input file and rebuilds passport info as a one-liner
-    :return: List string of passport info
-    :rtype: [str]
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The number of valid forms
+    :rtype: int
     """
-    passport_list = []
-    text = ""
-    for line in read_input("day_04.txt"):
-        if line != "":
-            text += f" {line}"
-        else:
-            passport_list.append(text[1:])
-            text = ""
-    passport_list.append(text[1:])  # Adding the last one
-    return passport_list
+    return sum(1 for line in group_records(lines, " ") if PassportForm(line).is_valid)
 
 
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-passport_info = get_passport_info_from_input()
-passport_forms = [PassportForm(line) for line in passport_info]
-valid_forms = [form for form in passport_forms if form.is_valid]
-print(len(valid_forms))
+if __name__ == "__main__":
+    lines = parse(InputLines("day_04.txt"))
+    print(solve_part1(lines))
+    print(solve_part2(lines))
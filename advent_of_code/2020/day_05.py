@@ -63,30 +63,53 @@ class Seat:
         return Seat(row, col)
 
 
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The seats from the boarding passes
+    :rtype: [Seat]
+    """
+    return [Seat.create_from_input_line(line) for line in lines]
+
+
+def solve_part1(seats):
+    """
+    :param [Seat] seats: The seats from the boarding passes
+    :return: The highest seat ID
+    :rtype: int
+    """
+    return max(seat.id for seat in seats)
+
+
+def solve_part2(seats):
+    """
+    Removes rows from each end until only 1 seat remains
+    :param [Seat] seats: The seats from the boarding passes
+    :return: The ID of our seat, the only one left
+    :rtype: int
+    """
+    available_seats = {(row, col) for row in range(128) for col in range(8)}
+    available_seats.difference_update(seat.loc for seat in seats)
+    max_row = 127
+    i = 0
+    while len(available_seats) > 1:
+        mod = i // 2
+        row_to_remove = max_row - mod if i % 2 else mod
+        available_seats = {
+            (row, col) for row, col in available_seats if row != row_to_remove
+        }
+        i += 1
+    row, col = available_seats.pop()
+    return row * 8 + col
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-AVAILABLE_SEATS = {(row, col) for row in range(128) for col in range(8)}
-
-# Problem 1
-seats = []
-for input_line in read_input("day_05.txt"):
-    seat = Seat.create_from_input_line(input_line)
-    seats.append(seat)
-    AVAILABLE_SEATS.remove(seat.loc)
-seats.sort(key=lambda x: x.id, reverse=True)
-print(seats[0].id)
-
-# Problem 2
-# Removes rows from each end until only 1 seat remains
-max_row = 127
-i = 0
-while len(AVAILABLE_SEATS) > 1:
-    mod = i // 2
-    row_to_remove = max_row - mod if i % 2 else mod
-    AVAILABLE_SEATS = {
-        (row, col) for row, col in AVAILABLE_SEATS if row != row_to_remove
-    }
-    i += 1
-row, col = AVAILABLE_SEATS.pop()
-print(row * 8 + col)
+if __name__ == "__main__":
+    seats = parse(read_input("day_05.txt"))
+    print(solve_part1(seats))
+    print(solve_part2(seats))
@@ -5,7 +5,7 @@
 from collections import Counter
 
 # Personal
-from _shared import read_input
+from _shared import InputLines, group_records
 
 
 # --------------------------------------------------------------------------------
@@ -14,41 +14,60 @@ from _shared import read_input
 def merge_group_answers_with_count(file_content):
     """
     Merges the group answers together and count the number of people in each group
+    Groups are yielded one at a time
     :param [str] file_content: Content from the input file
     :return: For each group, a long string of all the answers and the number of people
-    :rtype: [(str, int)]
-    """
-    group_info = []
-    merged_answer = ""
-    people = 0
-    for line in file_content:
-        if line != "":
-            merged_answer += f"{line}"
-            people += 1
-        else:
-            group_info.append((merged_answer, people))
-            merged_answer = ""
-            people = 0
-    group_info.append((merged_answer, people))  # Adding the last one
-    return group_info
+    :rtype: iterator
+    """
+    for record in group_records(file_content):
+        yield "".join(record), len(record)
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    Keeps the lines as they are, to be read again by each part
+    Each part streams through the file one group at a time, so the memory does not
+    grow with the input
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The same lines
+    :rtype: InputLines
+    """
+    return lines
+
+
+def solve_part1(lines):
+    """
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The sum of the questions answered by anyone, for each group
+    :rtype: int
+    """
+    return sum(
+        len(set(answers)) for answers, _ in merge_group_answers_with_count(lines)
+    )
+
+
+def solve_part2(lines):
+    """
+    :param InputLines lines: Lines from the input file, that can be iterated many times
+    :return: The sum of the questions answered by everyone, for each group
+    :rtype: int
+    """
+    total = 0
+    for answers, group_size in merge_group_answers_with_count(lines):
+        counter = Counter(answers)
+        total += len(
+            [letter for letter, count in counter.items() if count >= group_size]
+        )
+    return total
 
 
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-content = read_input("day_06.txt")
-group_data = merge_group_answers_with_count(content)
-
-# Problem 1
-total = sum([len(set(answers)) for answers, _ in group_data])
-print(total)
-
-# Problem 2
-total = 0
-for answers, group_size in group_data:
-    counter = Counter(answers)
-    counter = {
-        letter: count for letter, count in counter.items() if count >= group_size
-    }
-    total += len(counter)
-print(total)
+if __name__ == "__main__":
+    lines = parse(InputLines("day_06.txt"))
+    print(solve_part1(lines))
+    print(solve_part2(lines))
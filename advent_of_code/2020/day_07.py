@@ -30,47 +30,76 @@ class Rule:
         return cls(bag, nested_bags)
 
 
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+PARSER_VERSION = 1
+
+
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The rule of each bag
+    :rtype: [Rule]
+    """
+    return [Rule.parse_line(line) for line in lines]
+
+
+def solve_part1(rules):
+    """
+    :param [Rule] rules: The rule of each bag
+    :return: The number of bags that can eventually contain the main bag
+    :rtype: int
+    """
+    valid_outer_bags = set()
+    bags_to_check = {
+        MAIN_BAG,
+    }
+    while True:
+        valid_bags = set()
+        for bag in bags_to_check:
+            new_bags_to_check = {
+                rule.bag for rule in rules if bag in rule.nested_bags.keys()
+            }
+            valid_bags.update(new_bags_to_check)
+        new_valid_bags = {bag for bag in valid_bags if bag not in valid_outer_bags}
+        if len(new_valid_bags) == 0:
+            break
+        else:
+            bags_to_check = new_valid_bags.copy()
+            valid_outer_bags.update(bags_to_check)
+    return len(valid_outer_bags)
+
+
+def solve_part2(rules):
+    """
+    :param [Rule] rules: The rule of each bag
+    :return: The number of bags required inside the main bag
+    :rtype: int
+    """
+    rule_dict = {rule.bag: rule for rule in rules}
+    bags_to_check = [
+        (MAIN_BAG, 1),
+    ]
+    total_count = 0
+    while True:
+        new_bags = []
+        for bag, qty in bags_to_check:
+            matching_rule = rule_dict[bag]
+            bags = [(k, v * qty) for k, v in matching_rule.nested_bags.items()]
+            new_bags.extend(bags)
+        if len(new_bags) == 0:
+            break
+        else:
+            bags_to_check = new_bags.copy()
+            total_count += sum([bag[1] for bag in new_bags])
+    return total_count
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-rules = [Rule.parse_line(line) for line in read_input("day_07.txt")]
-rule_dict = {rule.bag: rule for rule in rules}
-
-# Problem 1
-valid_outer_bags = set()
-bags_to_check = {
-    MAIN_BAG,
-}
-while True:
-    valid_bags = set()
-    for bag in bags_to_check:
-        new_bags_to_check = {
-            rule.bag for rule in rules if bag in rule.nested_bags.keys()
-        }
-        valid_bags.update(new_bags_to_check)
-    new_valid_bags = {bag for bag in valid_bags if bag not in valid_outer_bags}
-    if len(new_valid_bags) == 0:
-        break
-    else:
-        bags_to_check = new_valid_bags.copy()
-        valid_outer_bags.update(bags_to_check)
-
-print(len(valid_outer_bags))
-
-# Problem 2
-bags_to_check = [
-    (MAIN_BAG, 1),
-]
-total_count = 0
-while True:
-    new_bags = []
-    for bag, qty in bags_to_check:
-        matching_rule = rule_dict[bag]
-        bags = [(k, v * qty) for k, v in matching_rule.nested_bags.items()]
-        new_bags.extend(bags)
-    if len(new_bags) == 0:
-        break
-    else:
-        bags_to_check = new_bags.copy()
-        total_count += sum([bag[1] for bag in new_bags])
-print(total_count)
+if __name__ == "__main__":
+    rules = parse(read_input("day_07.txt"))
+    print(solve_part1(rules))
+    print(solve_part2(rules))
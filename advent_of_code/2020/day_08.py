@@ -114,16 +114,55 @@ class Instruction:
         program.index += 1
 
 
+def build_program(instructions):
+    """
+    Creates a program with fresh copies of the instructions
+    Running a program updates its instructions, so they cannot be shared
+    :param [Instruction] instructions: The instructions the program will run
+    :return: The program, ready to run
+    :rtype: Program
+    """
+    return Program([Instruction(instruction.line) for instruction in instructions])
+
+
 # --------------------------------------------------------------------------------
-# > Main
+# > Solutions
 # --------------------------------------------------------------------------------
-instructions = [Instruction(line) for line in read_input("day_08.txt")]
-main_program = Program(instructions)
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The instructions of the program
+    :rtype: [Instruction]
+    """
+    return [Instruction(line) for line in lines]
+
+
+def solve_part1(instructions):
+    """
+    :param [Instruction] instructions: The instructions of the program
+    :return: The accumulator right before the infinite loop
+    :rtype: int
+    """
+    program = build_program(instructions)
+    program.run()
+    return program.acc
+
+
+def solve_part2(instructions):
+    """
+    :param [Instruction] instructions: The instructions of the program
+    :return: The accumulator once the fixed program terminates
+    :rtype: int
+    """
+    program = build_program(instructions)
+    program.run_with_fix()
+    return program.acc
 
-# Problem 1
-main_program.run()
-print(main_program.acc)
 
-# Problem 2
-main_program.run_with_fix()
-print(main_program.acc)
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+if __name__ == "__main__":
+    instructions = parse(read_input("day_08.txt"))
+    print(solve_part1(instructions))
+    print(solve_part2(instructions))
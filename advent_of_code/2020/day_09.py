@@ -10,33 +10,69 @@ from _shared import read_input
 # --------------------------------------------------------------------------------
 # > Helpers
 # --------------------------------------------------------------------------------
+RANGE = 25
+
+
+def find_invalid_number(numbers):
+    """
+    :param [int] numbers: The numbers from the input file
+    :return: The first number that is not the sum of two of the RANGE numbers before it
+    :rtype: int
+    """
+    i = RANGE
+    while True:
+        current_number = numbers[i]
+        available_numbers = numbers[i - RANGE : i]
+        possible_outputs = {a + b for a, b in combinations(available_numbers, 2)}
+        if current_number not in possible_outputs:
+            return current_number
+        i += 1
 
 
 # --------------------------------------------------------------------------------
-# > Main
+# > Solutions
 # --------------------------------------------------------------------------------
-NUMBERS = [int(value) for value in read_input("day_09.txt")]
-RANGE = 25
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The numbers from the input file
+    :rtype: [int]
+    """
+    return [int(value) for value in lines]
+
+
+def solve_part1(numbers):
+    """
+    :param [int] numbers: The numbers from the input file
+    :return: The first invalid number
+    :rtype: int
+    """
+    return find_invalid_number(numbers)
 
-# Problem 1
-i = RANGE
-while True:
-    current_number = NUMBERS[i]
-    available_numbers = NUMBERS[i - RANGE : i]
-    possible_outputs = {a + b for a, b in combinations(available_numbers, 2)}
-    if current_number not in possible_outputs:
-        break
-    i += 1
-invalid_number = current_number
-print(invalid_number)
-
-# Problem 2
-length = 2
-result = None
-while result is None:
-    for i in range(len(NUMBERS) - length):
-        numbers = NUMBERS[i : i + length]
-        if sum(numbers) == invalid_number:
-            result = sum([min(numbers), max(numbers)])
-    length += 1
-print(result)
+
+def solve_part2(numbers):
+    """
+    :param [int] numbers: The numbers from the input file
+    :return: The sum of the min and max of the contiguous range adding up to the
+        invalid number
+    :rtype: int
+    """
+    invalid_number = find_invalid_number(numbers)
+    length = 2
+    result = None
+    while result is None:
+        for i in range(len(numbers) - length):
+            contiguous_numbers = numbers[i : i + length]
+            if sum(contiguous_numbers) == invalid_number:
+                result = sum([min(contiguous_numbers), max(contiguous_numbers)])
+        length += 1
+    return result
+
+
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+if __name__ == "__main__":
+    numbers = parse(read_input("day_09.txt"))
+    print(solve_part1(numbers))
+    print(solve_part2(numbers))
@@ -4,13 +4,23 @@
 # Built-in
 from enum import Enum
 
+# Third-party
+import numpy as np
+
 # Personal
+from _grid import Grid2D
 from _shared import read_input
 
 
 # --------------------------------------------------------------------------------
 # > Helpers
 # --------------------------------------------------------------------------------
+FLOOR, EMPTY, OCCUPIED = 0, 1, 2
+SYMBOLS = {".": FLOOR, "L": EMPTY, "#": OCCUPIED}
+# Left, right, top, bottom, top left, top right, bottom left, bottom right
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, -1), (-1, 1), (1, 1)]
+
+
 class Grid:
     def __init__(self, grid):
         """
@@ -21,6 +31,7 @@ class Grid:
         self.grid = grid
         self.x_max = len(self.grid[0]) - 1
         self.y_max = len(self.grid) - 1
+        self.spots = self.compute_spots()
         self.compute_adjacent_spots()
         self.compute_visible_seats()
 
@@ -63,83 +74,66 @@ class Grid:
     def compute_visible_seats(self):
         """
         Finds the first/closest actual seat in each direction (8 total) for each seat
+        Each direction is a single sweep over the grid, visiting a spot after the spot
+        next to it in that direction. That way, the closest seat of a spot is either
+        its neighbor, or the closest seat of its neighbor
         The list of seats is then stored in the Spot instance
         """
         for spot in self.spots:
-            closest_visible_seats = []
-            left_iter = list(reversed(range(0, spot.x)))
-            right_iter = list(range(spot.x + 1, self.x_max + 1))
-            top_iter = list(reversed(range(0, spot.y)))
-            bottom_iter = list(range(spot.y + 1, self.y_max + 1))
-            # Left
-            for new_x in left_iter:
-                potential_seat = self[new_x, spot.y]
-                if potential_seat.is_seat:
-                    closest_visible_seats.append(potential_seat)
-                    break
-            # Right
-            for new_x in right_iter:
-                potential_seat = self[new_x, spot.y]
-                if potential_seat.is_seat:
-                    closest_visible_seats.append(potential_seat)
-                    break
-            # Top
-            for new_y in top_iter:
-                potential_seat = self[spot.x, new_y]
-                if potential_seat.is_seat:
-                    closest_visible_seats.append(potential_seat)
-                    break
-            # Bottom
-            for new_y in bottom_iter:
-                potential_seat = self[spot.x, new_y]
-                if potential_seat.is_seat:
-                    closest_visible_seats.append(potential_seat)
-                    break
-            # Top Left
-            for new_x, new_y in zip(left_iter, top_iter):
-                potential_seat = self[new_x, new_y]
-                if potential_seat.is_seat:
-                    closest_visible_seats.append(potential_seat)
-                    break
-            # Top Right
-            for new_x, new_y in zip(right_iter, top_iter):
-                potential_seat = self[new_x, new_y]
-                if potential_seat.is_seat:
-                    closest_visible_seats.append(potential_seat)
-                    break
-            # Bottom Left
-            for new_x, new_y in zip(left_iter, bottom_iter):
-                potential_seat = self[new_x, new_y]
-                if potential_seat.is_seat:
-                    closest_visible_seats.append(potential_seat)
-                    break
-            # Bottom Right
-            for new_x, new_y in zip(right_iter, bottom_iter):
-                potential_seat = self[new_x, new_y]
-                if potential_seat.is_seat:
-                    closest_visible_seats.append(potential_seat)
-                    break
-            spot.closest_visible_seats = closest_visible_seats
+            spot.closest_visible_seats = []
+        for dx, dy in DIRECTIONS:
+            closest_seats = [[None] * (self.x_max + 1) for _ in range(self.y_max + 1)]
+            ys = range(self.y_max + 1) if dy <= 0 else range(self.y_max, -1, -1)
+            xs = range(self.x_max + 1) if dx <= 0 else range(self.x_max, -1, -1)
+            for y in ys:
+                neighbor_y = y + dy
+                if not 0 <= neighbor_y <= self.y_max:
+                    continue
+                for x in xs:
+                    neighbor_x = x + dx
+                    if not 0 <= neighbor_x <= self.x_max:
+                        continue
+                    neighbor = self[neighbor_x, neighbor_y]
+                    if neighbor.is_seat:
+                        closest_seats[y][x] = neighbor
+                    else:
+                        closest_seats[y][x] = closest_seats[neighbor_y][neighbor_x]
+                    if closest_seats[y][x] is not None:
+                        self[x, y].closest_visible_seats.append(closest_seats[y][x])
 
     def problem_1(self):
         """Perform an turn update until nothing changes"""
-        while True:
-            [spot.guess_next_status("adjacent_spots", 4) for spot in self.spots]
-            [spot.apply_next_status() for spot in self.spots]
-            if all(not spot.has_changed for spot in self.spots):
-                break
+        self.run_until_stable("adjacent_spots", 4)
 
     def problem_2(self):
         """Perform an turn update until nothing changes"""
-        while True:
-            [spot.guess_next_status("closest_visible_seats", 5) for spot in self.spots]
-            [spot.apply_next_status() for spot in self.spots]
-            if all(not spot.has_changed for spot in self.spots):
-                break
+        self.run_until_stable("closest_visible_seats", 5)
 
-    @property
-    def spots(self):
+    def run_until_stable(self, spot_referential, threshold):
         """
+        Performs turn updates until nothing changes
+        A seat can only change if one of its related seats changed during the
+        previous turn, so only those are evaluated again. Related seats go both ways,
+        so the seats to evaluate are the ones related to the changed seats
+        :param str spot_referential: The attribute storing the related seats
+        :param int threshold: Amount of related occupied seats for the seat to be freed
+        """
+        dirty_spots = [spot for spot in self.spots if spot.is_seat]
+        while len(dirty_spots) > 0:
+            for spot in dirty_spots:
+                spot.guess_next_status(spot_referential, threshold)
+            for spot in dirty_spots:
+                spot.apply_next_status()
+            next_dirty_spots = set()
+            for spot in dirty_spots:
+                if spot.has_changed:
+                    next_dirty_spots.add(spot)
+                    next_dirty_spots.update(getattr(spot, spot_referential))
+            dirty_spots = [spot for spot in next_dirty_spots if spot.is_seat]
+
+    def compute_spots(self):
+        """
+        The list never changes, so it is built once and stored as `spots`
         :return: List of all spots from left to right, top to bottom
         :rtype: [Spot]
         """
@@ -248,20 +242,190 @@ class Spot:
         }
 
 
+class SeatLayout:
+    """Seats stored in NumPy arrays, where all the seats are updated at once"""
+
+    def __init__(self, cells):
+        """
+        Creates the layout and precomputes the closest visible seats of each seat
+        :param numpy.ndarray cells: 2d array of FLOOR, EMPTY and OCCUPIED values
+        """
+        self.grid = Grid2D(cells)
+        self.seat_positions = np.flatnonzero(self.grid.cells != FLOOR)
+        self.visible_seats = self.compute_visible_seats()
+
+    @classmethod
+    def from_lines(cls, lines):
+        """
+        :param [str] lines: Lines from the input file
+        :return: The layout of the seats
+        :rtype: SeatLayout
+        """
+        return cls(Grid2D.from_lines(lines, SYMBOLS).cells)
+
+    def to_lines(self):
+        """
+        :return: The layout as lines, like in the input file
+        :rtype: [str]
+        """
+        return self.grid.to_lines(SYMBOLS)
+
+    def compute_visible_seats(self):
+        """
+        For each seat, finds the closest seat in each direction (8 total)
+        Each direction is swept row by row (or column by column when horizontal),
+        starting from the edge the direction points to. The closest seat of a
+        position is its neighbor if it is a seat, otherwise the closest seat
+        of its neighbor, which was computed in the previous row or column
+        :return: Array of shape (8, seats) with the index of each visible seat.
+            The index is the number of seats when no seat is visible
+        :rtype: numpy.ndarray
+        """
+        seat_count = len(self.seat_positions)
+        seat_indexes = np.full(self.grid.shape, -1, dtype=np.int32)
+        seat_indexes.flat[self.seat_positions] = np.arange(seat_count)
+        visible_seats = np.empty((8, seat_count), dtype=np.int32)
+        for direction, (dx, dy) in enumerate(DIRECTIONS):
+            # Horizontal directions are swept like vertical ones, on the transposition
+            indexes = seat_indexes if dy != 0 else seat_indexes.T
+            step, shift = (dy, dx) if dy != 0 else (dx, 0)
+            closest = np.full(indexes.shape, seat_count, dtype=np.int32)
+            lines = (
+                range(indexes.shape[0])
+                if step < 0
+                else range(indexes.shape[0] - 1, -1, -1)
+            )
+            for line in lines:
+                neighbor_line = line + step
+                if not 0 <= neighbor_line < indexes.shape[0]:
+                    continue
+                # Closest seat of each position of the neighbor line, seats included
+                candidates = np.where(
+                    indexes[neighbor_line] >= 0,
+                    indexes[neighbor_line],
+                    closest[neighbor_line],
+                )
+                if shift < 0:
+                    closest[line, 1:] = candidates[:-1]
+                elif shift > 0:
+                    closest[line, :-1] = candidates[1:]
+                else:
+                    closest[line] = candidates
+            closest = closest if dy != 0 else closest.T
+            visible_seats[direction] = closest.flat[self.seat_positions]
+        return visible_seats
+
+    def run_adjacent(self):
+        """
+        Updates all the seats until nothing changes, using the adjacent seats
+        Occupied neighbors are counted with a 3x3 convolution of the whole grid
+        :return: The number of occupied seats once they stop changing
+        :rtype: int
+        """
+        grid = self.grid.copy()
+        is_seat = grid.cells != FLOOR
+        while True:
+            counts = grid.count_neighbors(OCCUPIED)
+            is_occupied = grid.cells == OCCUPIED
+            will_be_occupied = np.where(is_occupied, counts < 4, counts == 0) & is_seat
+            if np.array_equal(will_be_occupied, is_occupied):
+                return grid.count(OCCUPIED)
+            statuses = np.where(will_be_occupied, OCCUPIED, EMPTY)
+            grid.cells = np.where(is_seat, statuses, FLOOR).astype(np.uint8)
+
+    def run_visible(self):
+        """
+        Updates all the seats until nothing changes, using the visible seats
+        Occupied seats are a vector with an extra 0 for "no visible seat", so each
+        turn gathers the states of the visible seats, one direction at a time
+        :return: The number of occupied seats once they stop changing
+        :rtype: int
+        """
+        seat_count = len(self.seat_positions)
+        occupied = np.zeros(seat_count + 1, dtype=np.uint8)
+        occupied[:seat_count] = self.grid.cells.flat[self.seat_positions] == OCCUPIED
+        counts = np.empty(seat_count, dtype=np.uint8)
+        gathered = np.empty(seat_count, dtype=np.uint8)
+        while True:
+            np.take(occupied, self.visible_seats[0], out=counts)
+            for indexes in self.visible_seats[1:]:
+                np.take(occupied, indexes, out=gathered)
+                counts += gathered
+            is_occupied = occupied[:seat_count] == 1
+            will_be_occupied = np.where(is_occupied, counts < 5, counts == 0)
+            if np.array_equal(will_be_occupied, is_occupied):
+                return int(occupied.sum())
+            occupied[:seat_count] = will_be_occupied
+
+
+def run_with_objects(layout, problem):
+    """
+    Runs the seat updates with one Spot instance per position
+    The Spot graph is rebuilt and linked from the layout on each call, so this
+    cost is included in the solving time
+    :param SeatLayout layout: The layout of the seats
+    :param int problem: 1 to use the adjacent seats, 2 to use the visible seats
+    :return: The number of occupied seats once they stop changing
+    :rtype: int
+    """
+    grid = Grid.from_file_content(layout.to_lines())
+    grid.problem_1() if problem == 1 else grid.problem_2()
+    return len([spot for spot in grid.spots if spot.status == Spot.Status.OCCUPIED])
+
+
+def run_with_array(layout, problem):
+    """
+    Runs the seat updates on NumPy arrays
+    :param SeatLayout layout: The layout of the seats
+    :param int problem: 1 to use the adjacent seats, 2 to use the visible seats
+    :return: The number of occupied seats once they stop changing
+    :rtype: int
+    """
+    return layout.run_adjacent() if problem == 1 else layout.run_visible()
+
+
+ENGINES = {"array": run_with_array, "objects": run_with_objects}
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+PARSER_VERSION = 2
+
+
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The layout of the seats, with their visible seats
+    :rtype: SeatLayout
+    """
+    return SeatLayout.from_lines(lines)
+
+
+def solve_part1(layout, engine="array"):
+    """
+    :param SeatLayout layout: The layout of the seats
+    :param str engine: Name of the engine running the updates, from ENGINES
+    :return: The number of occupied seats once they stop changing, adjacent rules
+    :rtype: int
+    """
+    return ENGINES[engine](layout, 1)
+
+
+def solve_part2(layout, engine="array"):
+    """
+    :param SeatLayout layout: The layout of the seats
+    :param str engine: Name of the engine running the updates, from ENGINES
+    :return: The number of occupied seats once they stop changing, visible rules
+    :rtype: int
+    """
+    return ENGINES[engine](layout, 2)
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-file_content = read_input("day_11.txt")
-grid = Grid.from_file_content(file_content)
-
-# Problem 1
-grid.problem_1()
-occupied_spots = [spot for spot in grid.spots if spot.status == Spot.Status.OCCUPIED]
-print(len(occupied_spots))
-grid.reset()
-
-# Problem 2
-grid.problem_2()
-occupied_spots = [spot for spot in grid.spots if spot.status == Spot.Status.OCCUPIED]
-print(len(occupied_spots))
-grid.reset()
+if __name__ == "__main__":
+    layout = parse(read_input("day_11.txt"))
+    print(solve_part1(layout))
+    print(solve_part2(layout))
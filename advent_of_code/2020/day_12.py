@@ -177,19 +177,46 @@ class Ship:
             self.Y += self.waypoint_Y * value
 
 
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The navigation instructions
+    :rtype: [str]
+    """
+    return list(lines)
+
+
+def solve_part1(instructions):
+    """
+    :param [str] instructions: The navigation instructions
+    :return: The manhattan distance of the ship once it moved on its own
+    :rtype: int
+    """
+    ship = Ship()
+    for instruction in instructions:
+        ship.apply_instruction(instruction, 1)
+    return ship.manhattan_distance
+
+
+def solve_part2(instructions):
+    """
+    :param [str] instructions: The navigation instructions
+    :return: The manhattan distance of the ship once it followed the waypoint
+    :rtype: int
+    """
+    ship = Ship()
+    for instruction in instructions:
+        ship.apply_instruction(instruction, 2)
+    return ship.manhattan_distance
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-# Problem 1
-ship = Ship()
-for instruction in read_input("day_12.txt"):
-    ship.apply_instruction(instruction, 1)
-print(ship.X, ship.Y)
-print(ship.manhattan_distance)
-
-# Problem 2
-ship = Ship()
-for instruction in read_input("day_12.txt"):
-    ship.apply_instruction(instruction, 2)
-print(ship.X, ship.Y)
-print(ship.manhattan_distance)
+if __name__ == "__main__":
+    instructions = parse(read_input("day_12.txt"))
+    print(solve_part1(instructions))
+    print(solve_part2(instructions))
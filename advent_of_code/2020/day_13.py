@@ -26,50 +26,6 @@ class Bus:
         return not timestamp % self.id
 
 
-def parse_input(content):
-    earliest_departure = int(content[0])
-    buses = []
-    for index, value in enumerate(content[1].split(",")):
-        if value == "x":
-            continue
-        value = int(value)
-        buses.append(Bus(value, index))
-    return earliest_departure, buses
-
-
-# --------------------------------------------------------------------------------
-# > Main
-# --------------------------------------------------------------------------------
-content = read_input("day_13.txt")
-earliest_departure, buses = parse_input(content)
-
-# Problem 1
-best_bus = None
-best_timestamp = None
-for bus in buses:
-    _, pickup_timestamp = bus.closest_to_timestamp(earliest_departure)
-    if best_timestamp is None or pickup_timestamp < best_timestamp:
-        best_bus = bus
-        best_timestamp = pickup_timestamp
-print(best_bus.id * (best_timestamp - earliest_departure))  # 161
-
-# Problem 2
-# ------------------ Brute force that took way too long ------------------
-# found = False
-# slowest_bus = sorted(buses, key=lambda x: x.id)[-1]
-# i = 0
-# while not found:
-#     timestamp = slowest_bus.id * i - slowest_bus.delta
-#     for bus in buses:
-#         target_timestamp = timestamp + bus.delta
-#         if target_timestamp % bus.id > 0:
-#             break
-#     else:
-#         found = True
-#     i += 1
-# print(timestamp)
-# ------------------------------------------------------------------------
-
 # Totally stolen from rosettacode
 #   Googled "number divided several different modulo"
 #   Found https://math.stackexchange.com/questions/2466179/modular-arithmetic-with-different-mods
@@ -100,6 +56,77 @@ def mul_inv(a, b):
     return x1
 
 
-numbers = [bus.id for bus in buses]
-deltas = [bus.id - bus.delta for bus in buses]
-print(chinese_remainder(numbers, deltas))
+def parse_input(content):
+    earliest_departure = int(content[0])
+    buses = []
+    for index, value in enumerate(content[1].split(",")):
+        if value == "x":
+            continue
+        value = int(value)
+        buses.append(Bus(value, index))
+    return earliest_departure, buses
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The earliest departure and the buses in service
+    :rtype: int, [Bus]
+    """
+    return parse_input(list(lines))
+
+
+def solve_part1(notes):
+    """
+    :param (int, [Bus]) notes: The earliest departure and the buses in service
+    :return: The ID of the earliest bus times the minutes to wait for it
+    :rtype: int
+    """
+    earliest_departure, buses = notes
+    best_bus = None
+    best_timestamp = None
+    for bus in buses:
+        _, pickup_timestamp = bus.closest_to_timestamp(earliest_departure)
+        if best_timestamp is None or pickup_timestamp < best_timestamp:
+            best_bus = bus
+            best_timestamp = pickup_timestamp
+    return best_bus.id * (best_timestamp - earliest_departure)
+
+
+def solve_part2(notes):
+    """
+    :param (int, [Bus]) notes: The earliest departure and the buses in service
+    :return: The earliest timestamp where each bus departs at its offset
+    :rtype: int
+    """
+    # ------------------ Brute force that took way too long ------------------
+    # found = False
+    # slowest_bus = sorted(buses, key=lambda x: x.id)[-1]
+    # i = 0
+    # while not found:
+    #     timestamp = slowest_bus.id * i - slowest_bus.delta
+    #     for bus in buses:
+    #         target_timestamp = timestamp + bus.delta
+    #         if target_timestamp % bus.id > 0:
+    #             break
+    #     else:
+    #         found = True
+    #     i += 1
+    # print(timestamp)
+    # ------------------------------------------------------------------------
+    _, buses = notes
+    numbers = [bus.id for bus in buses]
+    deltas = [bus.id - bus.delta for bus in buses]
+    return chinese_remainder(numbers, deltas)
+
+
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+if __name__ == "__main__":
+    notes = parse(read_input("day_13.txt"))
+    print(solve_part1(notes))
+    print(solve_part2(notes))
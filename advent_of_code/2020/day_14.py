@@ -31,7 +31,7 @@ class Program:
         :param [str] instructions: Lines from the daily input file
         :param int problem: The AOC problem to tackle
         """
-        program.reset()
+        self.reset()
         for line in instructions:
             mask_match = re.match(MASK_REGEX, line)
             if mask_match is not None:
@@ -128,15 +128,43 @@ class Program:
 
 
 # --------------------------------------------------------------------------------
-# > Main
+# > Solutions
 # --------------------------------------------------------------------------------
-instructions = read_input("day_14.txt")
-program = Program()
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The initialization program instructions
+    :rtype: [str]
+    """
+    return list(lines)
+
+
+def solve_part1(instructions):
+    """
+    :param [str] instructions: The initialization program instructions
+    :return: The sum of the memory once the mask is applied to the values
+    :rtype: int
+    """
+    program = Program()
+    program.run(instructions, 1)
+    return sum(program.memory.values())
+
+
+def solve_part2(instructions):
+    """
+    :param [str] instructions: The initialization program instructions
+    :return: The sum of the memory once the mask is applied to the addresses
+    :rtype: int
+    """
+    program = Program()
+    program.run(instructions, 2)
+    return sum(program.memory.values())
 
-# Problem 1
-program.run(instructions, 1)
-print(sum(program.memory.values()))
 
-# Problem 2
-program.run(instructions, 2)
-print(sum(program.memory.values()))
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+if __name__ == "__main__":
+    instructions = parse(read_input("day_14.txt"))
+    print(solve_part1(instructions))
+    print(solve_part2(instructions))
@@ -1,6 +1,11 @@
 """Day 15 challenge"""
 
 
+# Built-in
+import os
+import pickle
+from array import array
+
 # Personal
 from _shared import read_input
 
@@ -17,59 +22,171 @@ class Game:
         self.starting_numbers = starting_numbers
         self.reset()
 
-    def play(self, turn_quantity):
+    def play(self, turn_quantity, checkpoint_path=None, checkpoint_every=None):
         """
-        Plays a definite number of turns, including the starting turns
+        Plays until a definite number of turns, including the starting turns
+        The starting turns are always all played, even when asked for fewer turns
+        The game continues from its current turn, and only restarts when asked for
+        an earlier turn.
+        Only the last turn of each number is kept, in a table indexed by number.
+        Numbers are always smaller than the turn count, so the table grows with the
+        turn count, with 4 bytes per turn
         :param int turn_quantity: Number of turns to play
+        :param str checkpoint_path: If provided, the game is saved there periodically
+        :param int checkpoint_every: Number of turns between two checkpoints
         """
-        self.reset()
-        self.play_starting_numbers()
+        if turn_quantity < self.turn:
+            self.reset()
+        self.reserve(turn_quantity)
+        if self.turn == 0:
+            self.play_starting_numbers()
+        step = checkpoint_every or turn_quantity
         while self.turn < turn_quantity:
-            self.turn += 1
-            if self.last_number in self.history_map:
-                turn_list = self.history_map[self.last_number]
-                if len(turn_list) == 1:
-                    self.say_number(0)
-                else:
-                    n = turn_list[-1] - turn_list[-2]
-                    self.say_number(n)
-            else:
-                self.say_number(0)
-
-    def say_number(self, n):
-        """
-        The number the player will say
-        Updates the `last_number` and adds the turn to this number's history
-        :param int n: The number to say
-        """
-        self.last_number = n
-        turn_list = self.history_map.get(n, [])
-        turn_list.append(self.turn)
-        self.history_map[n] = turn_list
+            self.play_turns(min(self.turn + step, turn_quantity))
+            if checkpoint_path is not None:
+                self.save_checkpoint(checkpoint_path)
+
+    def play_turns(self, turn_quantity):
+        """
+        Plays from the current turn until the given turn, the table being large enough
+        :param int turn_quantity: Number of turns to reach
+        """
+        last_seen = self.last_seen
+        last_number = self.last_number
+        # At each turn, we store when the previous number was said, then say the next
+        for turn in range(self.turn, turn_quantity):
+            previous_turn = last_seen[last_number]
+            last_seen[last_number] = turn
+            last_number = turn - previous_turn if previous_turn else 0
+        self.turn = turn_quantity
+        self.last_number = last_number
+
+    def play_until(self, targets):
+        """
+        Plays once through all the targets, recording the number said at each of them
+        The targets during the starting turns are read from the starting numbers
+        :param [int] targets: The turns we want the numbers of, starting at 1
+        :raises ValueError: If a target is before the first turn
+        :return: The number said at each target turn
+        :rtype: {int: int}
+        """
+        numbers = {}
+        for target in sorted(targets):
+            if target < 1:
+                raise ValueError(f"Turns start at 1, got {target}")
+            if target <= len(self.starting_numbers):
+                numbers[target] = self.starting_numbers[target - 1]
+                continue
+            self.play(target)
+            numbers[target] = self.last_number
+        return numbers
 
     def play_starting_numbers(self):
-        """Plays the starting number of the game by saying them"""
-        for value in self.starting_numbers:
+        """
+        Plays the starting number of the game by saying them
+        The last one is only stored in the table when the next number is said
+        """
+        for value in self.starting_numbers[:-1]:
             self.turn += 1
-            self.say_number(value)
+            self.last_seen[value] = self.turn
+        self.turn += 1
+        self.last_number = self.starting_numbers[-1]
+
+    def reserve(self, turn_quantity):
+        """
+        Grows the last-seen table so that it can hold the numbers of all the turns
+        :param int turn_quantity: Number of turns the table must support
+        """
+        size = max([turn_quantity] + self.starting_numbers) + 1
+        missing = size - len(self.last_seen)
+        if missing > 0 and len(self.last_seen) == 0:
+            self.last_seen = array("I", [0]) * size
+        elif missing > 0:
+            self.last_seen.extend(array("I", [0]) * missing)
 
     def reset(self):
         """Resets the game state"""
         self.turn = 0
-        self.history_map = {}
+        self.last_seen = array("I")
         self.last_number = None
 
+    def save_checkpoint(self, path):
+        """
+        Saves the whole game state, so that a long game can be resumed later
+        Only built-in types are stored, so the checkpoint does not depend on how
+        this module was imported (as a script or by the runner).
+        The file is written then renamed, so an interrupted save never corrupts it
+        :param str path: Path of the checkpoint file
+        """
+        state = {
+            "starting_numbers": list(self.starting_numbers),
+            "turn": self.turn,
+            "last_number": self.last_number,
+            "typecode": self.last_seen.typecode,
+            "last_seen": self.last_seen.tobytes(),
+        }
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def load_checkpoint(path):
+        """
+        :param str path: Path of a checkpoint file
+        :return: The saved game, ready to continue from its last turn
+        :rtype: Game
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        game = Game(state["starting_numbers"])
+        game.turn = state["turn"]
+        game.last_number = state["last_number"]
+        game.last_seen = array(state["typecode"])
+        game.last_seen.frombytes(state["last_seen"])
+        return game
+
 
 # --------------------------------------------------------------------------------
-# > Main
+# > Solutions
 # --------------------------------------------------------------------------------
-starting_numbers = [int(value) for value in read_input("day_15.txt")[0].split(",")]
-game = Game(starting_numbers)
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The starting numbers of the game
+    :rtype: [int]
+    """
+    return [int(value) for value in next(iter(lines)).split(",")]
 
-# Problem 1
-game.play(2020)
-print(game.last_number)
 
-# Problem 2
-game.play(30000000)
-print(game.last_number)
+def solve_part1(starting_numbers):
+    """
+    :param [int] starting_numbers: The starting numbers of the game
+    :return: The 2020th number spoken
+    :rtype: int
+    """
+    game = Game(starting_numbers)
+    game.play(2020)
+    return game.last_number
+
+
+def solve_part2(starting_numbers):
+    """
+    :param [int] starting_numbers: The starting numbers of the game
+    :return: The 30000000th number spoken
+    :rtype: int
+    """
+    game = Game(starting_numbers)
+    game.play(30000000)
+    return game.last_number
+
+
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+if __name__ == "__main__":
+    starting_numbers = parse(read_input("day_15.txt"))
+    # Both answers in a single game
+    numbers = Game(starting_numbers).play_until([2020, 30000000])
+    print(numbers[2020])
+    print(numbers[30000000])
@@ -2,7 +2,6 @@
 
 # Built-in
 import re
-from time import perf_counter
 
 # Personal
 from _shared import read_input
@@ -76,67 +75,89 @@ class Ticket:
 
 
 # --------------------------------------------------------------------------------
-# > Main
+# > Solutions
 # --------------------------------------------------------------------------------
-# Setup
-start = perf_counter()
-form = Form()
-tickets = []
-my_ticket = None
-
-# Parsing
-section = 0
-for line in read_input("day_16.txt"):
-    if line == "":
-        section += 1
-        continue
-    if section == 0:
-        form.add_rule(line)
-    else:
-        title = re.match(TITLE_REGEX, line)
-        if title is None:
-            values = [int(value) for value in line.split(",")]
-            ticket = Ticket(form, values)
-            if section == 1:
-                my_ticket = ticket
-            tickets.append(ticket)
-
-# ----- Problem 1 -----
-invalid_tickets = [t for t in tickets if t.is_completely_invalid]
-total = sum(sum(t.completely_invalid_values) for t in invalid_tickets)
-print(total)
-
-# ----- Problem 2 -----
-# Check which field would work on which index(es)
-valid_tickets = [t for t in tickets if not t.is_completely_invalid]
-valid_indexes_per_field = []
-field_quantity = len(form.rules)
-for fieldname, ranges in form.rules.items():
-    valid_indexes = set()
-    min_1, max_1, min_2, max_2 = ranges
-    for i in range(field_quantity):
-        for ticket in valid_tickets:
-            value = ticket.values[i]
-            if not (min_1 <= value <= max_1 or min_2 <= value <= max_2):
-                break
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The form with its rules, all the tickets, and our ticket
+    :rtype: Form, [Ticket], Ticket
+    """
+    form = Form()
+    tickets = []
+    my_ticket = None
+    section = 0
+    for line in lines:
+        if line == "":
+            section += 1
+            continue
+        if section == 0:
+            form.add_rule(line)
         else:
-            valid_indexes.add(i)
-    valid_indexes_per_field.append((fieldname, valid_indexes))
-
-# We guess which index would work based on the other fields valid indexes
-valid_indexes_per_field.sort(key=lambda x: len(x[1]), reverse=True)
-field_index_tuples = []
-for i in range(len(valid_indexes_per_field) - 1):
-    name, current_set = valid_indexes_per_field[i]
-    _, next_subset = valid_indexes_per_field[i + 1]
-    field_index_tuples.append((name, current_set.difference(next_subset).pop()))
-
-# We compute our response
-departure_indexes = [i for f, i in field_index_tuples if f.startswith("departure")]
-total = 1
-for i in departure_indexes:
-    total *= my_ticket.values[i]
-print(total)
-
-end = perf_counter()
-print(end - start)
+            title = re.match(TITLE_REGEX, line)
+            if title is None:
+                values = [int(value) for value in line.split(",")]
+                ticket = Ticket(form, values)
+                if section == 1:
+                    my_ticket = ticket
+                tickets.append(ticket)
+    return form, tickets, my_ticket
+
+
+def solve_part1(notes):
+    """
+    :param (Form, [Ticket], Ticket) notes: The form, all the tickets, and our ticket
+    :return: The sum of the values that match no rule at all
+    :rtype: int
+    """
+    _, tickets, _ = notes
+    invalid_tickets = [t for t in tickets if t.is_completely_invalid]
+    return sum(sum(t.completely_invalid_values) for t in invalid_tickets)
+
+
+def solve_part2(notes):
+    """
+    :param (Form, [Ticket], Ticket) notes: The form, all the tickets, and our ticket
+    :return: The product of the 'departure' fields of our ticket
+    :rtype: int
+    """
+    form, tickets, my_ticket = notes
+    # Check which field would work on which index(es)
+    valid_tickets = [t for t in tickets if not t.is_completely_invalid]
+    valid_indexes_per_field = []
+    field_quantity = len(form.rules)
+    for fieldname, ranges in form.rules.items():
+        valid_indexes = set()
+        min_1, max_1, min_2, max_2 = ranges
+        for i in range(field_quantity):
+            for ticket in valid_tickets:
+                value = ticket.values[i]
+                if not (min_1 <= value <= max_1 or min_2 <= value <= max_2):
+                    break
+            else:
+                valid_indexes.add(i)
+        valid_indexes_per_field.append((fieldname, valid_indexes))
+
+    # We guess which index would work based on the other fields valid indexes
+    valid_indexes_per_field.sort(key=lambda x: len(x[1]), reverse=True)
+    field_index_tuples = []
+    for i in range(len(valid_indexes_per_field) - 1):
+        name, current_set = valid_indexes_per_field[i]
+        _, next_subset = valid_indexes_per_field[i + 1]
+        field_index_tuples.append((name, current_set.difference(next_subset).pop()))
+
+    # We compute our response
+    departure_indexes = [i for f, i in field_index_tuples if f.startswith("departure")]
+    total = 1
+    for i in departure_indexes:
+        total *= my_ticket.values[i]
+    return total
+
+
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+if __name__ == "__main__":
+    notes = parse(read_input("day_16.txt"))
+    print(solve_part1(notes))
+    print(solve_part2(notes))
@@ -2,36 +2,49 @@
 
 
 # Built-in
+from collections import Counter
+from functools import lru_cache
 from itertools import product
-from time import perf_counter
+from math import factorial
 
 # Personal
-from _shared import read_input
+from _grid import GridND, neighbor_offsets
+from _shared import Progress, read_input
 
 
 # --------------------------------------------------------------------------------
 # > Helpers
 # --------------------------------------------------------------------------------
+CYCLES = 6
+
+
 class Grid:
     def __init__(self, cubes):
         """
         Creates a grid with stupid cubes
-        :param {Cubes} cubes: Initial cubes that make the grid
+        :param {Cube} cubes: Initial cubes that make the grid
         """
         self.cubes = {cube.coordinates: cube for cube in cubes}
         self.cycle = 0
 
-    def run_cycles(self, n):
+    def run_cycles(self, n, progress_callback=None):
         """
         Run N cycle of the grid, meaning we expand the grid each time and update our cubes
         :param int n: Number of cycles to run
+        :param function progress_callback: Receives the cubes updated and their rate
         """
+        progress = Progress(progress_callback, "cells")
+        cells = 0
         for i in range(n):
             self.cycle += 1
             self.expand()
             self.update_cubes()
-            active_cubes = [cube for cube in self.cubes.values() if cube.active]
-            print(len(self.cubes), len(active_cubes))
+            cells += len(self.cubes)
+            # Counting the active cubes is a full pass, only done when reported
+            if progress.callback is not None:
+                progress.update(cells, cycle=self.cycle, active=self.active_count)
+        if progress.callback is not None:
+            progress.finish(cells, cycle=self.cycle, active=self.active_count)
 
     def expand(self):
         """Generate cubes for active cubes that have missing neighbors"""
@@ -39,8 +52,7 @@ class Grid:
         for cube in active_cubes:
             for coordinates in cube.neighbor_coordinates:
                 if coordinates not in self.cubes:
-                    x, y, z, w = coordinates
-                    self.cubes[(x, y, z, w)] = Cube(x, y, z, w, False)
+                    self.cubes[coordinates] = Cube(coordinates, False)
 
     def update_cubes(self):
         """For each of our cube, computes the next state and then update them"""
@@ -49,18 +61,23 @@ class Grid:
         for cube in self.cubes.values():
             cube.update()
 
+    @property
+    def active_count(self):
+        """
+        :return: The number of active cubes in the grid
+        :rtype: int
+        """
+        return len([cube for cube in self.cubes.values() if cube.active])
+
 
 class Cube:
-    def __init__(self, x, y, z, w, active):
+    def __init__(self, coordinates, active):
         """
         Stupid and annoying cube lost in space
-        :param int x: X coordinates of the cube
-        :param int y: Y coordinates of the cube
-        :param int z: Z coordinates of the cube
-        :param int w: W coordinates of the cube
+        :param (int) coordinates: Coordinates of the cube, one per dimension
         :param bool active: Whether the cube starts active
         """
-        self.coordinates = (x, y, z, w)
+        self.coordinates = coordinates
         self.active = active
         self.neighbor_coordinates = self.compute_neighbor_coordinates()
         self.neighbors = set()
@@ -69,16 +86,19 @@ class Cube:
     def compute_neighbor_coordinates(self):
         """
         Generates all coordinates within 1 of any of our cube's dimensions
-        :return: Set of (x, y, z, w) coordinates
+        :return: Set of coordinates, with as many dimensions as our cube
         :rtype: set
         """
         coordinates = set()
-        x, y, z, w = self.coordinates
-        for x_delta, y_delta, z_delta, w_delta in product([-1, 0, 1], repeat=4):
-            if x_delta == y_delta == z_delta == w_delta == 0:
+        for deltas in product([-1, 0, 1], repeat=len(self.coordinates)):
+            if not any(deltas):
                 continue
             else:
-                coordinates.add((x + x_delta, y + y_delta, z + z_delta, w + w_delta))
+                coordinates.add(
+                    tuple(
+                        value + delta for value, delta in zip(self.coordinates, deltas)
+                    )
+                )
         return coordinates
 
     def compute_next_state(self, grid):
@@ -103,7 +123,7 @@ class Cube:
         If we already have all of our neighbors, does nothing
         :param Grid grid: The grid that holds our neighbors
         """
-        if len(self.neighbors) < 80:
+        if len(self.neighbors) < len(self.neighbor_coordinates):
             neighbors = set()
             for coordinates in self.neighbor_coordinates:
                 if coordinates in grid.cubes:
@@ -117,28 +137,240 @@ class Cube:
             self.state_will_change = False
 
 
+def build_grid(content, dimensions):
+    """
+    Creates the cubes from the initial 2d slice, then the grid that holds them
+    We make sure our coordinates are centered around 0
+    :param [str] content: The initial 2d slice, row by row
+    :param int dimensions: Number of dimensions of the grid
+    :return: The grid with the initial cubes
+    :rtype: Grid
+    """
+    length = len(content)
+    min_ = -int(length / 2)
+    max_ = int(length / 2)
+    padding = (0,) * (dimensions - 2)
+    cubes = set()
+    for x, line in zip(range(min_, max_ + 1), content):
+        for y, char in zip(range(min_, max_ + 1), line):
+            active = char == "#"
+            cube = Cube((x, y) + padding, active)
+            cubes.add(cube)
+    return Grid(cubes)
+
+
+def run_with_objects(content, dimensions, cycles, progress_callback=None):
+    """
+    Runs the cycles with one Cube instance per cell
+    :param [str] content: The initial 2d slice, row by row
+    :param int dimensions: Number of dimensions of the grid
+    :param int cycles: Number of cycles to run
+    :param function progress_callback: Receives the cubes updated and their rate
+    :return: The number of active cubes after the cycles
+    :rtype: int
+    """
+    grid = build_grid(content, dimensions)
+    grid.run_cycles(cycles, progress_callback)
+    return grid.active_count
+
+
+def run_with_array(content, dimensions, cycles, progress_callback=None):
+    """
+    Runs the cycles on a NumPy array, with all the cubes updated at once
+    :param [str] content: The initial 2d slice, row by row
+    :param int dimensions: Number of dimensions of the grid
+    :param int cycles: Number of cycles to run
+    :param function progress_callback: Receives the cubes updated and their rate
+    :return: The number of active cubes after the cycles
+    :rtype: int
+    """
+    grid = GridND.from_lines(content, {"#": 1}, dimensions)
+    progress = Progress(progress_callback, "cells")
+    cells = 0
+    for cycle in range(1, cycles + 1):
+        grid.step(born=[3], survive=[2, 3])
+        cells += grid.cells.size
+        progress.update(cells, cycle=cycle)
+    active_count = grid.count()
+    progress.finish(cells, cycle=cycles, active=active_count)
+    return active_count
+
+
+def run_with_active_set(content, dimensions, cycles, progress_callback=None):
+    """
+    Runs the cycles on the set of active coordinates only
+    Each active cube adds one hit to each of its neighbors, and the hits decide the
+    next active cubes. Memory only grows with the active cubes and their neighbors,
+    which keeps 5 or 6 dimensions tractable.
+    Coordinates are packed into a single integer, with enough room for the cubes
+    to spread during the cycles, so moving to a neighbor is a single addition
+    :param [str] content: The initial 2d slice, row by row
+    :param int dimensions: Number of dimensions of the grid
+    :param int cycles: Number of cycles to run
+    :param function progress_callback: Receives the cubes updated and their rate
+    :return: The number of active cubes after the cycles
+    :rtype: int
+    """
+    radix = 2 * (max(len(content), len(content[0])) + cycles + 1)
+    weights = [radix**i for i in range(dimensions)]
+    origin = sum(radix // 2 * weight for weight in weights)
+    deltas = [
+        sum(delta * weight for delta, weight in zip(offset, weights))
+        for offset in neighbor_offsets(dimensions)
+    ]
+    active_cubes = {
+        origin + x * weights[0] + y * weights[1]
+        for y, line in enumerate(content)
+        for x, char in enumerate(line)
+        if char == "#"
+    }
+    progress = Progress(progress_callback, "cells")
+    cells = 0
+    for cycle in range(1, cycles + 1):
+        hits = Counter(cube + delta for cube in active_cubes for delta in deltas)
+        active_cubes = {
+            cube
+            for cube, count in hits.items()
+            if count == 3 or (count == 2 and cube in active_cubes)
+        }
+        cells += len(hits)
+        progress.update(cells, cycle=cycle)
+    progress.finish(cells, cycle=cycles, active=len(active_cubes))
+    return len(active_cubes)
+
+
+def canonicalize(extra):
+    """
+    The cubes start on the z=0, w=0... plane, so flipping the sign of those extra
+    coordinates, or swapping them, gives cubes that always share the same state
+    :param (int) extra: The coordinates of a cube beyond x and y
+    :return: The same coordinates, positive and sorted
+    :rtype: (int)
+    """
+    return tuple(sorted(abs(value) for value in extra))
+
+
+@lru_cache(maxsize=None)
+def get_multiplicity(extra):
+    """
+    :param (int) extra: Canonical coordinates of a cube beyond x and y
+    :return: The number of cubes sharing these coordinates once canonicalized
+    :rtype: int
+    """
+    multiplicity = factorial(len(extra)) * 2 ** sum(1 for value in extra if value)
+    for count in Counter(extra).values():
+        multiplicity //= factorial(count)
+    return multiplicity
+
+
+@lru_cache(maxsize=None)
+def get_canonical_neighbors(extra):
+    """
+    :param (int) extra: Canonical coordinates of a cube beyond x and y
+    :return: For each offset in the extra dimensions, the canonical coordinates
+        reached and whether the offset is null
+    :rtype: [((int), bool)]
+    """
+    return [
+        (
+            canonicalize(value + delta for value, delta in zip(extra, offset)),
+            any(offset),
+        )
+        for offset in product([-1, 0, 1], repeat=len(extra))
+    ]
+
+
+def run_with_symmetry(content, dimensions, cycles, progress_callback=None):
+    """
+    Runs the cycles on the active cubes with canonical coordinates only
+    Each canonical cube stands for all the cubes it was canonicalized from
+    (its multiplicity). For a cube A, counting its neighbors B that canonicalize
+    into C, times the multiplicity of A, then dividing by the multiplicity of C,
+    gives the number of active cubes that C has around it
+    :param [str] content: The initial 2d slice, row by row
+    :param int dimensions: Number of dimensions of the grid
+    :param int cycles: Number of cycles to run
+    :param function progress_callback: Receives the cubes updated and their rate
+    :return: The number of active cubes after the cycles
+    :rtype: int
+    """
+    origin = (0,) * (dimensions - 2)
+    active_cubes = {
+        (x, y, origin)
+        for y, line in enumerate(content)
+        for x, char in enumerate(line)
+        if char == "#"
+    }
+    plane_offsets = list(product([-1, 0, 1], repeat=2))
+    progress = Progress(progress_callback, "cells")
+    cells = 0
+    for cycle in range(1, cycles + 1):
+        hits = Counter()
+        for x, y, extra in active_cubes:
+            multiplicity = get_multiplicity(extra)
+            for neighbor_extra, has_moved in get_canonical_neighbors(extra):
+                for dx, dy in plane_offsets:
+                    if has_moved or dx or dy:
+                        hits[(x + dx, y + dy, neighbor_extra)] += multiplicity
+        next_active_cubes = set()
+        for cube, count in hits.items():
+            count //= get_multiplicity(cube[2])
+            if count == 3 or (count == 2 and cube in active_cubes):
+                next_active_cubes.add(cube)
+        active_cubes = next_active_cubes
+        cells += len(hits)
+        progress.update(cells, cycle=cycle)
+    active_count = sum(get_multiplicity(extra) for _, _, extra in active_cubes)
+    progress.finish(cells, cycle=cycles, active=active_count)
+    return active_count
+
+
+ENGINES = {
+    "array": run_with_array,
+    "objects": run_with_objects,
+    "sparse": run_with_active_set,
+    "symmetric": run_with_symmetry,
+}
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The initial 2d slice, row by row
+    :rtype: [str]
+    """
+    return list(lines)
+
+
+def solve_part1(content, engine="array", progress_callback=None):
+    """
+    :param [str] content: The initial 2d slice, row by row
+    :param str engine: Name of the engine running the cycles, from ENGINES
+    :param function progress_callback: Receives the progress of the cycles
+    :return: The number of active cubes after 6 cycles in 3 dimensions
+    :rtype: int
+    """
+    return ENGINES[engine](content, 3, CYCLES, progress_callback)
+
+
+def solve_part2(content, engine="array", progress_callback=None):
+    """
+    :param [str] content: The initial 2d slice, row by row
+    :param str engine: Name of the engine running the cycles, from ENGINES
+    :param function progress_callback: Receives the progress of the cycles
+    :return: The number of active cubes after 6 cycles in 4 dimensions
+    :rtype: int
+    """
+    return ENGINES[engine](content, 4, CYCLES, progress_callback)
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-start = perf_counter()
-content = read_input("day_17.txt")
-
-# Creates the cubes with the right coordinates
-# We make sure our coordinates are centered around 0
-length = len(content)
-length_range = length - 1 if length % 2 else length
-min_ = -int(length / 2)
-max_ = int(length / 2)
-cubes = set()
-for x, line in zip(range(min_, max_ + 1), content):
-    for y, char in zip(range(min_, max_ + 1), line):
-        active = char == "#"
-        cube = Cube(x, y, 0, 0, active)
-        cubes.add(cube)
-
-# Run the program
-grid = Grid(cubes)
-grid.run_cycles(6)
-
-end = perf_counter()
-print(end - start)
+if __name__ == "__main__":
+    content = parse(read_input("day_17.txt"))
+    print(solve_part1(content))
+    print(solve_part2(content))
@@ -1,11 +1,8 @@
 """Day 18 challenge"""
 
 
-# Built-in
-from time import perf_counter
-
 # Personal
-from _shared import read_input
+from _shared import Progress, read_input
 
 
 # --------------------------------------------------------------------------------
@@ -111,27 +108,54 @@ def solve_substring_with_precedence(text):
     return int(inputs[0])
 
 
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The equations to solve
+    :rtype: [str]
+    """
+    return list(lines)
+
+
+def solve_part1(content, progress_callback=None):
+    """
+    :param [str] content: The equations to solve
+    :param function progress_callback: Receives the equations solved and their rate
+    :return: The sum of the equations, read from left to right
+    :rtype: int
+    """
+    progress = Progress(progress_callback, "equations", len(content))
+    total = 0
+    for i, line in enumerate(content, start=1):
+        total += solve_equation(line, solve_substring_left_to_right)
+        progress.update(i)
+    progress.finish(len(content))
+    return total
+
+
+def solve_part2(content, progress_callback=None):
+    """
+    :param [str] content: The equations to solve
+    :param function progress_callback: Receives the equations solved and their rate
+    :return: The sum of the equations, with additions first
+    :rtype: int
+    """
+    progress = Progress(progress_callback, "equations", len(content))
+    total = 0
+    for i, line in enumerate(content, start=1):
+        total += solve_equation(line, solve_substring_with_precedence)
+        progress.update(i)
+    progress.finish(len(content))
+    return total
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-start = perf_counter()
-content = read_input("day_18.txt")
-
-# Problem 1
-total = 0
-for line in content:
-    value = solve_equation(line, solve_substring_left_to_right)
-    print(f"{line} = {value}")
-    total += value
-print(total)
-
-# Problem 2
-total = 0
-for line in content:
-    value = solve_equation(line, solve_substring_with_precedence)
-    print(f"{line} = {value}")
-    total += value
-print(total)
-
-end = perf_counter()
-print(end - start)
+if __name__ == "__main__":
+    content = parse(read_input("day_18.txt"))
+    print(solve_part1(content))
+    print(solve_part2(content))
@@ -3,7 +3,6 @@
 
 # Built-in
 import re
-from time import perf_counter
 
 # Personal
 from _shared import read_input
@@ -14,39 +13,41 @@ from _shared import read_input
 RECURSION_LEVEL = 6
 
 
-def compute_rule_regex(rule_id, problem):
+def compute_rule_regex(rule_id, problem, rules, regexes):
     """
     Recursively build regexes based on the given rules
-    Fills the REGEXES dict to avoid computing the same rule several times
+    Fills the regexes dict to avoid computing the same rule several times
     :param str rule_id: ID of the rule we want
     :param int problem: The AOC problem we are doing (1 or 2)
-    :return:
+    :param dict rules: The text of each rule, by rule ID
+    :param dict regexes: The regexes already computed for this problem, by rule ID
+    :return: The regex matching the rule
     :rtype: str
     """
     # Escape case
-    rule = RULES[rule_id]
+    rule = rules[rule_id]
     if rule in "ab":
         return rule
     # Already done
-    if rule_id in REGEXES:
-        return REGEXES[rule_id]
+    if rule_id in regexes:
+        return regexes[rule_id]
     # Special handling of problem 2
     if problem == 2:
         # Repeat rule 42 1 or more times
         if rule_id == "8":
-            result = compute_rule_regex("42", 2) + "+"
-            REGEXES[rule_id] = result
+            result = compute_rule_regex("42", 2, rules, regexes) + "+"
+            regexes[rule_id] = result
             return result
         # Can have several 42s followed by the same amount of 31s
         if rule_id == "11":
-            r1 = compute_rule_regex("42", problem)
-            r2 = compute_rule_regex("31", problem)
+            r1 = compute_rule_regex("42", problem, rules, regexes)
+            r2 = compute_rule_regex("31", problem, rules, regexes)
             quantities = [
                 "{" + str(i) + "}" for i in range(1, RECURSION_LEVEL + 1)
             ]  # DO NOT START AT 0 JFC
             combinaisons = [rf"{r1}{q}{r2}{q}" for q in quantities]
             result = rf"({'|'.join(combinaisons)})"
-            REGEXES[rule_id] = result
+            regexes[rule_id] = result
             return result
     # Recursively build the sub-rules
     groups = rule.split("|")
@@ -54,12 +55,12 @@ def compute_rule_regex(rule_id, problem):
     # Merge using AND
     for group in groups:
         ids = group.strip().split(" ")
-        sub_regexes = [compute_rule_regex(id_, problem) for id_ in ids]
+        sub_regexes = [compute_rule_regex(id_, problem, rules, regexes) for id_ in ids]
         merged_regex = "".join(sub_regexes)
         result.append(merged_regex)
     # Merge using OR
     result = rf"({'|'.join(result)})"
-    REGEXES[rule_id] = result
+    regexes[rule_id] = result
     return result
 
 
@@ -82,30 +83,67 @@ def split_inputs(content):
     return rule_lines, text_lines
 
 
+def count_matching_texts(rules, texts, problem):
+    """
+    :param dict rules: The text of each rule, by rule ID
+    :param [str] texts: The texts to check
+    :param int problem: The AOC problem we are doing (1 or 2)
+    :return: The number of texts that completely match the rule 0
+    :rtype: int
+    """
+    regex = compute_rule_regex("0", problem, rules, {})
+    total = 0
+    for t in texts:
+        if re.fullmatch(regex, t) is not None:
+            total += 1
+    return total
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+PARSER_VERSION = 1
+
+
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The text of each rule by rule ID, and the texts to check
+    :rtype: dict, [str]
+    """
+    raw_rules, texts = split_inputs(lines)
+    rules = {}
+    for input in raw_rules:
+        rule_id, rule_text = input.split(": ")
+        rule_text = re.sub('"', "", rule_text)
+        rules[rule_id] = rule_text
+    return rules, texts
+
+
+def solve_part1(notes):
+    """
+    :param (dict, [str]) notes: The text of each rule, and the texts to check
+    :return: The number of texts matching the rule 0
+    :rtype: int
+    """
+    rules, texts = notes
+    return count_matching_texts(rules, texts, 1)
+
+
+def solve_part2(notes):
+    """
+    :param (dict, [str]) notes: The text of each rule, and the texts to check
+    :return: The number of texts matching the rule 0, with the looping rules
+    :rtype: int
+    """
+    rules, texts = notes
+    return count_matching_texts(rules, texts, 2)
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-# Initialization
-start = perf_counter()
-content = read_input("day_19.txt")
-raw_rules, texts = split_inputs(content)
-
-# Builds rules dict
-RULES = {}
-REGEXES = {}
-for input in raw_rules:
-    rule_id, rule_text = input.split(": ")
-    rule_text = re.sub('"', "", rule_text)
-    RULES[rule_id] = rule_text
-
-# Problem 1 or 2
-regex = compute_rule_regex("0", 2)
-total = 0
-for t in texts:
-    if re.fullmatch(regex, t) is not None:
-        total += 1
-print(total)
-
-# Terminate
-end = perf_counter()
-print(end - start)
+if __name__ == "__main__":
+    notes = parse(read_input("day_19.txt"))
+    print(solve_part1(notes))
+    print(solve_part2(notes))
@@ -2,10 +2,9 @@
 
 # Built-in
 import re
-from time import perf_counter
 
 # Personal
-from _shared import read_input
+from _shared import group_records, read_input
 
 
 # --------------------------------------------------------------------------------
@@ -142,190 +141,6 @@ def rotate_grid_90_deg(grid):
     return ["".join(row) for row in reverted]
 
 
-# --------------------------------------------------------------------------------
-# > Main
-# --------------------------------------------------------------------------------
-# Initialization
-start = perf_counter()
-content = read_input("day_20.txt")
-
-# Build cameras
-cameras = []
-acc = []
-line_count = len(content)
-for i, line in enumerate(content):
-    if i + 1 == line_count:
-        acc.append(line)
-        camera = Camera.from_file_content(acc)
-        cameras.append(camera)
-    if line == "":
-        camera = Camera.from_file_content(acc)
-        cameras.append(camera)
-        acc = []
-    else:
-        acc.append(line)
-
-# >>> Problem 1
-for camera in cameras:
-    camera.find_possible_neighbors(cameras)
-corner_camera_ids = [c.id for c in cameras if len(c.possible_neighbors) == 2]
-
-# >>> Problem 2:
-# COMPUTE THE GRID PLACEMENTS
-corner_cameras = [c for c in cameras if len(c.possible_neighbors) == 2]
-start_camera = corner_cameras[0]
-for start_grid_index in range(len(start_camera.grids)):
-    try:
-        camera_map = {camera.id: camera for camera in cameras}
-        grid = []
-        row_grid = []
-        row = 0
-        col = 0
-        last_camera = None
-        last_row_index = None  # Computed at the end of the first row
-        while len(camera_map) > 0:
-            # --- First turn ---
-            if len(grid) == 0 and len(row_grid) == 0:
-                start_camera.def_grid = start_camera.grids[start_grid_index]
-                row_grid.append(start_camera)
-                del camera_map[start_camera.id]
-                last_camera = start_camera
-                col += 1
-                continue
-
-            remaining_neighbors = [
-                c for c in last_camera.possible_neighbors if c.id in camera_map
-            ]
-
-            # --- First or last row ---
-            if row == 0 or row == last_row_index:
-                next_camera = [
-                    c for c in remaining_neighbors if len(c.possible_neighbors) <= 3
-                ][0]
-
-                if len(row_grid) == 0:
-                    next_camera.compute_def_grid_top_match(last_camera)
-                else:
-                    next_camera.compute_def_grid_left_match(row_grid[col - 1])
-
-                # Not the corner yet
-                if len(next_camera.possible_neighbors) == 3:
-                    row_grid.append(next_camera)
-                    del camera_map[next_camera.id]
-                    last_camera = next_camera
-                    col += 1
-                    continue
-                # We've reached the corner, but start or end?
-                if len(next_camera.possible_neighbors) == 2:
-                    row_grid.append(next_camera)
-                    del camera_map[next_camera.id]
-                    # Start of the line
-                    if col == 0:
-                        last_camera = next_camera
-                        col += 1
-                        continue
-                    # End of the line
-                    else:
-                        grid.append(row_grid)
-                        last_camera = row_grid[0]
-                        last_row_index = int(len(cameras) / len(row_grid)) - 1
-                        row_grid = []
-                        row += 1
-                        col = 0
-                        continue
-            # --- Middle row ---
-            # Start of the line
-            if col == 0:
-                next_camera = remaining_neighbors[0]
-                next_camera.compute_def_grid_top_match(last_camera)
-                last_camera = next_camera
-                row_grid.append(next_camera)
-                del camera_map[next_camera.id]
-                col += 1
-                continue
-            # Rest
-            else:
-                above_camera = grid[row - 1][col]
-                next_camera = [
-                    c for c in above_camera.possible_neighbors if c.id in camera_map
-                ][0]
-
-                if len(row_grid) == 0:
-                    next_camera.compute_def_grid_top_match(last_camera)
-                else:
-                    next_camera.compute_def_grid_left_match(row_grid[col - 1])
-
-                row_grid.append(next_camera)
-                del camera_map[next_camera.id]
-                # Not the end of the line
-                if len(next_camera.possible_neighbors) == 4:
-                    col += 1
-                    last_camera = next_camera
-                # End of the line
-                else:
-                    last_camera = row_grid[0]
-                    col = 0
-                    row += 1
-                    grid.append(row_grid)
-                    row_grid = []
-                continue
-        print("FOUND A VALID PATTERN")
-        break
-    except Exception as e:
-        print(e)
-        continue
-
-# Remove the borders of each tile for the valid grid
-for row in grid:
-    for camera in row:
-        camera.compute_cut_def_grid()
-
-# We might have built the grid invertedly, so just in case let's handle both cases
-grid_mirror = mirror_from_grid(grid)
-
-# Merge tile rows together
-photo_height = len(grid[0][0].cut_def_grid)
-text_rows = []
-for row in grid:
-    for i in range(photo_height):
-        text = ""
-        for camera in row:
-            text += camera.cut_def_grid[i]
-        text_rows.append(text)
-mirror_text_rows = []
-for row in grid_mirror:
-    for i in range(photo_height):
-        text = ""
-        for camera in row:
-            text += camera.cut_def_grid[i]
-        mirror_text_rows.append(text)
-
-# Create all text variations by rotating and flipping
-text_variations = []
-text_1 = text_rows.copy()
-text_2 = rotate_grid_90_deg(text_1)
-text_3 = rotate_grid_90_deg(text_2)
-text_4 = rotate_grid_90_deg(text_3)
-mirror_1 = mirror_text_rows.copy()
-mirror_2 = rotate_grid_90_deg(mirror_1)
-mirror_3 = rotate_grid_90_deg(mirror_2)
-mirror_4 = rotate_grid_90_deg(mirror_3)
-for variation in [
-    text_1,
-    text_2,
-    text_3,
-    text_4,
-    mirror_1,
-    mirror_2,
-    mirror_3,
-    mirror_4,
-]:
-    top_flipped = top_flip_grid_of_strings(variation)
-    variation = [list(row) for row in variation.copy()]
-    top_flipped = [list(row) for row in top_flipped.copy()]
-    text_variations.append(variation)
-    text_variations.append(top_flipped)
-
 # The relative indexes to look for, for the pattern
 INDEXES_TO_CHECK = (
     (0, 0),
@@ -345,14 +160,193 @@ INDEXES_TO_CHECK = (
     (-2, 2),
 )
 
-# One of our text should have the pattern (once or more)
-valid_texts = []
-for text in text_variations:
+
+def link_cameras(cameras):
+    """
+    Finds the possible neighbors of each camera, based on their borders
+    :param [Camera] cameras: All the cameras
+    """
+    for camera in cameras:
+        camera.find_possible_neighbors(cameras)
+
+
+def place_cameras(cameras):
+    """
+    Computes the placement of each camera in the final grid, starting from a corner
+    Every orientation of the starting corner is tried until a valid grid is built
+    :param [Camera] cameras: All the cameras, already linked to their neighbors
+    :return: The cameras, row by row
+    :rtype: [[Camera]]
+    """
+    corner_cameras = [c for c in cameras if len(c.possible_neighbors) == 2]
+    start_camera = corner_cameras[0]
+    for start_grid_index in range(len(start_camera.grids)):
+        try:
+            camera_map = {camera.id: camera for camera in cameras}
+            grid = []
+            row_grid = []
+            row = 0
+            col = 0
+            last_camera = None
+            last_row_index = None  # Computed at the end of the first row
+            while len(camera_map) > 0:
+                # --- First turn ---
+                if len(grid) == 0 and len(row_grid) == 0:
+                    start_camera.def_grid = start_camera.grids[start_grid_index]
+                    row_grid.append(start_camera)
+                    del camera_map[start_camera.id]
+                    last_camera = start_camera
+                    col += 1
+                    continue
+
+                remaining_neighbors = [
+                    c for c in last_camera.possible_neighbors if c.id in camera_map
+                ]
+
+                # --- First or last row ---
+                if row == 0 or row == last_row_index:
+                    next_camera = [
+                        c for c in remaining_neighbors if len(c.possible_neighbors) <= 3
+                    ][0]
+
+                    if len(row_grid) == 0:
+                        next_camera.compute_def_grid_top_match(last_camera)
+                    else:
+                        next_camera.compute_def_grid_left_match(row_grid[col - 1])
+
+                    # Not the corner yet
+                    if len(next_camera.possible_neighbors) == 3:
+                        row_grid.append(next_camera)
+                        del camera_map[next_camera.id]
+                        last_camera = next_camera
+                        col += 1
+                        continue
+                    # We've reached the corner, but start or end?
+                    if len(next_camera.possible_neighbors) == 2:
+                        row_grid.append(next_camera)
+                        del camera_map[next_camera.id]
+                        # Start of the line
+                        if col == 0:
+                            last_camera = next_camera
+                            col += 1
+                            continue
+                        # End of the line
+                        else:
+                            grid.append(row_grid)
+                            last_camera = row_grid[0]
+                            last_row_index = int(len(cameras) / len(row_grid)) - 1
+                            row_grid = []
+                            row += 1
+                            col = 0
+                            continue
+                # --- Middle row ---
+                # Start of the line
+                if col == 0:
+                    next_camera = remaining_neighbors[0]
+                    next_camera.compute_def_grid_top_match(last_camera)
+                    last_camera = next_camera
+                    row_grid.append(next_camera)
+                    del camera_map[next_camera.id]
+                    col += 1
+                    continue
+                # Rest
+                else:
+                    above_camera = grid[row - 1][col]
+                    next_camera = [
+                        c for c in above_camera.possible_neighbors if c.id in camera_map
+                    ][0]
+
+                    if len(row_grid) == 0:
+                        next_camera.compute_def_grid_top_match(last_camera)
+                    else:
+                        next_camera.compute_def_grid_left_match(row_grid[col - 1])
+
+                    row_grid.append(next_camera)
+                    del camera_map[next_camera.id]
+                    # Not the end of the line
+                    if len(next_camera.possible_neighbors) == 4:
+                        col += 1
+                        last_camera = next_camera
+                    # End of the line
+                    else:
+                        last_camera = row_grid[0]
+                        col = 0
+                        row += 1
+                        grid.append(row_grid)
+                        row_grid = []
+                    continue
+            break
+        except Exception:
+            continue
+    return grid
+
+
+def merge_camera_rows(grid):
+    """
+    Merges the borderless photos of each row of cameras into rows of text
+    :param [[Camera]] grid: The cameras, row by row
+    :return: The full picture, row by row
+    :rtype: [str]
+    """
+    photo_height = len(grid[0][0].cut_def_grid)
+    text_rows = []
+    for row in grid:
+        for i in range(photo_height):
+            text = ""
+            for camera in row:
+                text += camera.cut_def_grid[i]
+            text_rows.append(text)
+    return text_rows
+
+
+def generate_text_variations(grid):
+    """
+    Create all text variations by rotating and flipping
+    We might have built the grid invertedly, so just in case let's handle both cases
+    :param [[Camera]] grid: The cameras, row by row
+    :return: Every orientation of the full picture, as a list of list of chars
+    :rtype: [[[str]]]
+    """
+    grid_mirror = mirror_from_grid(grid)
+    text_rows = merge_camera_rows(grid)
+    mirror_text_rows = merge_camera_rows(grid_mirror)
+    text_variations = []
+    text_1 = text_rows.copy()
+    text_2 = rotate_grid_90_deg(text_1)
+    text_3 = rotate_grid_90_deg(text_2)
+    text_4 = rotate_grid_90_deg(text_3)
+    mirror_1 = mirror_text_rows.copy()
+    mirror_2 = rotate_grid_90_deg(mirror_1)
+    mirror_3 = rotate_grid_90_deg(mirror_2)
+    mirror_4 = rotate_grid_90_deg(mirror_3)
+    for variation in [
+        text_1,
+        text_2,
+        text_3,
+        text_4,
+        mirror_1,
+        mirror_2,
+        mirror_3,
+        mirror_4,
+    ]:
+        top_flipped = top_flip_grid_of_strings(variation)
+        variation = [list(row) for row in variation.copy()]
+        top_flipped = [list(row) for row in top_flipped.copy()]
+        text_variations.append(variation)
+        text_variations.append(top_flipped)
+    return text_variations
+
+
+def mark_sea_monsters(text):
+    """
+    Looks for the sea monster pattern in the picture and marks it with 'O'
+    :param [[str]] text: The full picture, as a list of list of chars
+    :return: Whether at least one sea monster was found
+    :rtype: bool
+    """
     found = False
     x_max = len(text)
     y_max = len(text[0])
-    x = 0
-    y = 0
     for x in range(x_max):
         for y in range(y_max):
             value = text[x][y]
@@ -365,7 +359,7 @@ for text in text_variations:
                             continue
                         else:
                             break
-                    except Exception as e:
+                    except Exception:
                         break
                 else:
                     for a, b in INDEXES_TO_CHECK:
@@ -373,17 +367,63 @@ for text in text_variations:
                         new_y = y + a
                         text[new_x][new_y] = "O"
                         found = True
-    if found:
-        valid_texts.append(text)
+    return found
 
-# Lets view the results
-for text in valid_texts:
-    print()
-    for row in text:
-        print("".join(row))
-    print(sum([row.count("#") for row in text]))
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+PARSER_VERSION = 1
+
+
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The cameras with all their photo variations
+    :rtype: [Camera]
+    """
+    return [Camera.from_file_content(record) for record in group_records(lines)]
+
+
+def solve_part1(cameras):
+    """
+    :param [Camera] cameras: The cameras with all their photo variations
+    :return: The product of the IDs of the corner cameras
+    :rtype: int
+    """
+    link_cameras(cameras)
+    total = 1
+    for camera in cameras:
+        if len(camera.possible_neighbors) == 2:
+            total *= camera.id
+    return total
+
+
+def solve_part2(cameras):
+    """
+    :param [Camera] cameras: The cameras with all their photo variations
+    :return: The number of '#' that are not part of a sea monster
+    :rtype: int
+    """
+    link_cameras(cameras)
+    for camera in cameras:
+        camera.def_grid = None
+        camera.cut_def_grid = None
+    # Remove the borders of each tile for the valid grid
+    grid = place_cameras(cameras)
+    for row in grid:
+        for camera in row:
+            camera.compute_cut_def_grid()
+    # One of our text should have the pattern (once or more)
+    for text in generate_text_variations(grid):
+        if mark_sea_monsters(text):
+            return sum([row.count("#") for row in text])
 
 
-# Terminate
-end = perf_counter()
-print(end - start)
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+if __name__ == "__main__":
+    cameras = parse(read_input("day_20.txt"))
+    print(solve_part1(cameras))
+    print(solve_part2(cameras))
@@ -2,7 +2,6 @@
 
 # Built-in
 import re
-from time import perf_counter
 
 # Personal
 from _shared import read_input
@@ -100,79 +99,112 @@ class Recipe:
         return self.__repr__()
 
 
+def resolve_allergens(allergens):
+    """
+    Links each allergen to the only ingredient that can contain it
+    Loops until every allergen is solved, as each link narrows down the others
+    :param dict allergens: The Allergen instances, by name
+    """
+    unsolved_allergens = allergens.values()
+    while len(unsolved_allergens) > 0:
+        unsolved_allergens = [a for a in allergens.values() if a.ingredient is None]
+        for allergen in unsolved_allergens:
+            # Copy the ingredient groups and remove those with known allergens
+            ingredient_groups = [r.ingredients for r in allergen.recipes]
+            ingredient_groups = list(
+                map(
+                    lambda x: set([i for i in x if i.allergen is None]),
+                    ingredient_groups,
+                )
+            )
+            common_ingredients = ingredient_groups[0].intersection(
+                *ingredient_groups[1:]
+            )
+            # We cannot solve it yet
+            if len(common_ingredients) > 1:
+                continue
+            # We have one ingredient that matches
+            else:
+                linked_ingredient = common_ingredients.pop()
+                allergen.ingredient = linked_ingredient
+                linked_ingredient.allergen = allergen
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The ingredients and allergens by name, and the recipes
+    :rtype: dict, dict, [Recipe]
+    """
+    ingredients = {}
+    allergens = {}
+    recipes = []
+    for line in lines:
+        match = re.fullmatch(LINE_REGEX, line)
+        # Maybe create ingredients
+        current_ingredients = []
+        ingredient_names = set(match.group(1).split(" "))
+        for name in ingredient_names:
+            if name not in ingredients:
+                ingredient = Ingredient(name)
+                ingredients[name] = ingredient
+            current_ingredients.append(ingredients[name])
+        # Maybe create allergens
+        current_allergens = []
+        allergen_names = set(match.group(2).split(", "))
+        for name in allergen_names:
+            if name not in allergens:
+                allergen = Allergen(name)
+                allergens[name] = allergen
+            current_allergens.append(allergens[name])
+        # Create recipe and update the ingredients/allergens
+        recipe = Recipe(line, current_ingredients, current_allergens)
+        recipes.append(recipe)
+    return ingredients, allergens, recipes
+
+
+def solve_part1(menu):
+    """
+    :param (dict, dict, [Recipe]) menu: The ingredients, allergens and recipes
+    :return: The number of times the ingredients without allergens appear
+    :rtype: int
+    """
+    ingredients, allergens, recipes = menu
+    resolve_allergens(allergens)
+    ingredients_without_allergens = [
+        i for i in ingredients.values() if i.allergen is None
+    ]
+    total = 0
+    for recipe in recipes:
+        for ingredient in ingredients_without_allergens:
+            if ingredient in recipe.ingredients:
+                total += 1
+    return total
+
+
+def solve_part2(menu):
+    """
+    :param (dict, dict, [Recipe]) menu: The ingredients, allergens and recipes
+    :return: The ingredients with allergens, sorted by allergen name
+    :rtype: str
+    """
+    ingredients, allergens, _ = menu
+    resolve_allergens(allergens)
+    ingredients_with_allergens = [
+        i for i in ingredients.values() if i.allergen is not None
+    ]
+    ingredients_with_allergens.sort(key=lambda x: x.allergen.name)
+    names = [i.name for i in ingredients_with_allergens]
+    return ",".join(names)
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-# Initialization
-start = perf_counter()
-content = read_input("day_21.txt")
-
-# Creating the objects
-ingredients = {}
-allergens = {}
-recipes = []
-for line in content:
-    match = re.fullmatch(LINE_REGEX, line)
-    # Maybe create ingredients
-    current_ingredients = []
-    ingredient_names = set(match.group(1).split(" "))
-    for name in ingredient_names:
-        if name not in ingredients:
-            ingredient = Ingredient(name)
-            ingredients[name] = ingredient
-        current_ingredients.append(ingredients[name])
-    # Maybe create allergens
-    current_allergens = []
-    allergen_names = set(match.group(2).split(", "))
-    for name in allergen_names:
-        if name not in allergens:
-            allergen = Allergen(name)
-            allergens[name] = allergen
-        current_allergens.append(allergens[name])
-    # Create recipe and update the ingredients/allergens
-    recipe = Recipe(line, current_ingredients, current_allergens)
-    recipes.append(recipe)
-
-# --------------------------------------------------
-# Problem 1: Ingredients without allergens
-# --------------------------------------------------
-unsolved_allergens = allergens.values()
-while len(unsolved_allergens) > 0:
-    unsolved_allergens = [a for a in allergens.values() if a.ingredient is None]
-    for allergen in unsolved_allergens:
-        # Copy the ingredient groups and remove those with known allergens
-        ingredient_groups = [r.ingredients for r in allergen.recipes]
-        ingredient_groups = list(
-            map(lambda x: set([i for i in x if i.allergen is None]), ingredient_groups)
-        )
-        common_ingredients = ingredient_groups[0].intersection(*ingredient_groups[1:])
-        # We cannot solve it yet
-        if len(common_ingredients) > 1:
-            continue
-        # We have one ingredient that matches
-        else:
-            linked_ingredient = common_ingredients.pop()
-            allergen.ingredient = linked_ingredient
-            linked_ingredient.allergen = allergen
-
-# Now we can count the number of times the non-allergen ingredients appear
-ingredients_without_allergens = [i for i in ingredients.values() if i.allergen is None]
-total = 0
-for recipe in recipes:
-    for ingredient in ingredients_without_allergens:
-        if ingredient in recipe.ingredients:
-            total += 1
-print(total)
-
-# --------------------------------------------------
-# Problem 2: Ingredients with allergens
-# --------------------------------------------------
-ingredients_with_allergens = [i for i in ingredients.values() if i.allergen is not None]
-ingredients_with_allergens.sort(key=lambda x: x.allergen.name)
-names = [i.name for i in ingredients_with_allergens]
-print(",".join(names))
-
-
-# Terminate
-end = perf_counter()
-print(end - start)
+if __name__ == "__main__":
+    menu = parse(read_input("day_21.txt"))
+    print(solve_part1(menu))
+    print(solve_part2(menu))
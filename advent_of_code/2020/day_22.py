@@ -1,10 +1,7 @@
 """Day 22 challenge"""
 
-# Built-in
-from time import perf_counter
-
 # Personal
-from _shared import read_input
+from _shared import group_records, read_input
 
 
 # --------------------------------------------------------------------------------
@@ -119,43 +116,60 @@ class Game:
         return sum([card * (i + 1) for i, card in enumerate(self.winner.cards[::-1])])
 
 
+def build_game(decks):
+    """
+    Creates a game where each player gets a copy of their deck
+    :param [(int, [int])] decks: The ID and the ordered cards of each player
+    :return: The game, ready to be played
+    :rtype: Game
+    """
+    players = [Player(id_, cards.copy()) for id_, cards in decks]
+    return Game(players[0], players[1])
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The ID and the ordered cards of each player
+    :rtype: [(int, [int])]
+    """
+    decks = []
+    for i, record in enumerate(group_records(lines), start=1):
+        # The first line is the 'Player N:' title
+        cards = [int(line) for line in record[1:]]
+        decks.append((i, cards))
+    return decks
+
+
+def solve_part1(decks):
+    """
+    :param [(int, [int])] decks: The ID and the ordered cards of each player
+    :return: The score of the winner of a normal game
+    :rtype: int
+    """
+    game = build_game(decks)
+    game.play_normal_game()
+    return game.final_score()
+
+
+def solve_part2(decks):
+    """
+    :param [(int, [int])] decks: The ID and the ordered cards of each player
+    :return: The score of the winner of a recursive game
+    :rtype: int
+    """
+    game = build_game(decks)
+    game.play_recursive_game()
+    return game.final_score()
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-# Initialization
-start = perf_counter()
-content = read_input("day_22.txt")
-
-# Create objects
-players = []
-cards = []
-i = 0
-for line in content:
-    if line == "":
-        players.append(Player(i, cards))
-    elif line.startswith("Player"):
-        i += 1
-        cards = []
-    else:
-        cards.append(int(line))
-players.append(Player(i, cards))
-game = Game(players[0], players[1])
-
-
-# --------------------------------------------------
-# Problem 1:
-# --------------------------------------------------
-# game.play_normal_game()
-# print(game.final_score())
-
-
-# --------------------------------------------------
-# Problem 2:
-# --------------------------------------------------
-game.play_recursive_game()
-print(game.final_score())
-
-
-# Terminate
-end = perf_counter()
-print(end - start)
+if __name__ == "__main__":
+    decks = parse(read_input("day_22.txt"))
+    print(solve_part1(decks))
+    print(solve_part2(decks))
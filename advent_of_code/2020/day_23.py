@@ -1,134 +1,97 @@
 """Day 23 challenge"""
 
 # Built-in
-from time import perf_counter
+from array import array
 
 # Personal
-from _shared import read_input
+from _shared import Progress, print_progress, read_input
 
 
 # --------------------------------------------------------------------------------
 # > Helpers
 # --------------------------------------------------------------------------------
-class Cup:
-    """Cup with a value, positioned in a circle with other cups"""
+BATCH_SIZE = 100000
 
-    def __init__(self, id_):
-        """
-        Creates a standalone cup, not linked to another cup yet
-        :param int id_: ID of the cup
-        """
-        self.id = id_
-        self.next_cup = None
 
-    def __repr__(self):
-        """
-        :return: String similar to how the cup was created
-        :rtype: str
-        """
-        return f"Cup({self.id})"
+class CupCircle:
+    """Circle of cups labelled from 1 to N, moved around with specific rules"""
 
-    def __str__(self):
+    def __init__(self, labels, size=None):
         """
-        :return: String similar to how the cup was created
-        :rtype: str
+        Creates the circle as a table of successors: the cup after the cup X is
+        `successors[X]`. Moving cups only rewrites a few integers of the table
+        :param [int] labels: The labels of the starting cups, in clockwise order
+        :param int size: Total number of cups. The missing ones follow the starting
+            cups, in increasing order. Defaults to the number of starting cups
         """
-        return f"Cup({self.id})"
+        size = max(size or 0, len(labels))
+        # Cups after the starting ones are already followed by the next label
+        self.successors = array("i", range(1, size + 2))
+        ordered = labels + ([len(labels) + 1] if size > len(labels) else [])
+        for label, next_label in zip(ordered, ordered[1:]):
+            self.successors[label] = next_label
+        self.successors[size if size > len(labels) else labels[-1]] = labels[0]
+        self.max_label = size
+        self.current = labels[0]
 
-    def get_next_cup(self, n):
-        """
-        Returns the n-th neighbor of our cup
-        :param int n:
-        :return: The n-th neighbor to the right (clockwise)
-        :rtype: Cup
+    def play(self, n, progress_callback=None):
         """
-        cup = self
-        for i in range(n):
-            cup = cup.next_cup
-        return cup
-
-
-class Game:
-    """Game of cup, where you move cups around with specific rules"""
-
-    def __init__(self, cups):
-        """
-        Creates a game instance with starting cups
-        :param [Cup] cups: Ordered list of cups available in the game
+        Play a total of n turns, in batches to report the progress in between
+        :param int n: Number of turns to play
+        :param function progress_callback: Receives the moves done and their rate
         """
-        self.cups = cups
-        self.cups_map = {cup.id: cup for cup in self.cups}
-        self.player_cup = self.cups[0]
+        progress = Progress(progress_callback, "moves", n)
+        for i in range(0, n, BATCH_SIZE):
+            self.play_moves(min(BATCH_SIZE, n - i))
+            progress.update(min(i + BATCH_SIZE, n))
+        progress.finish(n)
 
-    def play(self, n):
+    def play_moves(self, n):
         """
-        Play a total of n turns
-        :param int n: Number of turns to play
+        Plays n moves, with the table and the current cup kept in local variables
+        :param int n: Number of moves to play
         """
-        for i in range(n):
-            # Keep track of turn number
-            if i % 100000 == 0:
-                print(i)
+        successors = self.successors
+        max_label = self.max_label
+        current = self.current
+        for _ in range(n):
             # Remove the next three cups from the circle
-            first = self.player_cup.get_next_cup(1)
-            second = self.player_cup.get_next_cup(2)
-            third = self.player_cup.get_next_cup(3)
-            excluded_cups = [first, second, third]
-            self.player_cup.next_cup = self.player_cup.get_next_cup(4)
+            first = successors[current]
+            second = successors[first]
+            third = successors[second]
+            successors[current] = successors[third]
             # Find destination cup
-            destination_cup = self.find_destination_cup(excluded_cups)
+            destination = current - 1 or max_label
+            while destination == first or destination == second or destination == third:
+                destination = destination - 1 or max_label
             # Insert the removed cups
-            destination_cup_neighbor = destination_cup.next_cup
-            destination_cup.next_cup = first
-            third.next_cup = destination_cup_neighbor
+            successors[third] = successors[destination]
+            successors[destination] = first
             # New current cup
-            self.player_cup = self.player_cup.next_cup
+            current = successors[current]
+        self.current = current
 
-    def find_destination_cup(self, excluded_cups):
-        """
-        Finds the destination cup based on the current state of the game
-        :return: The destination cup
-        :rtype: Cup
-        """
-        current_id = self.player_cup.id
-        excluded_ids = [cup.id for cup in excluded_cups]
-        search_id = current_id - 1
-        while True:
-            if search_id < 0:
-                search_id = MAX_ID
-            if search_id not in excluded_ids:
-                cup = self.cups_map.get(search_id, None)
-                if cup is not None:
-                    break
-            search_id -= 1
-        return cup
-
-    def get_ordered_cups(self, starting_id):
+    def get_labels_after(self, label, count):
         """
-        Gets the ordered list of cups, relative to one specific cup
-        :param int starting_id: The cup of reference for the order
-        :return: The ordered list of cup, relative to the provided starting cup id
-        :rtype: [Cup]
+        :param int label: The cup of reference
+        :param int count: Number of labels to get
+        :return: The labels of the cups following the reference cup, clockwise
+        :rtype: [int]
         """
-        starting_cup = self.cups_map[starting_id]
-        cups = [starting_cup]
-        cup = starting_cup
-        while True:
-            cup = cup.next_cup
-            if cup == starting_cup:
-                break
-            cups.append(cup)
-        return cups
+        labels = []
+        for _ in range(count):
+            label = self.successors[label]
+            labels.append(label)
+        return labels
 
     @property
     def results_p1(self):
         """
-        :return: An ordered list of cup ids, relative to the cup 1 (without including it)
+        :return: The ordered cup labels after the cup 1 (without including it)
         :rtype: str
         """
-        cups = self.get_ordered_cups(1)
-        cup_ids = [str(cup.id) for cup in cups]
-        return "".join(cup_ids[1:])
+        labels = self.get_labels_after(1, self.max_label - 1)
+        return "".join(str(label) for label in labels)
 
     @property
     def results_p2(self):
@@ -136,52 +99,51 @@ class Game:
         :return: The product of the two neighbors of cup(1)
         :rtype: int
         """
-        first_cup = self.cups_map[1]
-        return first_cup.get_next_cup(1).id * first_cup.get_next_cup(2).id
+        first, second = self.get_labels_after(1, 2)
+        return first * second
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The labels of the starting cups, in clockwise order
+    :rtype: [int]
+    """
+    return [int(value) for value in list(next(iter(lines)))]
+
+
+def solve_part1(labels, progress_callback=None):
+    """
+    :param [int] labels: The labels of the starting cups, in clockwise order
+    :param function progress_callback: Receives the progress of the moves
+    :return: The labels after the cup 1, once 100 moves were played
+    :rtype: str
+    """
+    circle = CupCircle(labels)
+    circle.play(100, progress_callback)
+    return circle.results_p1
+
+
+def solve_part2(labels, progress_callback=None):
+    """
+    :param [int] labels: The labels of the starting cups, in clockwise order
+    :param function progress_callback: Receives the progress of the moves
+    :return: The product of the two cups after the cup 1, for a million cups
+        and ten million moves
+    :rtype: int
+    """
+    circle = CupCircle(labels, 1000000)
+    circle.play(10000000, progress_callback)
+    return circle.results_p2
 
 
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-# Initialization
-start = perf_counter()
-content = read_input("day_23.txt")
-
-# --------------------------------------------------
-# Problem 1:
-# --------------------------------------------------
-# Build cups
-cups = [Cup(int(value)) for value in list(content[0])]
-# Create clockwise relationships
-for i, cup in enumerate(cups):
-    next_index = 0 if i + 1 == len(cups) else i + 1
-    next_cup = cups[next_index]
-    cup.next_cup = next_cup
-# Play game
-MAX_ID = max([cup.id for cup in cups])
-game = Game(cups)
-game.play(100)
-print(game.results_p1)
-
-# --------------------------------------------------
-# Problem 2: 22 seconds runtime
-# --------------------------------------------------
-# Build cups
-int_list = [int(value) for value in list(content[0])]
-max_int = max(int_list)
-other_ids = list(range(max_int + 1, 1000001))
-cups = [Cup(value) for value in int_list + other_ids]
-# Create clockwise relationships
-for i, cup in enumerate(cups):
-    next_index = 0 if i + 1 == len(cups) else i + 1
-    next_cup = cups[next_index]
-    cup.next_cup = next_cup
-# Play game
-MAX_ID = 1000000
-game = Game(cups)
-game.play(10000000)
-print(game.results_p2)
-
-# Terminate
-end = perf_counter()
-print(end - start)
+if __name__ == "__main__":
+    labels = parse(read_input("day_23.txt"))
+    print(solve_part1(labels))
+    print(solve_part2(labels, print_progress))
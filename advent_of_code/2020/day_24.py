@@ -2,16 +2,30 @@
 
 # Built-in
 import re
+from collections import Counter
 from enum import Enum
-from time import perf_counter
+
+# Third-party
+import numpy as np
 
 # Personal
-from _shared import read_input
+from _grid import GridND
+from _shared import read_input, read_input_bytes
 
 # --------------------------------------------------------------------------------
 # > Helpers
 # --------------------------------------------------------------------------------
+DAYS = 100
 LINE_REGEX = r"(se|sw|ne|nw|e|w)"
+# Axial coordinates: the second axis goes down-right, so all moves are integers
+AXIAL_DIRECTIONS = {
+    "ne": (1, -1),
+    "e": (1, 0),
+    "se": (0, 1),
+    "sw": (-1, 1),
+    "w": (-1, 0),
+    "nw": (0, -1),
+}
 COORDINATES_VALUES = {
     "ne": (0.5, 0.5),
     "e": (1, 0),
@@ -141,28 +155,193 @@ class Grid:
         return x, y
 
 
+def build_grid(paths):
+    """
+    Creates a grid and flips the tile at the end of each path
+    :param [str] paths: Directions concatenated into a string, one per tile
+    :return: The grid with the flipped tiles
+    :rtype: Grid
+    """
+    grid = Grid()
+    for line in paths:
+        grid.flip_tile(line)
+    return grid
+
+
+def find_black_tiles(paths):
+    """
+    Follows each path in axial coordinates, and flips the tile at its end
+    :param [str] paths: Directions concatenated into a string, one per tile
+    :return: The axial coordinates of the black tiles
+    :rtype: {(int, int)}
+    """
+    return scan_black_tiles("".join(f"{path}\n" for path in paths).encode())
+
+
+def read_black_tiles(filename):
+    """
+    Follows all the paths of an input file, straight from its memory-mapped bytes
+    :param str filename: The name of the input file
+    :return: The axial coordinates of the black tiles
+    :rtype: {(int, int)}
+    """
+    return scan_black_tiles(read_input_bytes(filename))
+
+
+def scan_black_tiles(buffer):
+    """
+    Follows all the paths at once, in a single pass over their bytes
+    Each byte is turned into its part of a move: "n" and "s" carry the vertical
+    step, "e" and "w" the horizontal one, which is cancelled by a previous "s" for
+    "se" and by a previous "n" for "nw". The steps are then summed line by line
+    :param bytes buffer: The paths, one per line
+    :return: The axial coordinates of the black tiles
+    :rtype: {(int, int)}
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if data.size == 0:
+        return set()
+    is_north, is_south = data == ord("n"), data == ord("s")
+    after_north = np.concatenate(([False], is_north[:-1]))
+    after_south = np.concatenate(([False], is_south[:-1]))
+    is_east = (data == ord("e")) & ~after_south
+    is_west = (data == ord("w")) & ~after_north
+    dq = is_east.view(np.int8) - is_west.view(np.int8)
+    dr = is_south.view(np.int8) - is_north.view(np.int8)
+    # Each line starts after a line break, and its break adds nothing to its sums
+    starts = np.flatnonzero(data == ord("\n")) + 1
+    starts = np.concatenate(([0], starts[starts < data.size]))
+    q = np.add.reduceat(dq, starts, dtype=np.int64)
+    r = np.add.reduceat(dr, starts, dtype=np.int64)
+    # Tiles flipped an odd number of times are black
+    keys, flips = np.unique((q << 32) + r, return_counts=True)
+    keys = keys[flips % 2 == 1]
+    q = (keys + (1 << 31)) >> 32
+    r = keys - (q << 32)
+    return set(zip(q.tolist(), r.tolist()))
+
+
+def run_with_objects(paths, days):
+    """
+    Flips the tiles with one Tile instance per known tile
+    :param [str] paths: Directions concatenated into a string, one per tile
+    :param int days: Number of days of flips
+    :return: The number of black tiles after the flips
+    :rtype: int
+    """
+    grid = build_grid(paths)
+    for i in range(days):
+        grid.daily_flips()
+    return grid.black_tile_count
+
+
+def run_with_active_set(paths, days):
+    """
+    Flips the tiles while only storing the black ones
+    Each black tile adds one hit to each of its neighbors, and the hits decide the
+    next black tiles, so a day only costs as much as the black tiles
+    :param [str] paths: Directions concatenated into a string, one per tile
+    :param int days: Number of days of flips
+    :return: The number of black tiles after the flips
+    :rtype: int
+    """
+    black_tiles = find_black_tiles(paths)
+    directions = list(AXIAL_DIRECTIONS.values())
+    for i in range(days):
+        hits = Counter(
+            (q + dq, r + dr) for q, r in black_tiles for dq, dr in directions
+        )
+        black_tiles = {
+            tile
+            for tile, count in hits.items()
+            if count == 2 or (count == 1 and tile in black_tiles)
+        }
+    return len(black_tiles)
+
+
+def run_with_array(paths, days):
+    """
+    Flips the tiles on a NumPy array indexed by axial coordinates
+    In axial coordinates, the 6 neighbors of a tile are 6 of the 8 cells around
+    it in the array, so each day is a sum of 6 shifted views.
+    The margins only grow when a black tile reaches the border, by a quarter of
+    the grid size, so long runs do not pay for a copy every day
+    :param [str] paths: Directions concatenated into a string, one per tile
+    :param int days: Number of days of flips
+    :return: The number of black tiles after the flips
+    :rtype: int
+    """
+    black_tiles = find_black_tiles(paths)
+    if not black_tiles:
+        return 0
+    q_min = min(q for q, _ in black_tiles)
+    r_min = min(r for _, r in black_tiles)
+    q_max = max(q for q, _ in black_tiles)
+    r_max = max(r for _, r in black_tiles)
+    cells = np.zeros((q_max - q_min + 1, r_max - r_min + 1), dtype=np.uint8)
+    for q, r in black_tiles:
+        cells[q - q_min, r - r_min] = 1
+    grid = GridND(cells, padding=1)
+    offsets = list(AXIAL_DIRECTIONS.values())
+    for i in range(days):
+        if grid.touches_border():
+            grid.pad(max(1, max(grid.shape) // 4))
+        grid.step(born=[2], survive=[1, 2], offsets=offsets, grow=False)
+    return grid.count()
+
+
+ENGINES = {
+    "array": run_with_array,
+    "objects": run_with_objects,
+    "sparse": run_with_active_set,
+}
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: Directions concatenated into a string, one per tile
+    :rtype: [str]
+    """
+    return list(lines)
+
+
+def solve_part1(paths, engine="array"):
+    """
+    :param [str] paths: Directions concatenated into a string, one per tile
+    :param str engine: Name of the engine flipping the tiles, from ENGINES
+    :return: The number of black tiles once the paths are followed
+    :rtype: int
+    """
+    return ENGINES[engine](paths, 0)
+
+
+def solve_part2(paths, engine="array"):
+    """
+    :param [str] paths: Directions concatenated into a string, one per tile
+    :param str engine: Name of the engine flipping the tiles, from ENGINES
+    :return: The number of black tiles after 100 days of flips
+    :rtype: int
+    """
+    return ENGINES[engine](paths, DAYS)
+
+
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-# Initialization
-start = perf_counter()
-content = read_input("day_24.txt")
-
-# --------------------------------------------------
-# Problem 1:
-# --------------------------------------------------
-grid = Grid()
-for line in content:
-    grid.flip_tile(line)
-print(grid.black_tile_count)
-
-# --------------------------------------------------
-# Problem 2:
-# --------------------------------------------------
-for i in range(100):
-    grid.daily_flips()
-print(grid.black_tile_count)
-
-# Terminate
-end = perf_counter()
-print(end - start)
+if __name__ == "__main__":
+    paths = parse(read_input("day_24.txt"))
+    # The byte scanner must agree with the regex-based Grid, whose coordinates are
+    # converted to axial ones
+    grid = build_grid(paths)
+    expected = {
+        (int(x + y), int(-2 * y))
+        for (x, y), tile in grid.tile_map.items()
+        if tile.color == TileColor.BLACK
+    }
+    assert find_black_tiles(paths) == read_black_tiles("day_24.txt") == expected
+    print(solve_part1(paths))
+    print(solve_part2(paths))
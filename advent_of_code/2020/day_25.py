@@ -1,9 +1,12 @@
 """Day 25 challenge"""
 
 # Built-in
-from time import perf_counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import isqrt
 
 # Personal
+from _discrete_log import BabyStepTable, discrete_log, get_order
 from _shared import read_input
 
 # --------------------------------------------------------------------------------
@@ -11,24 +14,19 @@ from _shared import read_input
 # --------------------------------------------------------------------------------
 DIVIDER = 20201227
 SUBJECT_NUMBER = 7
+# Table shared by the processes of a pool, set once when each process starts
+shared_table = None
 
 
 def get_loop_size(public_key):
     """
     Gets the loop size related to the subject number 7 and the provided public key
+    This is the discrete logarithm of the key, so we never walk the loops one by one
     :param int public_key: A RFID public key
     :return: The number of loop required to obtain the public key with the subject number 7
     :rtype: int
     """
-    value = 1
-    i = 0
-    while True:
-        i += 1
-        value = value * SUBJECT_NUMBER
-        value = value % DIVIDER
-        if public_key == value:
-            break
-    return i
+    return discrete_log(SUBJECT_NUMBER, public_key, DIVIDER)
 
 
 def transform(subject_number, loop_size):
@@ -39,34 +37,126 @@ def transform(subject_number, loop_size):
     :return: The generated value
     :rtype: int
     """
-    value = 1
-    for i in range(loop_size):
-        value = value * subject_number
-        value = value % DIVIDER
-    return value
+    return pow(subject_number, loop_size, DIVIDER)
+
+
+def crack_public_keys(
+    public_keys, subject_number=SUBJECT_NUMBER, modulus=DIVIDER, jobs=1
+):
+    """
+    Finds the loop sizes of many public keys with a single baby-step table
+    The giant steps of each key can be split in ranges across a pool of processes
+    :param [int] public_keys: RFID public keys, all made from the same subject number
+    :param int subject_number: The subject number used to make the keys
+    :param int modulus: The number the values are divided by
+    :param int jobs: Number of processes running giant steps
+    :raises ValueError: If a key cannot be made from the subject number
+    :return: The loop size of each key, and the encryption key of each pair of keys
+        (by their indexes)
+    :rtype: [int], {(int, int): int}
+    """
+    order = get_order(subject_number, modulus)
+    step_count = isqrt(order * max(len(public_keys), 1)) + 1
+    table = BabyStepTable(subject_number, modulus, order, step_count)
+    if jobs > 1:
+        loop_sizes = solve_in_parallel(table, public_keys, jobs)
+    else:
+        loop_sizes = [table.solve(public_key) for public_key in public_keys]
+    for public_key, loop_size in zip(public_keys, loop_sizes):
+        if loop_size is None:
+            raise ValueError(f"{public_key} is not a power of {subject_number}")
+    encryption_keys = {
+        (i, j): pow(public_keys[j], loop_sizes[i], modulus)
+        for i, j in combinations(range(len(public_keys)), 2)
+    }
+    return loop_sizes, encryption_keys
+
+
+def solve_in_parallel(table, public_keys, jobs):
+    """
+    Splits the giant steps of each key in one range per process
+    The table is sent once to each process, instead of once per range
+    :param BabyStepTable table: The baby steps of the subject number
+    :param [int] public_keys: RFID public keys
+    :param int jobs: Number of processes
+    :return: The loop size of each key, or None if it cannot be found
+    :rtype: [int]
+    """
+    bounds = [table.giant_step_count * i // jobs for i in range(jobs + 1)]
+    ranges = list(zip(bounds, bounds[1:]))
+    with ProcessPoolExecutor(
+        jobs, initializer=set_shared_table, initargs=(table,)
+    ) as executor:
+        futures = [
+            [executor.submit(solve_range, key, start, stop) for start, stop in ranges]
+            for key in public_keys
+        ]
+        loop_sizes = []
+        for key_futures in futures:
+            results = [future.result() for future in key_futures]
+            # The first range with a solution holds the smallest one
+            found = [result for result in results if result is not None]
+            loop_sizes.append(found[0] if found else None)
+        return loop_sizes
+
+
+def set_shared_table(table):
+    """
+    :param BabyStepTable table: The table to use in this process
+    """
+    global shared_table
+    shared_table = table
+
+
+def solve_range(public_key, start, stop):
+    """
+    :param int public_key: A RFID public key
+    :param int start: Index of the first giant step
+    :param int stop: Index after the last giant step
+    :return: The loop size of the key if found within the range
+    :rtype: int
+    """
+    return shared_table.solve(public_key, start, stop)
+
+
+# --------------------------------------------------------------------------------
+# > Solutions
+# --------------------------------------------------------------------------------
+def parse(lines):
+    """
+    :param [str] lines: Lines from the input file
+    :return: The public keys of the card and of the door
+    :rtype: int, int
+    """
+    content = list(lines)
+    return int(content[0]), int(content[1])
+
+
+def solve_part1(public_keys):
+    """
+    Finding one loop size is enough, as both sides generate the same encryption key
+    :param (int, int) public_keys: The public keys of the card and of the door
+    :return: The encryption key of the handshake
+    :rtype: int
+    """
+    card_public_key, door_public_key = public_keys
+    card_loop = get_loop_size(card_public_key)
+    return transform(door_public_key, card_loop)
+
+
+def solve_part2(public_keys):
+    """
+    The last day has no second problem
+    :param (int, int) public_keys: The public keys of the card and of the door
+    :return: Nothing
+    :rtype: None
+    """
+    return None
 
 
 # --------------------------------------------------------------------------------
 # > Main
 # --------------------------------------------------------------------------------
-# Initialization
-start = perf_counter()
-content = read_input("day_25.txt")
-CARD_PUBLEY_KEY = int(content[0])
-DOOR_PUBLEY_KEY = int(content[1])
-
-# Find the loop sizes
-card_loop = get_loop_size(CARD_PUBLEY_KEY)
-door_loop = get_loop_size(DOOR_PUBLEY_KEY)
-print(f"CARD: {7}, {card_loop}")
-print(f"DOOR: {7}, {door_loop}")
-
-# Generate the private key
-private_key_1 = transform(CARD_PUBLEY_KEY, door_loop)
-private_key_2 = transform(DOOR_PUBLEY_KEY, card_loop)
-print(private_key_1)
-print(private_key_2)
-
-# Terminate
-end = perf_counter()
-print(end - start)
+if __name__ == "__main__":
+    public_keys = parse(read_input("day_25.txt"))
+    print(solve_part1(public_keys))
@@ -1,13 +1,94 @@
 # Built-in
+import hashlib
+import mmap
 import os
-from typing import List
+import pickle
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar, Union
 
 CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
 INPUT_DIR = os.path.join(CURRENT_DIR, "inputs")
+CACHE_DIR = os.path.join(CURRENT_DIR, ".cache")
+
+Parsed = TypeVar("Parsed")
 
 
 def read_input(filename: str) -> List[str]:
+    return list(iter_input(filename))
+
+
+def iter_input(filename: str) -> Iterator[str]:
     filepath = os.path.join(INPUT_DIR, filename)
     with open(filepath, "r") as f:
-        content = [line.rstrip("\n") for line in f.readlines()]
-    return content
+        for line in f:
+            yield line.rstrip("\n")
+
+
+class InputLines:
+    # Re-iterable lines, each iteration reads the file again
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+
+    def __iter__(self) -> Iterator[str]:
+        return iter_input(self.filename)
+
+
+def iter_records(
+    filename: str, separator: Optional[str] = None
+) -> Iterator[Union[List[str], str]]:
+    return group_records(iter_input(filename), separator)
+
+
+def group_records(
+    lines: Iterable[str], separator: Optional[str] = None
+) -> Iterator[Union[List[str], str]]:
+    # Records are separated by blank lines and joined once, not concatenated
+    record: List[str] = []
+    for line in lines:
+        if line != "":
+            record.append(line)
+        elif len(record) > 0:
+            yield record if separator is None else separator.join(record)
+            record = []
+    if len(record) > 0:
+        yield record if separator is None else separator.join(record)
+
+
+def read_input_bytes(filename: str) -> Union[mmap.mmap, bytes]:
+    filepath = os.path.join(INPUT_DIR, filename)
+    with open(filepath, "rb") as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def hash_input(filename: str) -> str:
+    filepath = os.path.join(INPUT_DIR, filename)
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(2**20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_parse(
+    filename: str, parser: Callable[[Iterator[str]], Parsed], version: int
+) -> Parsed:
+    # Keyed by the file content and the parser version, so both invalidate it
+    name = os.path.splitext(os.path.basename(parser.__code__.co_filename))[0]
+    key = f"{name}-v{version}-{hash_input(filename)}"
+    cache_path = os.path.join(CACHE_DIR, f"{key}.pickle")
+    try:
+        with open(cache_path, "rb") as f:
+            cached: Any = pickle.load(f)
+            return cached
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        pass
+    parsed = parser(iter_input(filename))
+    # Write then rename, so concurrent runs never read a partial file
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, cache_path)
+    return parsed
@@ -1,5 +1,8 @@
+# Built-in
+from typing import Iterable, List
+
 # Third-party
-from _shared import read_input
+from _shared import group_records, read_input
 
 
 class Elf:
@@ -10,17 +13,20 @@ class Elf:
         return self.calories > other.calories
 
 
-content = read_input("day_01.txt")
-elves = []
-calories = 0
-for line in content:
-    if line == "":
-        elves.append(Elf(calories))
-        calories = 0
-        continue
-    calories += int(line)
+def parse(lines: Iterable[str]) -> List[Elf]:
+    return [Elf(sum(int(line) for line in record)) for record in group_records(lines)]
+
+
+def solve_part1(elves: List[Elf]) -> int:
+    return max(elves).calories
+
+
+def solve_part2(elves: List[Elf]) -> int:
+    top_elves = sorted(elves, reverse=True)
+    return top_elves[0].calories + top_elves[1].calories + top_elves[2].calories
 
-print(max(elves).calories)
 
-elves.sort(reverse=True)
-print(elves[0].calories + elves[1].calories + elves[2].calories)
+if __name__ == "__main__":
+    elves = parse(read_input("day_01.txt"))
+    print(solve_part1(elves))
+    print(solve_part2(elves))
@@ -1,5 +1,6 @@
 # Built-in
 from functools import cached_property
+from typing import Iterable, List
 
 # Third-party
 from _shared import read_input
@@ -12,12 +13,15 @@ class ActionType:
 
 
 class Round:
-    def __init__(self, line: str) -> None:
+    def __init__(self, line: str, is_objective: bool) -> None:
         opponent_letter, my_letter = line.split(" ")
         self.opponent_action = Action.from_letter(opponent_letter)
-        self.player_action = Action.from_objective_letter(
-            self.opponent_action, my_letter
-        )
+        if is_objective:
+            self.player_action = Action.from_objective_letter(
+                self.opponent_action, my_letter
+            )
+        else:
+            self.player_action = Action.from_letter(my_letter)
         self.player_score = 0
         self.opponent_score = 0
 
@@ -92,11 +96,28 @@ class Action:
         raise ValueError(f"Invalid letter: {letter}")
 
 
-content = read_input("day_02.txt")
-rounds = []
-for line in content:
-    round_ = Round(line)
-    round_.play()
-    rounds.append(round_)
-points = sum([round_.player_score for round_ in rounds])
-print(points)
+def play_rounds(lines: List[str], is_objective: bool) -> int:
+    rounds = []
+    for line in lines:
+        round_ = Round(line, is_objective)
+        round_.play()
+        rounds.append(round_)
+    return sum([round_.player_score for round_ in rounds])
+
+
+def parse(lines: Iterable[str]) -> List[str]:
+    return list(lines)
+
+
+def solve_part1(lines: List[str]) -> int:
+    return play_rounds(lines, False)
+
+
+def solve_part2(lines: List[str]) -> int:
+    return play_rounds(lines, True)
+
+
+if __name__ == "__main__":
+    lines = parse(read_input("day_02.txt"))
+    print(solve_part1(lines))
+    print(solve_part2(lines))
@@ -1,7 +1,7 @@
 # Built-in
 import os
 import re
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Optional, Union
 
 # Third-party
 from _shared import read_input
@@ -76,28 +76,35 @@ class FileSystem:
             raise ValueError(f"Unknown line: {line}")
 
 
-lines = read_input("day_07.txt")[1:]
-
-# P1
-fs = FileSystem()
-[fs.parse_input(line) for line in lines]  # type: ignore
-small_folder_total_size = 0
-for item in fs.path_map.values():
-    if isinstance(item, Folder) and item.size < 100000:
-        small_folder_total_size += item.size
-print(small_folder_total_size)
-
-# P2
 MAX_SPACE = 70000000
 REQUIRED_SPACE = 30000000
-lines = read_input("day_07.txt")[1:]
-fs = FileSystem()
-[fs.parse_input(line) for line in lines]  # type: ignore
-
-missing_space = abs((MAX_SPACE - fs.root_folder.size) - REQUIRED_SPACE)
-potential_sizes = []
-for item in fs.path_map.values():
-    if isinstance(item, Folder) and item.size > missing_space:
-        potential_sizes.append(item.size)
-potential_sizes.sort()
-print(potential_sizes[0], potential_sizes[-1])
+
+
+def parse(lines: Iterable[str]) -> FileSystem:
+    fs = FileSystem()
+    for line in lines:
+        fs.parse_input(line)
+    return fs
+
+
+def solve_part1(fs: FileSystem) -> int:
+    small_folder_total_size = 0
+    for item in fs.path_map.values():
+        if isinstance(item, Folder) and item.size < 100000:
+            small_folder_total_size += item.size
+    return small_folder_total_size
+
+
+def solve_part2(fs: FileSystem) -> int:
+    missing_space = abs((MAX_SPACE - fs.root_folder.size) - REQUIRED_SPACE)
+    potential_sizes = []
+    for item in fs.path_map.values():
+        if isinstance(item, Folder) and item.size > missing_space:
+            potential_sizes.append(item.size)
+    return min(potential_sizes)
+
+
+if __name__ == "__main__":
+    fs = parse(read_input("day_07.txt"))
+    print(solve_part1(fs))
+    print(solve_part2(fs))
@@ -1,5 +1,5 @@
 # Built-in
-from typing import List, Set, Tuple
+from typing import Iterable, List, Set, Tuple
 
 # Third-party
 from _shared import read_input
@@ -83,8 +83,25 @@ class Grid:
                 tail.maybe_move()
 
 
-data = read_input("day_09.txt")
-grid = Grid()
-for input_line in data:
-    grid.play_turn(input_line)
-print(len(grid.tails[-1].visited))
+def parse(lines: Iterable[str]) -> List[str]:
+    return list(lines)
+
+
+def solve_part1(moves: List[str]) -> int:
+    grid = Grid()
+    for move in moves:
+        grid.play_turn(move)
+    return len(grid.tails[0].visited)
+
+
+def solve_part2(moves: List[str]) -> int:
+    grid = Grid()
+    for move in moves:
+        grid.play_turn(move)
+    return len(grid.tails[-1].visited)
+
+
+if __name__ == "__main__":
+    moves = parse(read_input("day_09.txt"))
+    print(solve_part1(moves))
+    print(solve_part2(moves))
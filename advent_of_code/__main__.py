@@ -0,0 +1,215 @@
+"""Command line entry point: python -m advent_of_code <command> [options]"""
+
+# Built-in
+import argparse
+import os
+from time import perf_counter
+from typing import List, Optional
+
+# Local
+from .benchmark import (
+    benchmark_year,
+    find_regressions,
+    format_results,
+    get_baseline_path,
+    load_results,
+    save_results,
+)
+from .generators import GENERATORS, generate, write_input
+from .profiling import Profiler
+from .runner import get_days, run_day, run_in_parallel, run_year
+
+
+# --------------------------------------------------------------------------------
+# > Commands
+# --------------------------------------------------------------------------------
+def run(args: argparse.Namespace) -> int:
+    """
+    Runs a daily solution, or all the solutions of the year if no day is given,
+    and prints the measurements of each stage
+    :param args: The parsed command line arguments
+    :return: The exit code
+    """
+    if args.profile or args.trace_alloc:
+        return profile(args)
+    start = perf_counter()
+    if args.day is None:
+        reports = run_year(args.year, args.part, args.cache, args.jobs)
+    else:
+        filename = os.path.abspath(args.input) if args.input else None
+        if args.jobs > 1:
+            reports = run_in_parallel(
+                args.year, [args.day], args.jobs, args.part, filename, args.cache
+            )
+        else:
+            reports = [run_day(args.year, args.day, args.part, filename, args.cache)]
+    duration = perf_counter() - start
+    for report in reports:
+        print(report.format())
+    if len(reports) > 1:
+        total = sum(report.duration for report in reports)
+        print(f"{args.year}: {len(reports)} tasks, {total:.4f}s in {duration:.4f}s")
+    return 0
+
+
+def profile(args: argparse.Namespace) -> int:
+    """
+    Runs daily solutions in this process while profiling their parse and solve
+    stages, then writes the top functions and allocation sites to a report file
+    :param args: The parsed command line arguments
+    :return: The exit code
+    """
+    profiler = Profiler(args.profile, args.trace_alloc, args.top)
+    filename = os.path.abspath(args.input) if args.input else None
+    days = get_days(args.year) if args.day is None else [args.day]
+    for day in days:
+        profiler.add_title(f"{args.year} day {day:02}")
+        report = run_day(
+            args.year, day, args.part, filename, args.cache, profiler.measure
+        )
+        print(report.format())
+    profiler.save(args.report)
+    print(f"Profile saved to {args.report}")
+    return 0
+
+
+def bench(args: argparse.Namespace) -> int:
+    """
+    Benchmarks the daily solutions, then compares them against the baseline
+    :param args: The parsed command line arguments
+    :return: The exit code, 1 if any stage got slower than allowed
+    """
+    results = benchmark_year(
+        args.year, args.day, args.repeat, args.warmup, args.input_dir
+    )
+    print(format_results(results))
+    if args.output:
+        save_results(results, args.output)
+    # The committed baseline was measured on the real inputs
+    if args.input_dir and not args.baseline:
+        print("Custom inputs without --baseline, skipping the comparison")
+        return 0
+    baseline_path = args.baseline or get_baseline_path(args.year)
+    if args.update_baseline:
+        save_results(results, baseline_path)
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+    if not os.path.isfile(baseline_path):
+        print(f"No baseline found at {baseline_path}")
+        return 0
+    baseline = load_results(baseline_path)
+    regressions = find_regressions(results, baseline, args.threshold, args.min_duration)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+def generate_inputs(args: argparse.Namespace) -> int:
+    """
+    Writes generated inputs as day_XX.txt files, ready for `bench --input-dir`
+    :param args: The parsed command line arguments
+    :return: The exit code
+    """
+    days = args.day or sorted(GENERATORS.get(args.year, {}))
+    for day in days:
+        path = os.path.join(args.output_dir, f"day_{day:02}.txt")
+        write_input(generate(args.year, day, args.seed, args.size), path)
+        print(f"Generated {path}")
+    return 0
+
+
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+def build_parser() -> argparse.ArgumentParser:
+    """
+    :return: The parser for all the commands
+    """
+    parser = argparse.ArgumentParser(prog="python -m advent_of_code")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    # Run
+    run_parser = subparsers.add_parser("run", help="Run and measure daily solutions")
+    run_parser.add_argument("--year", type=int, required=True)
+    run_parser.add_argument("--day", type=int, help="Runs the whole year if omitted")
+    run_parser.add_argument("--part", type=int, choices=[1, 2])
+    run_parser.add_argument("--input", help="Input file to use instead of the default")
+    run_parser.add_argument(
+        "--cache", action="store_true", help="Reuse parsed inputs from previous runs"
+    )
+    run_parser.add_argument(
+        "--jobs", type=int, default=1, help="Run days and parts across N processes"
+    )
+    run_parser.add_argument(
+        "--profile", action="store_true", help="Profile function calls with cProfile"
+    )
+    run_parser.add_argument(
+        "--trace-alloc", action="store_true", help="Trace allocations with tracemalloc"
+    )
+    run_parser.add_argument(
+        "--top", type=int, default=20, help="Functions and allocation sites to report"
+    )
+    run_parser.add_argument(
+        "--report", default="profile.txt", help="Path of the profiling report"
+    )
+    run_parser.set_defaults(function=run)
+    # Bench
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark daily solutions against a baseline"
+    )
+    bench_parser.add_argument("--year", type=int, required=True)
+    bench_parser.add_argument("--day", type=int, nargs="+", help="Defaults to all")
+    bench_parser.add_argument("--repeat", type=int, default=5)
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument(
+        "--input-dir", help="Folder with day_XX.txt inputs to use instead"
+    )
+    bench_parser.add_argument("--output", help="Path of the JSON results to write")
+    bench_parser.add_argument(
+        "--baseline",
+        help="Baseline JSON to compare with. Defaults to the committed one, "
+        "unless --input-dir is used",
+    )
+    bench_parser.add_argument(
+        "--threshold", type=float, default=20, help="Allowed slowdown, in percent"
+    )
+    bench_parser.add_argument(
+        "--min-duration",
+        type=float,
+        default=0.01,
+        help="Ignore stages faster than this in the baseline, in seconds",
+    )
+    bench_parser.add_argument(
+        "--update-baseline", action="store_true", help="Save the results as baseline"
+    )
+    bench_parser.set_defaults(function=bench)
+    # Generate
+    generate_parser = subparsers.add_parser(
+        "generate", help="Generate inputs of any size from a seed"
+    )
+    generate_parser.add_argument("--year", type=int, required=True)
+    generate_parser.add_argument("--day", type=int, nargs="+", help="Defaults to all")
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument(
+        "--size", type=int, help="Day-specific size. Defaults to the original one"
+    )
+    generate_parser.add_argument("--output-dir", required=True)
+    generate_parser.set_defaults(function=generate_inputs)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    :param argv: Command line arguments. Uses sys.argv if not provided
+    :return: The exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "jobs", 1) > 1 and (args.profile or args.trace_alloc):
+        parser.error("profiling runs in a single process, --jobs is not supported")
+    if getattr(args, "input", None) and args.day is None:
+        parser.error("--input replaces the input of a single day, --day is required")
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
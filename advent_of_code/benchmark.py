@@ -0,0 +1,196 @@
+"""Benchmarks the daily solutions and compares them against stored baselines"""
+
+# Built-in
+import json
+import math
+import os
+import platform
+import statistics
+from typing import Any, Dict, List, Optional
+
+# Local
+from .runner import get_days, load_day, measure, parse_input
+
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = os.path.join(CURRENT_DIR, "benchmarks")
+STAGES = ["parse", "part 1", "part 2"]
+
+Results = Dict[str, Any]
+
+
+# --------------------------------------------------------------------------------
+# > Statistics
+# --------------------------------------------------------------------------------
+def percentile(values: List[float], rank: float) -> float:
+    """
+    :param values: The measured values
+    :param rank: The percentile to compute, between 0 and 100
+    :return: The nearest-rank percentile of the values
+    """
+    ordered = sorted(values)
+    index = max(math.ceil(rank / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+def summarize(durations: List[float], peak_rss: List[int]) -> Dict[str, Any]:
+    """
+    :param durations: Wall-clock times of each measured run, in seconds
+    :param peak_rss: Peak resident set size of each measured run, in bytes
+    :return: The median and p95 durations, and the highest peak memory
+    """
+    return {
+        "median": statistics.median(durations),
+        "p95": percentile(durations, 95),
+        "peak_rss": max(peak_rss),
+        "runs": len(durations),
+    }
+
+
+# --------------------------------------------------------------------------------
+# > Benchmarks
+# --------------------------------------------------------------------------------
+def benchmark_day(
+    year: int, day: int, repeat: int, warmup: int, filename: Optional[str] = None
+) -> Results:
+    """
+    Runs every stage of a daily solution several times in this process
+    The first runs are only there to warm up, and are not measured
+    :param year: The year of the challenge
+    :param day: The day of the challenge
+    :param repeat: Number of measured runs
+    :param warmup: Number of runs to discard before measuring
+    :param filename: Input file to use instead of the default one
+    :return: The summary of each stage
+    """
+    module = load_day(year, day)
+    filename = filename or f"day_{day:02}.txt"
+    durations: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    peak_rss: Dict[str, List[int]] = {stage: [] for stage in STAGES}
+    for i in range(warmup + repeat):
+        reports = [measure("parse", parse_input, module, filename)]
+        parsed = reports[0].result
+        reports.append(measure("part 1", module.solve_part1, parsed))
+        reports.append(measure("part 2", module.solve_part2, parsed))
+        if i < warmup:
+            continue
+        for report in reports:
+            durations[report.name].append(report.duration)
+            peak_rss[report.name].append(report.peak_rss)
+    return {stage: summarize(durations[stage], peak_rss[stage]) for stage in STAGES}
+
+
+def benchmark_year(
+    year: int,
+    days: Optional[List[int]] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    input_dir: Optional[str] = None,
+) -> Results:
+    """
+    Benchmarks the daily solutions of a year
+    :param year: The year of the challenge
+    :param days: The days to benchmark. Uses all the days if not provided
+    :param repeat: Number of measured runs
+    :param warmup: Number of runs to discard before measuring
+    :param input_dir: Folder with the inputs to use instead of the default ones.
+        Days without a file in this folder are skipped
+    :return: The environment and the summary of each stage of each day
+    """
+    results: Results = {
+        "year": year,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "days": {},
+    }
+    for day in days or get_days(year):
+        filename = None
+        if input_dir is not None:
+            filename = os.path.join(os.path.abspath(input_dir), f"day_{day:02}.txt")
+            if not os.path.isfile(filename):
+                continue
+        results["days"][str(day)] = benchmark_day(year, day, repeat, warmup, filename)
+    return results
+
+
+# --------------------------------------------------------------------------------
+# > Baselines
+# --------------------------------------------------------------------------------
+def get_baseline_path(year: int) -> str:
+    """
+    :param year: The year of the challenge
+    :return: The path to the committed baseline of the year
+    """
+    return os.path.join(BASELINE_DIR, f"{year}.json")
+
+
+def load_results(path: str) -> Results:
+    """
+    :param path: Path to a JSON file of benchmark results
+    :return: The benchmark results
+    """
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def save_results(results: Results, path: str) -> None:
+    """
+    :param results: The benchmark results
+    :param path: Path of the JSON file to write
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    os.makedirs(folder, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def find_regressions(
+    results: Results, baseline: Results, threshold: float, min_duration: float
+) -> List[str]:
+    """
+    Compares the median of each stage against the baseline
+    Stages faster than `min_duration` in the baseline are too noisy and are ignored
+    :param results: The new benchmark results
+    :param baseline: The reference benchmark results
+    :param threshold: Allowed slowdown, in percent
+    :param min_duration: Baseline duration under which a stage is ignored, in seconds
+    :return: A description of each stage that got slower than allowed
+    """
+    regressions = []
+    for day, stages in results["days"].items():
+        for stage, summary in stages.items():
+            reference = baseline["days"].get(day, {}).get(stage)
+            if reference is None or reference["median"] < min_duration:
+                continue
+            slowdown = (summary["median"] / reference["median"] - 1) * 100
+            if slowdown > threshold:
+                regressions.append(
+                    f"{results['year']} day {int(day):02} {stage}: "
+                    f"{reference['median']:.4f}s -> {summary['median']:.4f}s "
+                    f"({slowdown:+.1f}%)"
+                )
+    return regressions
+
+
+def format_results(results: Results) -> str:
+    """
+    :param results: The benchmark results
+    :return: A human-readable table of the median, p95 and peak memory of each stage
+    """
+    lines = [
+        f"{results['year']} ({results['repeat']} runs, {results['warmup']} warmup)"
+    ]
+    for day, stages in results["days"].items():
+        for stage, summary in stages.items():
+            lines.append(
+                f"  day {int(day):02} {stage:<8}"
+                f"{summary['median']:>12.4f}s"
+                f"{summary['p95']:>12.4f}s"
+                f"{summary['peak_rss'] / 2**20:>10.1f} MiB"
+            )
+    return "\n".join(lines)
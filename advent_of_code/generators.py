@@ -0,0 +1,809 @@
+"""Generates valid inputs of any size for the daily solutions, from a seed"""
+
+# Built-in
+import math
+import os
+import random
+import string
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# Third-party
+import numpy as np
+
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+Generator = Callable[..., Iterator[str]]
+
+HEX_DIRECTIONS = ["e", "se", "sw", "w", "nw", "ne"]
+SEA_MONSTER = [
+    "                  # ",
+    "#    ##    ##    ###",
+    " #  #  #  #  #  #   ",
+]
+TICKET_FIELDS = [
+    "departure location",
+    "departure station",
+    "departure platform",
+    "departure track",
+    "departure date",
+    "departure time",
+    "arrival location",
+    "arrival station",
+    "arrival platform",
+    "arrival track",
+    "class",
+    "duration",
+    "price",
+    "route",
+    "row",
+    "seat",
+    "train",
+    "type",
+    "wagon",
+    "zone",
+]
+
+
+# --------------------------------------------------------------------------------
+# > Utils
+# --------------------------------------------------------------------------------
+def random_word(rng: random.Random, min_length: int = 3, max_length: int = 7) -> str:
+    """
+    :param rng: The random generator
+    :param min_length: Minimum number of letters
+    :param max_length: Maximum number of letters
+    :return: A lowercase word made of random letters
+    """
+    length = rng.randint(min_length, max_length)
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def unique_words(rng: random.Random, count: int, excluded: Set[str]) -> List[str]:
+    """
+    :param rng: The random generator
+    :param count: Number of words to generate
+    :param excluded: Words that must not be generated
+    :return: Distinct random words
+    """
+    words: List[str] = []
+    seen = set(excluded)
+    while len(words) < count:
+        word = random_word(rng)
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+# --------------------------------------------------------------------------------
+# > 2020
+# --------------------------------------------------------------------------------
+def generate_2020_day_01(rng: random.Random, size: int = 200) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of expense entries
+    :return: Entries where exactly one pair and one triple sum to 2020
+    """
+    a = rng.randint(500, 999)
+    x, y = rng.sample(range(1, 301), 2)
+    while x + y == a:
+        x, y = rng.sample(range(1, 301), 2)
+    values = {a, 2020 - a, x, y, 2020 - x - y}
+    # Fillers are too big to reach 2020 with anything but the small x and y
+    excluded = values | {2020 - x, 2020 - y}
+    while len(values) < max(size, 5):
+        value = rng.randint(1700, 1700 + 10 * size)
+        if value not in excluded:
+            values.add(value)
+    entries = list(values)
+    rng.shuffle(entries)
+    for value in entries:
+        yield str(value)
+
+
+def generate_2020_day_02(rng: random.Random, size: int = 1000) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of passwords
+    :return: Password policies and passwords
+    """
+    for _ in range(size):
+        min_ = rng.randint(1, 10)
+        max_ = rng.randint(min_ + 1, 20)
+        letter = rng.choice(string.ascii_lowercase)
+        length = rng.randint(max_, max_ + 10)
+        # Favour the policy letter so both outcomes are common
+        alphabet = string.ascii_lowercase + letter * 8
+        password = "".join(rng.choice(alphabet) for _ in range(length))
+        yield f"{min_}-{max_} {letter}: {password}"
+
+
+def generate_2020_day_03(rng: random.Random, size: int = 323) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of rows of the map
+    :return: Rows of open squares and trees
+    """
+    width = 31
+    for _ in range(size):
+        yield "".join("#" if rng.random() < 0.25 else "." for _ in range(width))
+
+
+def generate_2020_day_04(rng: random.Random, size: int = 1000) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of passports
+    :return: Passports split over several lines, separated by blank lines
+    """
+    eye_colors = ["amb", "blu", "brn", "gry", "grn", "hzl", "oth", "xry", "zzz"]
+    for i in range(size):
+        fields = {
+            "byr": str(rng.randint(1900, 2010)),
+            "iyr": str(rng.randint(2005, 2025)),
+            "eyr": str(rng.randint(2015, 2035)),
+            "hgt": rng.choice(
+                [f"{rng.randint(140, 200)}cm", f"{rng.randint(50, 80)}in"]
+            ),
+            "hcl": "#" + "".join(rng.choice("0123456789abcdef") for _ in range(6)),
+            "ecl": rng.choice(eye_colors),
+            "pid": str(rng.randint(0, 10**9 - 1)).zfill(rng.choice([9, 9, 9, 10])),
+            "cid": str(rng.randint(100, 350)),
+        }
+        # Some passports miss fields
+        for name in list(fields):
+            if rng.random() < 0.05:
+                del fields[name]
+        items = [f"{name}:{value}" for name, value in fields.items()]
+        rng.shuffle(items)
+        while items:
+            count = rng.randint(1, 4)
+            yield " ".join(items[:count])
+            items = items[count:]
+        if i + 1 < size:
+            yield ""
+
+
+def generate_2020_day_05(rng: random.Random, size: int = 800) -> Iterator[str]:
+    """
+    The plane only has 1024 seats, so the size is capped
+    Occupied rows are centered, so the free seat is the last one left when removing
+    rows from each end
+    :param rng: The random generator
+    :param size: Number of boarding passes
+    :return: Boarding passes of a block of rows, with one missing seat
+    """
+    row_count = min(max((size + 1) // 8, 3), 120)
+    first_row = (128 - row_count) // 2
+    missing_seat = (first_row + row_count // 2, rng.randint(0, 7))
+    passes = []
+    for row in range(first_row, first_row + row_count):
+        for col in range(8):
+            if (row, col) == missing_seat:
+                continue
+            row_code = bin(row)[2:].zfill(7).replace("0", "F").replace("1", "B")
+            col_code = bin(col)[2:].zfill(3).replace("0", "L").replace("1", "R")
+            passes.append(row_code + col_code)
+    rng.shuffle(passes)
+    yield from passes
+
+
+def generate_2020_day_06(rng: random.Random, size: int = 500) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of groups
+    :return: Answers of each person, with groups separated by blank lines
+    """
+    for i in range(size):
+        for _ in range(rng.randint(1, 5)):
+            count = rng.randint(1, 26)
+            yield "".join(rng.sample(string.ascii_lowercase, count))
+        if i + 1 < size:
+            yield ""
+
+
+def generate_2020_day_07(rng: random.Random, size: int = 600) -> Iterator[str]:
+    """
+    Bags are split in layers and only contain bags of the next layer,
+    which keeps the nesting shallow
+    :param rng: The random generator
+    :param size: Number of bag colors
+    :return: Bag rules, with the 'shiny gold' bag in a middle layer
+    """
+    layer_count = 6
+    names: Set[str] = {"shiny gold"}
+    while len(names) < max(size, layer_count * 2):
+        names.add(f"{random_word(rng)} {random_word(rng)}")
+    colors = sorted(names - {"shiny gold"})
+    rng.shuffle(colors)
+    layer_size = math.ceil(len(names) / layer_count)
+    layers = [colors[i : i + layer_size] for i in range(0, len(colors), layer_size)]
+    gold_layer = layer_count // 2
+    layers[gold_layer].append("shiny gold")
+    # At least one bag must hold the 'shiny gold' bag, or part 1 would be 0
+    gold_parent = rng.choice(layers[gold_layer - 1])
+    lines = []
+    for index, layer in enumerate(layers):
+        for color in layer:
+            if index + 1 == len(layers):
+                lines.append(f"{color} bags contain no other bags.")
+                continue
+            next_layer = layers[index + 1]
+            children = rng.sample(next_layer, min(rng.randint(1, 3), len(next_layer)))
+            if color == gold_parent and "shiny gold" not in children:
+                children[0] = "shiny gold"
+            contents = []
+            for child in children:
+                quantity = rng.randint(1, 9)
+                contents.append(f"{quantity} {child} bag{'s' if quantity > 1 else ''}")
+            lines.append(f"{color} bags contain {', '.join(contents)}.")
+    rng.shuffle(lines)
+    yield from lines
+
+
+def generate_2020_day_08(rng: random.Random, size: int = 600) -> Iterator[str]:
+    """
+    Builds a program that terminates, then turns one of its executed 'nop'
+    into a 'jmp' back to an earlier executed instruction
+    :param rng: The random generator
+    :param size: Number of instructions
+    :return: A program stuck in an infinite loop, fixable by one instruction
+    """
+    size = max(size, 10)
+    instructions = []
+    executed = []
+    next_executed = 0
+    for i in range(size):
+        if i == next_executed:
+            executed.append(i)
+        name = rng.choices(["acc", "nop", "jmp"], weights=[5, 2, 2])[0]
+        if name == "jmp":
+            value = rng.randint(1, 4)
+            if i + value > size:
+                name, value = "acc", rng.randint(-50, 50)
+        else:
+            value = rng.randint(-50, 50)
+        if i == next_executed:
+            next_executed = i + value if name == "jmp" else i + 1
+        instructions.append([name, value])
+    # Force a 'nop' late in the executed path, and loop back from it
+    k = executed[max(len(executed) * 3 // 4, 1)]
+    target = rng.choice([index for index in executed if index < k])
+    instructions[k] = ["jmp", target - k]
+    for name, value in instructions:
+        yield f"{name} {value:+d}"
+
+
+def generate_2020_day_09(rng: random.Random, size: int = 1000) -> Iterator[str]:
+    """
+    Each number is the sum of two of the 25 numbers before it, except one:
+    the sum of a contiguous range of earlier numbers
+    :param rng: The random generator
+    :param size: Number of numbers
+    :return: The numbers, one per line
+    """
+    preamble = 25
+    size = max(size, preamble + 30)
+    numbers = rng.sample(range(1, 100), preamble)
+    invalid_index = rng.randint(preamble + 20, size - 1)
+    for i in range(preamble, size):
+        window = numbers[i - preamble : i]
+        if i == invalid_index:
+            pair_sums = {a + b for a in window for b in window if a != b}
+            while True:
+                length = rng.randint(2, 17)
+                start = rng.randint(0, i - length)
+                value = sum(numbers[start : start + length])
+                if value not in pair_sums:
+                    break
+        else:
+            a, b = rng.sample(window, 2)
+            value = a + b
+        numbers.append(value)
+    for value in numbers:
+        yield str(value)
+
+
+def generate_2020_day_10(rng: random.Random, size: int = 100) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of adapters
+    :return: Adapters whose joltages differ by 1 or 3
+    """
+    adapters = []
+    joltage = 0
+    for _ in range(size):
+        joltage += rng.choices([1, 3], weights=[7, 3])[0]
+        adapters.append(joltage)
+    rng.shuffle(adapters)
+    for value in adapters:
+        yield str(value)
+
+
+def generate_2020_day_11(rng: random.Random, size: int = 100) -> Iterator[str]:
+    """
+    Random layouts often have seats that flip forever with the adjacent rules,
+    so those seats are turned into floor until the layout settles
+    :param rng: The random generator
+    :param size: Width and height of the seat layout
+    :return: Rows of empty seats and floor
+    """
+    rows = [[rng.random() < 0.75 for _ in range(size)] for _ in range(size)]
+    is_seat = np.array(rows, dtype=bool).reshape(size, size)
+    while True:
+        flipping = find_flipping_seats(is_seat, 200)
+        if not flipping.any():
+            break
+        is_seat &= ~flipping
+    for row in is_seat:
+        yield "".join("L" if value else "." for value in row)
+
+
+def find_flipping_seats(is_seat: np.ndarray, max_turns: int) -> np.ndarray:
+    """
+    Runs the seat rules of 2020 day 11 with adjacent seats, starting with empty seats
+    :param is_seat: Whether each position is a seat
+    :param max_turns: Number of turns after which the seats should be stable
+    :return: Whether each seat still changed during the last turn
+    """
+    height, width = is_seat.shape
+    is_occupied = np.zeros(is_seat.shape, dtype=bool)
+    for _ in range(max_turns):
+        padded = np.pad(is_occupied, 1).view(np.uint8)
+        counts = sum(
+            padded[1 + dy : 1 + dy + height, 1 + dx : 1 + dx + width]
+            for dy in (-1, 0, 1)
+            for dx in (-1, 0, 1)
+            if dy or dx
+        )
+        next_occupied = np.where(is_occupied, counts < 4, counts == 0) & is_seat
+        if np.array_equal(next_occupied, is_occupied):
+            return np.zeros(is_seat.shape, dtype=bool)
+        is_occupied, changed = next_occupied, next_occupied != is_occupied
+    return changed
+
+
+def generate_2020_day_12(rng: random.Random, size: int = 800) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of navigation instructions
+    :return: The navigation instructions
+    """
+    for _ in range(size):
+        action = rng.choice("NSEWLRFF")
+        if action in "LR":
+            yield f"{action}{rng.choice([90, 180, 270])}"
+        else:
+            yield f"{action}{rng.randint(1, 100)}"
+
+
+def generate_2020_day_13(rng: random.Random, size: int = 9) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of buses in service
+    :return: The earliest departure, and the bus IDs with out-of-service slots
+    """
+    primes = [
+        n for n in range(11, 1000) if all(n % d for d in range(2, int(n**0.5) + 1))
+    ]
+    buses = rng.sample(primes, min(size, len(primes)))
+    slots = []
+    for bus in buses:
+        slots.append(str(bus))
+        slots.extend(["x"] * rng.randint(0, 10))
+    yield str(rng.randint(10**5, 10**7))
+    yield ",".join(slots)
+
+
+def generate_2020_day_14(rng: random.Random, size: int = 550) -> Iterator[str]:
+    """
+    Masks have at most 9 floating bits to keep the memory addresses tractable
+    :param rng: The random generator
+    :param size: Number of instructions
+    :return: Mask updates followed by memory writes
+    """
+    written = 0
+    while written < size:
+        mask = [rng.choice("01") for _ in range(36)]
+        for index in rng.sample(range(36), rng.randint(1, 9)):
+            mask[index] = "X"
+        yield f"mask = {''.join(mask)}"
+        for _ in range(min(rng.randint(1, 6), size - written)):
+            yield f"mem[{rng.randint(0, 65535)}] = {rng.randint(0, 2**30)}"
+            written += 1
+
+
+def generate_2020_day_15(rng: random.Random, size: int = 6) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of starting numbers
+    :return: The starting numbers, on a single line
+    """
+    numbers = rng.sample(range(max(size * 3, 20)), size)
+    yield ",".join(str(value) for value in numbers)
+
+
+def generate_2020_day_16(rng: random.Random, size: int = 240) -> Iterator[str]:
+    """
+    Each field accepts the values of one more position than the previous one,
+    so there is a single way to assign the fields to the positions
+    :param rng: The random generator
+    :param size: Number of nearby tickets
+    :return: The rules, our ticket and the nearby tickets
+    """
+    field_count = len(TICKET_FIELDS)
+    band = 50
+    # The departure fields must not be the one valid for a single position
+    ranks = list(range(2, field_count + 1))
+    rng.shuffle(ranks)
+    ranks = ranks[:6] + [1] + ranks[6:]
+    for name, rank in zip(TICKET_FIELDS, ranks):
+        low, high = band + 1, band * rank + band - 1
+        cut = rng.randint(low, high - 1)
+        yield f"{name}: {low}-{cut} or {cut + 1}-{high}"
+    # Positions get the value bands in a random order
+    bands = list(range(1, field_count + 1))
+    rng.shuffle(bands)
+
+    def ticket(is_valid: bool) -> str:
+        values = [rng.randint(band * b + 1, band * b + band - 1) for b in bands]
+        if not is_valid:
+            values[rng.randrange(field_count)] = rng.choice(
+                [rng.randint(1, band), rng.randint(band * (field_count + 2), 2000)]
+            )
+        return ",".join(str(value) for value in values)
+
+    yield ""
+    yield "your ticket:"
+    yield ticket(True)
+    yield ""
+    yield "nearby tickets:"
+    for _ in range(size):
+        yield ticket(rng.random() > 0.25)
+
+
+def generate_2020_day_17(rng: random.Random, size: int = 8) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Width and height of the initial slice
+    :return: Rows of active and inactive cubes
+    """
+    for _ in range(size):
+        yield "".join("#" if rng.random() < 0.45 else "." for _ in range(size))
+
+
+def generate_2020_day_18(rng: random.Random, size: int = 370) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of equations
+    :return: Equations with nested parentheses
+    """
+
+    def expression(depth: int) -> str:
+        terms = []
+        for _ in range(rng.randint(2, 5)):
+            if depth < 3 and rng.random() < 0.25:
+                terms.append(f"({expression(depth + 1)})")
+            else:
+                terms.append(str(rng.randint(1, 9)))
+        text = terms[0]
+        for term in terms[1:]:
+            text += f" {rng.choice('+*')} {term}"
+        return text
+
+    for _ in range(size):
+        yield expression(0)
+
+
+def generate_2020_day_19(rng: random.Random, size: int = 400) -> Iterator[str]:
+    """
+    Rules 42 and 31 match the strings of a fixed length with an even and an odd
+    number of 'b', which are built recursively like the original rules
+    :param rng: The random generator
+    :param size: Number of messages
+    :return: The rules and the messages
+    """
+    length = 5
+    ids = rng.sample(
+        [n for n in range(1, 200) if n not in {8, 11, 31, 42}], 2 * length + 2
+    )
+    a_id, b_id = ids.pop(), ids.pop()
+    rules = {0: "8 11", 8: "42", 11: "42 31", a_id: '"a"', b_id: '"b"'}
+    even, odd = a_id, b_id
+    for k in range(2, length + 1):
+        even_id = 42 if k == length else ids.pop()
+        odd_id = 31 if k == length else ids.pop()
+        rules[even_id] = f"{a_id} {even} | {b_id} {odd}"
+        rules[odd_id] = f"{a_id} {odd} | {b_id} {even}"
+        even, odd = even_id, odd_id
+    items = list(rules.items())
+    rng.shuffle(items)
+    for rule_id, text in items:
+        yield f"{rule_id}: {text}"
+    yield ""
+
+    def chunk(parity: int) -> str:
+        while True:
+            text = "".join(rng.choice("ab") for _ in range(length))
+            if text.count("b") % 2 == parity:
+                return text
+
+    for _ in range(size):
+        if rng.random() < 0.5:
+            n = rng.randint(1, 4)
+            m = rng.randint(n + 1, n + 4)
+            yield "".join(chunk(0) for _ in range(m)) + "".join(
+                chunk(1) for _ in range(n)
+            )
+        else:
+            count = rng.randint(2, 8)
+            yield "".join(rng.choice("ab") for _ in range(count * length))
+
+
+def generate_2020_day_20(rng: random.Random, size: int = 12) -> Iterator[str]:
+    """
+    Cuts a picture with sea monsters into tiles, then rotates and flips each tile
+    Tile borders are unique, so they grow past 10 pixels when 10 cannot fit them all
+    :param rng: The random generator
+    :param size: Number of tiles on each side of the picture
+    :return: The tiles with their IDs
+    """
+    edge_count = 2 * size * (size + 1)
+    tile_size = max(10, math.ceil(math.log2(edge_count * 8)) + 2)
+    inner = tile_size - 2
+    # Picture with a few sea monsters
+    picture_size = size * inner
+    picture = [
+        ["#" if rng.random() < 0.2 else "." for _ in range(picture_size)]
+        for _ in range(picture_size)
+    ]
+    monster_width = len(SEA_MONSTER[0])
+    for _ in range(max(picture_size**2 // 400, 1)):
+        x = rng.randint(0, picture_size - monster_width)
+        y = rng.randint(0, picture_size - len(SEA_MONSTER))
+        for dy, row in enumerate(SEA_MONSTER):
+            for dx, char in enumerate(row):
+                if char == "#":
+                    picture[y + dy][x + dx] = "#"
+    # Unique borders that share their corners
+    corners = [[rng.choice("#.") for _ in range(size + 1)] for _ in range(size + 1)]
+    seen: Set[str] = set()
+
+    def border(start: str, end: str) -> str:
+        while True:
+            text = start + "".join(rng.choice("#.") for _ in range(inner)) + end
+            if text != text[::-1] and text not in seen and text[::-1] not in seen:
+                seen.add(text)
+                return text
+
+    horizontal = [
+        [border(corners[i][j], corners[i][j + 1]) for j in range(size)]
+        for i in range(size + 1)
+    ]
+    vertical = [
+        [border(corners[i][j], corners[i + 1][j]) for j in range(size + 1)]
+        for i in range(size)
+    ]
+    ids = rng.sample(range(1000, max(10000, size * size * 10)), size * size)
+    for i in range(size):
+        for j in range(size):
+            rows = [horizontal[i][j]]
+            for r in range(1, tile_size - 1):
+                middle = "".join(
+                    picture[i * inner + r - 1][j * inner : (j + 1) * inner]
+                )
+                rows.append(vertical[i][j][r] + middle + vertical[i][j + 1][r])
+            rows.append(horizontal[i + 1][j])
+            for _ in range(rng.randint(0, 3)):
+                rows = ["".join(row) for row in zip(*reversed(rows))]
+            if rng.random() < 0.5:
+                rows = rows[::-1]
+            yield f"Tile {ids.pop()}:"
+            yield from rows
+            if i + 1 < size or j + 1 < size:
+                yield ""
+
+
+def generate_2020_day_21(rng: random.Random, size: int = 40) -> Iterator[str]:
+    """
+    Regenerates the recipes until every allergen can be deduced by elimination
+    :param rng: The random generator
+    :param size: Number of recipes
+    :return: Recipes with their ingredients and some of their allergens
+    """
+    allergen_names = unique_words(rng, 8, set())
+    ingredient_names = unique_words(rng, 200, set(allergen_names))
+    sources = dict(zip(allergen_names, rng.sample(ingredient_names, 8)))
+    while True:
+        recipes = []
+        for _ in range(max(size, 8)):
+            allergens = rng.sample(allergen_names, rng.randint(1, 3))
+            ingredients = set(rng.sample(ingredient_names, rng.randint(10, 30)))
+            ingredients.update(sources[name] for name in allergens)
+            recipes.append((sorted(ingredients), allergens))
+        if is_allergen_list_solvable(recipes):
+            break
+    for ingredients, allergens in recipes:
+        rng.shuffle(ingredients)
+        yield f"{' '.join(ingredients)} (contains {', '.join(allergens)})"
+
+
+def is_allergen_list_solvable(recipes: List[Tuple[List[str], List[str]]]) -> bool:
+    """
+    :param recipes: The ingredients and listed allergens of each recipe
+    :return: Whether the allergens can all be linked by elimination
+    """
+    candidates: Dict[str, Set[str]] = {}
+    for ingredients, allergens in recipes:
+        for name in allergens:
+            candidates.setdefault(name, set(ingredients)).intersection_update(
+                ingredients
+            )
+    solved: Dict[str, str] = {}
+    while len(solved) < len(candidates):
+        progress = False
+        for name, ingredients in candidates.items():
+            remaining = ingredients - set(solved.values())
+            if name not in solved and len(remaining) == 1:
+                solved[name] = remaining.pop()
+                progress = True
+        if not progress:
+            return False
+    return True
+
+
+def generate_2020_day_22(rng: random.Random, size: int = 25) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of cards of each player
+    :return: The decks of both players
+    """
+    cards = list(range(1, 2 * size + 1))
+    rng.shuffle(cards)
+    for player, deck in enumerate([cards[:size], cards[size:]], start=1):
+        yield f"Player {player}:"
+        for card in deck:
+            yield str(card)
+        if player == 1:
+            yield ""
+
+
+def generate_2020_day_23(rng: random.Random, size: int = 9) -> Iterator[str]:
+    """
+    Labels are single digits, so there are at most 9 starting cups
+    :param rng: The random generator
+    :param size: Number of starting cups
+    :return: The labels of the starting cups
+    """
+    labels = list(range(1, min(max(size, 5), 9) + 1))
+    rng.shuffle(labels)
+    yield "".join(str(label) for label in labels)
+
+
+def generate_2020_day_24(rng: random.Random, size: int = 500) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of paths
+    :return: Paths of hexagonal directions, one per tile to flip
+    """
+    for _ in range(size):
+        steps = rng.randint(10, 30)
+        yield "".join(rng.choice(HEX_DIRECTIONS) for _ in range(steps))
+
+
+def generate_2020_day_25(rng: random.Random, size: int = 10_000_000) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Maximum loop size of the card and the door
+    :return: The public keys of the card and the door
+    """
+    for _ in range(2):
+        yield str(pow(7, rng.randint(1, size), 20201227))
+
+
+# --------------------------------------------------------------------------------
+# > 2022
+# --------------------------------------------------------------------------------
+def generate_2022_day_01(rng: random.Random, size: int = 250) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of elves
+    :return: Calories carried by each elf, with elves separated by blank lines
+    """
+    for i in range(size):
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 60000))
+        if i + 1 < size:
+            yield ""
+
+
+def generate_2022_day_02(rng: random.Random, size: int = 2500) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of rounds
+    :return: The letters of the opponent and of the player for each round
+    """
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+
+
+def generate_2022_day_07(rng: random.Random, size: int = 200) -> Iterator[str]:
+    """
+    File sizes add up to about 45M, so some folders can free the required space
+    :param rng: The random generator
+    :param size: Number of folders
+    :return: The commands and outputs of a terminal session browsing the tree
+    """
+    children: Dict[int, List[int]] = {0: []}
+    for folder in range(1, size):
+        parent = rng.randrange(folder)
+        children[parent].append(folder)
+        children[folder] = []
+    names = unique_words(rng, size, set())
+    file_count = size * 4
+    max_file_size = 2 * 45_000_000 // file_count
+
+    def browse(folder: int) -> Iterator[str]:
+        yield "$ ls"
+        for child in children[folder]:
+            yield f"dir {names[child]}"
+        for name in unique_words(rng, rng.randint(1, 7), set()):
+            yield f"{rng.randint(1, max_file_size)} {name}.{rng.choice(['txt', 'log'])}"
+        for child in children[folder]:
+            yield f"$ cd {names[child]}"
+            yield from browse(child)
+            yield "$ cd .."
+
+    yield "$ cd /"
+    yield from browse(0)
+
+
+def generate_2022_day_09(rng: random.Random, size: int = 2000) -> Iterator[str]:
+    """
+    :param rng: The random generator
+    :param size: Number of head motions
+    :return: The direction and the number of steps of each motion
+    """
+    for _ in range(size):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, 20)}"
+
+
+# --------------------------------------------------------------------------------
+# > Registry
+# --------------------------------------------------------------------------------
+GENERATORS: Dict[int, Dict[int, Generator]] = {}
+for _name, _function in list(globals().items()):
+    if _name.startswith("generate_"):
+        _, _year, _, _day = _name.split("_")
+        GENERATORS.setdefault(int(_year), {})[int(_day)] = _function
+
+
+def generate(
+    year: int, day: int, seed: int, size: Optional[int] = None
+) -> Iterator[str]:
+    """
+    :param year: The year of the challenge
+    :param day: The day of the challenge
+    :param seed: Seed of the random generator. The same seed gives the same input
+    :param size: Size of the input, whose meaning depends on the day.
+        Uses the size of the original input if not provided
+    :return: The lines of the generated input
+    """
+    if day not in GENERATORS.get(year, {}):
+        raise ValueError(f"No generator for {year} day {day}")
+    rng = random.Random(f"{seed}:{year}:{day}")
+    function = GENERATORS[year][day]
+    return function(rng) if size is None else function(rng, size)
+
+
+def write_input(lines: Iterator[str], path: str) -> None:
+    """
+    Writes the lines one at a time, so huge inputs never sit in memory
+    :param lines: The lines of the generated input
+    :param path: Path of the file to write
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        for line in lines:
+            f.write(line)
+            f.write("\n")
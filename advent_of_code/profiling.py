@@ -0,0 +1,118 @@
+"""Profiles the stages of the daily solutions with cProfile and tracemalloc"""
+
+# Built-in
+import cProfile
+import io
+import pstats
+import tracemalloc
+from typing import Any, Callable, List
+
+# Local
+from . import runner
+from .runner import StageReport, measure
+
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+IGNORED_ALLOCATION_FILES = [
+    tracemalloc.__file__,
+    runner.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+]
+
+
+# --------------------------------------------------------------------------------
+# > Profiler
+# --------------------------------------------------------------------------------
+class Profiler:
+    """Measures stages like the runner does, while profiling their calls"""
+
+    def __init__(self, cpu: bool = True, allocations: bool = False, top: int = 20):
+        """
+        :param cpu: Whether to record the time spent in each function, with cProfile
+        :param allocations: Whether to record the allocation sites, with tracemalloc
+        :param top: Number of functions and allocation sites kept for each stage
+        """
+        self.cpu = cpu
+        self.allocations = allocations
+        self.top = top
+        self.sections: List[str] = []
+
+    def measure(
+        self, name: str, function: Callable[..., Any], *args: Any
+    ) -> StageReport:
+        """
+        Same as `runner.measure`, but profiles the function while it runs
+        Durations include the overhead of the profilers
+        :param name: Name of the stage
+        :param function: The function to run
+        :param args: Arguments passed to the function
+        :return: The report of the stage
+        """
+        profile = cProfile.Profile() if self.cpu else None
+        if self.allocations:
+            tracemalloc.start()
+        if profile is not None:
+            profile.enable()
+        try:
+            report = measure(name, function, *args)
+        finally:
+            if profile is not None:
+                profile.disable()
+            snapshot = None
+            if self.allocations:
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+        lines = [f"===== {name} ({report.duration:.4f}s) ====="]
+        if profile is not None:
+            lines.append(self.format_cpu(profile))
+        if snapshot is not None:
+            lines.append(self.format_allocations(snapshot, peak))
+        self.sections.append("\n".join(lines))
+        return report
+
+    def format_cpu(self, profile: cProfile.Profile) -> str:
+        """
+        :param profile: The profile of a stage
+        :return: The functions with the highest self time
+        """
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(self.top)
+        return f"----- Top {self.top} functions by self time -----\n{stream.getvalue()}"
+
+    def format_allocations(self, snapshot: tracemalloc.Snapshot, peak: int) -> str:
+        """
+        :param snapshot: The allocations still alive at the end of a stage
+        :param peak: The peak size of the traced allocations, in bytes
+        :return: The lines holding the most memory at the end of the stage
+        """
+        filters = [tracemalloc.Filter(False, path) for path in IGNORED_ALLOCATION_FILES]
+        statistics = snapshot.filter_traces(filters).statistics("lineno")
+        lines = [
+            f"----- Top {self.top} allocation sites still alive -----",
+            f"Peak traced memory: {peak / 2**20:.1f} MiB",
+        ]
+        for statistic in statistics[: self.top]:
+            frame = statistic.traceback[0]
+            lines.append(
+                f"{statistic.size / 2**10:>12.1f} KiB {statistic.count:>10} blocks  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def add_title(self, title: str) -> None:
+        """
+        :param title: Title of the next stages in the report, such as the day
+        """
+        self.sections.append(f"##### {title} #####")
+
+    def save(self, path: str) -> None:
+        """
+        :param path: Path of the text report to write
+        """
+        with open(path, "w") as f:
+            f.write("\n\n".join(self.sections))
+            f.write("\n")
@@ -0,0 +1,292 @@
+"""Runs the daily solutions and measures each of their stages"""
+
+# Built-in
+import importlib
+import os
+import resource
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable, List, Optional
+
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+CURRENT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROC_STATUS_PATH = "/proc/self/status"
+PROC_CLEAR_REFS_PATH = "/proc/self/clear_refs"
+
+
+# --------------------------------------------------------------------------------
+# > Memory
+# --------------------------------------------------------------------------------
+def reset_peak_rss() -> None:
+    """
+    Resets the peak RSS of the current process, so the next reading covers only
+    what happens from now on. Only possible on Linux, silently ignored elsewhere
+    """
+    try:
+        with open(PROC_CLEAR_REFS_PATH, "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def get_peak_rss() -> int:
+    """
+    :return: The peak resident set size of the current process, in bytes
+    """
+    try:
+        with open(PROC_STATUS_PATH, "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# --------------------------------------------------------------------------------
+# > Reports
+# --------------------------------------------------------------------------------
+class StageReport:
+    """Result and measurements of a single stage of a daily solution"""
+
+    def __init__(self, name: str, result: Any, duration: float, peak_rss: int):
+        """
+        :param name: Name of the stage (load, parse, part 1, part 2)
+        :param result: The value returned by the stage
+        :param duration: Wall-clock time of the stage, in seconds
+        :param peak_rss: Peak resident set size during the stage, in bytes
+        """
+        self.name = name
+        self.result = result
+        self.duration = duration
+        self.peak_rss = peak_rss
+
+    def __repr__(self) -> str:
+        return f"StageReport({self.name}, {self.duration:.6f}s)"
+
+
+class DayReport:
+    """All the stages measured while running a daily solution"""
+
+    def __init__(self, year: int, day: int):
+        """
+        :param year: The year of the challenge
+        :param day: The day of the challenge
+        """
+        self.year = year
+        self.day = day
+        self.stages: List[StageReport] = []
+
+    def __repr__(self) -> str:
+        return f"DayReport({self.year}, day {self.day})"
+
+    @property
+    def duration(self) -> float:
+        """
+        :return: The total wall-clock time of all the stages, in seconds
+        """
+        return sum(stage.duration for stage in self.stages)
+
+    def format(self) -> str:
+        """
+        :return: A human-readable table of the stages
+        """
+        lines = [f"{self.year} day {self.day:02}"]
+        for stage in self.stages:
+            result = "-" if stage.result is None else str(stage.result)
+            lines.append(
+                f"  {stage.name:<8}{result:>20}"
+                f"{stage.duration:>12.4f}s"
+                f"{stage.peak_rss / 2**20:>10.1f} MiB"
+            )
+        lines.append(f"  {'total':<8}{'':>20}{self.duration:>12.4f}s")
+        return "\n".join(lines)
+
+
+def measure(name: str, function: Callable[..., Any], *args: Any) -> StageReport:
+    """
+    Runs a function while measuring its wall-clock time and peak memory
+    :param name: Name of the stage
+    :param function: The function to run
+    :param args: Arguments passed to the function
+    :return: The report of the stage
+    """
+    reset_peak_rss()
+    start = perf_counter()
+    result = function(*args)
+    duration = perf_counter() - start
+    return StageReport(name, result, duration, get_peak_rss())
+
+
+# --------------------------------------------------------------------------------
+# > Loading
+# --------------------------------------------------------------------------------
+def get_year_dir(year: int) -> str:
+    """
+    :param year: The year of the challenge
+    :return: The folder holding the solutions of the given year
+    """
+    year_dir = os.path.join(CURRENT_DIR, str(year))
+    if not os.path.isdir(year_dir):
+        raise ValueError(f"No solutions for year {year}")
+    return year_dir
+
+
+def is_year_dir(path: str) -> bool:
+    """
+    :param path: Path to a folder
+    :return: Whether the folder holds the solutions of a year
+    """
+    return os.path.dirname(path) == CURRENT_DIR and os.path.basename(path).isdigit()
+
+
+def activate_year(year: int) -> None:
+    """
+    Makes the solutions of a year importable
+    Each year has its own `_shared` and `day_XX` modules, so the ones from another
+    year are dropped from the module cache before switching
+    :param year: The year of the challenge
+    """
+    year_dir = get_year_dir(year)
+    if sys.path and sys.path[0] == year_dir:
+        return
+    for name, module in list(sys.modules.items()):
+        module_dir = os.path.dirname(getattr(module, "__file__", None) or "")
+        if is_year_dir(module_dir) and module_dir != year_dir:
+            del sys.modules[name]
+    sys.path[:] = [path for path in sys.path if not is_year_dir(path)]
+    sys.path.insert(0, year_dir)
+
+
+def get_days(year: int) -> List[int]:
+    """
+    :param year: The year of the challenge
+    :return: The days that have a solution for the given year, in order
+    """
+    days = []
+    for filename in os.listdir(get_year_dir(year)):
+        name, extension = os.path.splitext(filename)
+        if name.startswith("day_") and extension == ".py":
+            days.append(int(name[4:]))
+    return sorted(days)
+
+
+def load_day(year: int, day: int) -> ModuleType:
+    """
+    Imports the module of a daily solution
+    :param year: The year of the challenge
+    :param day: The day of the challenge
+    :return: The imported module
+    """
+    activate_year(year)
+    filename = os.path.join(get_year_dir(year), f"day_{day:02}.py")
+    if not os.path.isfile(filename):
+        raise ValueError(f"No solution for {year} day {day}")
+    return importlib.import_module(f"day_{day:02}")
+
+
+# --------------------------------------------------------------------------------
+# > Running
+# --------------------------------------------------------------------------------
+def parse_input(module: ModuleType, filename: str, use_cache: bool = False) -> Any:
+    """
+    Streams the input file into the parser of the daily solution
+    The lines can be iterated again, so parsers may keep them and read them lazily
+    :param module: The module of the daily solution
+    :param filename: Name of the input file, or path to any file
+    :param use_cache: Whether to reuse the parsed input from a previous run.
+        Only applies to modules that define a PARSER_VERSION
+    :return: The parsed input
+    """
+    shared = sys.modules["_shared"]
+    if use_cache and hasattr(module, "PARSER_VERSION"):
+        return shared.cached_parse(filename, module.parse, module.PARSER_VERSION)
+    return module.parse(shared.InputLines(filename))
+
+
+def run_day(
+    year: int,
+    day: int,
+    part: Optional[int] = None,
+    filename: Optional[str] = None,
+    use_cache: bool = False,
+    measure_stage: Callable[..., StageReport] = measure,
+) -> DayReport:
+    """
+    Runs a daily solution stage by stage: load, parse, part 1 and part 2
+    :param year: The year of the challenge
+    :param day: The day of the challenge
+    :param part: Only run this part. Runs both parts if not provided
+    :param filename: Input file to use instead of the default one
+    :param use_cache: Whether to reuse the parsed input from a previous run
+    :param measure_stage: Measures the parse and solve stages, such as a profiler
+    :return: The report with the measurements of each stage
+    """
+    report = DayReport(year, day)
+    stage = measure("load", load_day, year, day)
+    report.stages.append(stage)
+    module = stage.result
+    stage.result = None
+    filename = filename or f"day_{day:02}.txt"
+    stage = measure_stage("parse", parse_input, module, filename, use_cache)
+    report.stages.append(stage)
+    parsed = stage.result
+    stage.result = None
+    parts = [1, 2] if part is None else [part]
+    for number in parts:
+        solver = getattr(module, f"solve_part{number}")
+        report.stages.append(measure_stage(f"part {number}", solver, parsed))
+    return report
+
+
+def run_in_parallel(
+    year: int,
+    days: List[int],
+    jobs: int,
+    part: Optional[int] = None,
+    filename: Optional[str] = None,
+    use_cache: bool = False,
+) -> List[DayReport]:
+    """
+    Runs daily solutions across a pool of processes, with one task per day and part
+    Each task loads and parses its own input, so the parts of a day run independently
+    :param year: The year of the challenge
+    :param days: The days to run
+    :param jobs: Maximum number of processes running at the same time
+    :param part: Only run this part. Runs both parts if not provided
+    :param filename: Input file to use instead of the default one
+    :param use_cache: Whether to reuse the parsed inputs from a previous run
+    :return: The report of each task, ordered by day then part
+    """
+    parts = [1, 2] if part is None else [part]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(run_day, year, day, number, filename, use_cache)
+            for day in days
+            for number in parts
+        ]
+        return [future.result() for future in futures]
+
+
+def run_year(
+    year: int, part: Optional[int] = None, use_cache: bool = False, jobs: int = 1
+) -> List[DayReport]:
+    """
+    Runs all the daily solutions of a year
+    With a single job, they run one after the other in this process
+    :param year: The year of the challenge
+    :param part: Only run this part. Runs both parts if not provided
+    :param use_cache: Whether to reuse the parsed inputs from a previous run
+    :param jobs: Maximum number of processes running at the same time
+    :return: The report of each day, or of each task when running in parallel
+    """
+    days = get_days(year)
+    if jobs > 1:
+        return run_in_parallel(year, days, jobs, part, use_cache=use_cache)
+    return [run_day(year, day, part, use_cache=use_cache) for day in days]